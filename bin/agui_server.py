@@ -1,3 +1,4 @@
+import asyncio
 import json
 import time
 import uuid
@@ -31,7 +32,7 @@ except Exception:
     pass
 
 from fastapi import FastAPI, HTTPException, UploadFile, File, Query
-from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
@@ -435,6 +436,11 @@ async def list_mcp_tools(mcpServer: str = Query(default="aws_terraform")):
         return JSONResponse({"tools": [], "error": "MCP Server not available"})
     
     try:
+        if hasattr(mcp_server, "list_tools_json_bytes"):
+            # Tool schemas are static; reuse the server's pre-serialized JSON.
+            body = b'{"tools":' + mcp_server.list_tools_json_bytes() + b',"server":' + json.dumps(mcpServer).encode("utf-8") + b"}"
+            logger.info("Returning pre-serialized MCP tools")
+            return Response(content=body, media_type="application/json")
         tools = mcp_server.list_tools()
         logger.info(f"Returning {len(tools)} MCP tools")
         return JSONResponse({"tools": tools, "server": mcpServer})
@@ -463,7 +469,10 @@ async def execute_mcp_tool(request: MCPToolRequest):
         })
     
     try:
-        result = mcp_server.execute_tool(request.tool_name, request.parameters)
+        # Tool calls block on AWS/terraform I/O (an inventory scan fans out to
+        # dozens of requests); run them off the event loop so other requests
+        # keep being served meanwhile.
+        result = await asyncio.to_thread(mcp_server.execute_tool, request.tool_name, request.parameters)
         logger.info(f"MCP tool execution result: {result.get('success', False)}")
         return JSONResponse(result)
     except Exception as e:
@@ -213,7 +213,7 @@ Return ONLY valid Terraform code, no markdown, no explanations, no code blocks."
                 terraform_code = re.sub(r'\n?```$', '', terraform_code)
             
             # Extract project name from architecture
-            project_name = self._extract_project_name(architecture)
+            project_name = self.extract_project_name(architecture)
             
             return {
                 "success": True,
@@ -292,7 +292,7 @@ Return ONLY valid Terraform code, no markdown, no explanations, no code blocks."
         
         return relationships
     
-    def _extract_project_name(self, architecture: Dict[str, Any]) -> str:
+    def extract_project_name(self, architecture: Dict[str, Any]) -> str:
         """Extract or generate a project name from architecture"""
         # Try to use description
         if "description" in architecture and architecture["description"]:
@@ -91,7 +91,7 @@ def _service_summary_sections(names: set) -> List[str]:
             "- Networking: VPC/subnet infrastructure setup.",
             "  - Ask for details: `Show VPC capabilities`",
         ])
-    if {"terraform_plan", "terraform_apply", "terraform_destroy", "get_infrastructure_state"} & names:
+    if {"terraform_plan", "terraform_apply", "terraform_plan_and_apply", "terraform_destroy", "get_infrastructure_state"} & names:
         sections.extend([
             "- Terraform Lifecycle (Generic): Plan, apply, destroy, and state operations.",
             "  - Ask for details: `Show Terraform capabilities`",
@@ -138,7 +138,7 @@ def _focus_tools(tools: List[Dict[str, Any]], focus: str) -> List[Dict[str, Any]
         "s3": {"create_s3_bucket"},
         "rds": {"create_rds_instance"},
         "vpc": {"create_vpc"},
-        "terraform": {"terraform_plan", "terraform_apply", "terraform_destroy", "get_infrastructure_state"},
+        "terraform": {"terraform_plan", "terraform_apply", "terraform_plan_and_apply", "terraform_destroy", "get_infrastructure_state"},
         "identity": {"get_user_permissions"},
         "workflow": {"start_ecs_deployment_workflow", "update_ecs_deployment_workflow", "review_ecs_deployment_workflow"},
     }
@@ -31,7 +31,7 @@ MUTATING_KEYWORDS = (
     "terminate",
 )
 
-MUTATING_TOOLS = {"terraform_plan", "terraform_apply", "terraform_destroy"}
+MUTATING_TOOLS = {"terraform_plan", "terraform_apply", "terraform_plan_and_apply", "terraform_destroy"}
 
 
 def detect_read_only_intent(message: str, readonly_keywords: Iterable[str] = READONLY_KEYWORDS, mutating_keywords: Iterable[str] = MUTATING_KEYWORDS) -> bool:
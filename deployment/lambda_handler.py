@@ -173,7 +173,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                             "success": False,
                             "error": f"Blocked mutating tool '{tool_name}' because user intent is read-only. Use list_account_inventory, list_aws_resources, describe_resource, or get_cost_explorer_summary."
                         }
-                    elif tool_name == "terraform_apply" and not is_real_deploy:
+                    elif tool_name in ("terraform_apply", "terraform_plan_and_apply") and not is_real_deploy:
                         result = {"success": False, "error": "DRY_RUN_MODE: Actual deployment blocked. Please set DEPLOY_REAL_INFRA=true to proceed."}
                     elif MCP_AVAILABLE and aws_mcp:
                         result = aws_mcp.execute_tool(tool_name, tool_args)
@@ -1,6 +1,17 @@
 """Modular components for AWS Terraform MCP server."""
 
+from .cache import TTLCache
+from .clients import (
+    AWS_CLIENT_CONFIG,
+    create_aws_client,
+    get_aws_client,
+    get_aws_session,
+    paginate_items,
+    reset_aws_session,
+)
 from .rbac import AWSRBACManager
+from .schema import ToolParameterError, compile_schema
+from .state_index import TerraformStateIndex
 from .templates import AWSInfrastructureTemplates
 from .terraform import TerraformManager
 
@@ -8,4 +19,14 @@ __all__ = [
     "AWSRBACManager",
     "TerraformManager",
     "AWSInfrastructureTemplates",
+    "TTLCache",
+    "TerraformStateIndex",
+    "ToolParameterError",
+    "compile_schema",
+    "AWS_CLIENT_CONFIG",
+    "create_aws_client",
+    "get_aws_client",
+    "get_aws_session",
+    "paginate_items",
+    "reset_aws_session",
 ]
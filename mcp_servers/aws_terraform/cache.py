@@ -0,0 +1,110 @@
+"""In-process caching helpers for MCP server state."""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries also expire after a fixed TTL.
+
+    By default reads through ``get`` refresh both the LRU position and the TTL,
+    so entries that are actively used (for example an in-progress ECS workflow)
+    stay alive. With ``touch=False`` the TTL counts from the last write instead,
+    which suits response caches where staleness must stay bounded.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 3600.0,
+        name: str = "cache",
+        clock: Callable[[], float] = time.monotonic,
+        touch: bool = True,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.name = name
+        self.touch = touch
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _log_expired(self, key: Hashable) -> None:
+        idle = " idle" if self.touch else ""
+        logger.info(f"Evicted {self.name} entry '{key}' after {self.ttl:.0f}s{idle}")
+
+    def _expired(self, stamp: float, now: float) -> bool:
+        return self.ttl > 0 and now - stamp > self.ttl
+
+    def _purge_expired(self, now: float) -> None:
+        # Entries are ordered by last access, so expired ones sit at the front.
+        while self._data:
+            key, (stamp, _) = next(iter(self._data.items()))
+            if not self._expired(stamp, now):
+                break
+            del self._data[key]
+            self._log_expired(key)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            now = self._clock()
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if self._expired(entry[0], now):
+                del self._data[key]
+                self._log_expired(key)
+                return default
+            if self.touch:
+                self._data[key] = (now, entry[1])
+                self._data.move_to_end(key)
+            return entry[1]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            now = self._clock()
+            self._purge_expired(now)
+            self._data[key] = (now, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                evicted, _ = self._data.popitem(last=False)
+                logger.info(f"Evicted {self.name} entry '{evicted}' (maxsize={self.maxsize} reached)")
+
+    def __getitem__(self, key: Hashable) -> Any:
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            del self._data[key]
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge_expired(self._clock())
+            return len(self._data)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            self._purge_expired(self._clock())
+            return iter(list(self._data.keys()))
@@ -0,0 +1,82 @@
+"""Shared boto3 session and client construction for MCP server."""
+
+import logging
+import threading
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Adaptive retries add exponential backoff with jitter plus client-side rate
+# limiting. None of the services we call use endpoint discovery, so skip it.
+# The connection pool is sized for the shared read pool's fan-out, and TCP
+# keep-alive lets pooled connections survive between tool calls.
+AWS_CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 8},
+    endpoint_discovery_enabled=False,
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=30,
+)
+
+_session: Optional[boto3.session.Session] = None
+_session_lock = threading.Lock()
+_clients: Dict[Tuple[str, Optional[str]], Any] = {}
+
+
+def get_aws_session() -> boto3.session.Session:
+    """Return the process-wide boto3 session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = boto3.session.Session()
+        return _session
+
+
+def reset_aws_session() -> None:
+    """Drop the shared session so the next client picks up new profile/credentials."""
+    global _session
+    with _session_lock:
+        _session = None
+        _clients.clear()
+
+
+def create_aws_client(service_name: str, region_name: Optional[str] = None) -> Any:
+    """Create a client from the shared session with the standard retry config."""
+    session = get_aws_session()
+    # Session.client() is not thread-safe; the returned clients are.
+    with _session_lock:
+        return session.client(service_name, region_name=region_name, config=AWS_CLIENT_CONFIG)
+
+
+def get_aws_client(service_name: str, region_name: Optional[str] = None) -> Any:
+    """Return a cached client for (service, region), creating it on first use.
+
+    Client construction loads the service model, endpoint rules and signer,
+    which dominates the cost of short read calls. Clients are thread-safe, so
+    one per (service, region) is shared by all callers.
+    """
+    key = (service_name, region_name)
+    client = _clients.get(key)
+    if client is None:
+        client = create_aws_client(service_name, region_name=region_name)
+        with _session_lock:
+            client = _clients.setdefault(key, client)
+    return client
+
+
+def paginate_items(
+    client: Any,
+    operation: str,
+    result_key: str,
+    page_size: Optional[int] = None,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Yield every item under ``result_key`` across all pages of a list/describe call."""
+    pagination_config = {"PageSize": page_size} if page_size else {}
+    paginator = client.get_paginator(operation)
+    for page in paginator.paginate(PaginationConfig=pagination_config, **kwargs):
+        yield from page.get(result_key, [])
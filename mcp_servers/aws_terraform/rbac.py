@@ -2,12 +2,29 @@
 
 import logging
 import os
+import threading
 from typing import Any, Dict, List, Optional
 
-import boto3
+from .cache import TTLCache
+from .clients import get_aws_client, get_aws_session, reset_aws_session
 
 logger = logging.getLogger(__name__)
 
+# Enabled regions change rarely (opt-in regions), so one lookup a day is enough.
+REGIONS_CACHE_TTL_SECONDS = 24 * 3600
+
+# Policy simulation results, reused across tool calls for the same identity.
+PERMISSION_CACHE_MAX_ENTRIES = 512
+PERMISSION_CACHE_TTL_SECONDS = float(os.getenv("AWS_PERMISSION_CACHE_TTL_SECONDS", "300"))
+
+# botocore's refresh windows for temporary credentials. Inside the advisory
+# window get_frozen_credentials fetches new keys, so a background refresh
+# started there really rotates them. Inside the mandatory window (or once
+# expired) the cached keys are no longer safe to hand to terraform.
+CREDENTIALS_ADVISORY_REFRESH_SECONDS = 15 * 60
+CREDENTIALS_MANDATORY_REFRESH_SECONDS = 10 * 60
+
+
 class AWSRBACManager:
     """Manages AWS RBAC using IAM credentials and policies"""
     
@@ -15,6 +32,17 @@ class AWSRBACManager:
         self.sts_client = None
         self.iam_client = None
         self.identity = None
+        self._regions_cache = TTLCache(maxsize=1, ttl=REGIONS_CACHE_TTL_SECONDS, name="regions", touch=False)
+        self._permission_cache = TTLCache(
+            maxsize=PERMISSION_CACHE_MAX_ENTRIES,
+            ttl=PERMISSION_CACHE_TTL_SECONDS,
+            name="permission",
+            touch=False,
+        )
+        self._credentials_env: Optional[Dict[str, str]] = None
+        self._credentials: Any = None
+        self._credentials_refreshing = False
+        self._credentials_lock = threading.Lock()
         
     def initialize(self):
         """Initialize AWS clients and get caller identity"""
@@ -24,9 +52,15 @@ class AWSRBACManager:
             region = os.environ.get('AWS_REGION', os.environ.get('AWS_DEFAULT_REGION', 'not set'))
             logger.info(f"Initializing AWS Session (Profile: {profile}, Region: {region})")
             
-            session = boto3.Session()
-            self.sts_client = session.client('sts')
-            self.iam_client = session.client('iam')
+            # Credentials or profile may have changed since the last login.
+            reset_aws_session()
+            self._regions_cache.clear()
+            self._permission_cache.clear()
+            with self._credentials_lock:
+                self._credentials_env = None
+                self._credentials = None
+            self.sts_client = get_aws_client('sts')
+            self.iam_client = get_aws_client('iam')
             self.identity = self.sts_client.get_caller_identity()
             
             logger.info(f"AWS Identity Successfully Retrieved: {self.identity.get('Arn')}")
@@ -37,26 +71,67 @@ class AWSRBACManager:
             return False
 
     def get_credentials_env(self) -> Dict[str, str]:
-        """Get active AWS credentials as environment variables for subprocesses"""
+        """Get active AWS credentials as environment variables for subprocesses
+
+        The env is built once and reused. Temporary credentials entering
+        botocore's advisory window are refreshed on a background thread, so a
+        terraform launch usually never waits on an STS/SSO round trip. Inside
+        the mandatory window, or once expired, the env is rebuilt before
+        returning.
+        """
+        with self._credentials_lock:
+            cached = self._credentials_env
+            creds = self._credentials
+        if cached is None:
+            return dict(self._refresh_credentials_env())
+        if creds is not None and getattr(creds, "refresh_needed", None):
+            try:
+                if creds.refresh_needed(CREDENTIALS_MANDATORY_REFRESH_SECONDS):
+                    return dict(self._refresh_credentials_env())
+                if creds.refresh_needed(CREDENTIALS_ADVISORY_REFRESH_SECONDS):
+                    self._start_credentials_refresh()
+            except Exception as e:
+                logger.debug(f"Could not check credential expiry: {e}")
+        return dict(cached)
+
+    def _start_credentials_refresh(self) -> None:
+        with self._credentials_lock:
+            if self._credentials_refreshing:
+                return
+            self._credentials_refreshing = True
+        threading.Thread(target=self._background_credentials_refresh, name="aws-creds-refresh", daemon=True).start()
+
+    def _background_credentials_refresh(self) -> None:
+        try:
+            self._refresh_credentials_env()
+        finally:
+            with self._credentials_lock:
+                self._credentials_refreshing = False
+
+    def _refresh_credentials_env(self) -> Dict[str, str]:
         try:
-            session = boto3.Session()
+            session = get_aws_session()
             creds = session.get_credentials()
             if not creds:
-                return {}
-            
-            frozen = creds.get_frozen_credentials()
-            env = {
-                "AWS_ACCESS_KEY_ID": frozen.access_key,
-                "AWS_SECRET_ACCESS_KEY": frozen.secret_key,
-            }
-            if frozen.token:
-                env["AWS_SESSION_TOKEN"] = frozen.token
-                
-            region = session.region_name or os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION")
-            if region:
-                env["AWS_REGION"] = region
-                env["AWS_DEFAULT_REGION"] = region
-                
+                env: Dict[str, str] = {}
+            else:
+                # Fetches new keys once inside botocore's refresh windows.
+                frozen = creds.get_frozen_credentials()
+                env = {
+                    "AWS_ACCESS_KEY_ID": frozen.access_key,
+                    "AWS_SECRET_ACCESS_KEY": frozen.secret_key,
+                }
+                if frozen.token:
+                    env["AWS_SESSION_TOKEN"] = frozen.token
+
+                region = session.region_name or os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION")
+                if region:
+                    env["AWS_REGION"] = region
+                    env["AWS_DEFAULT_REGION"] = region
+            # An empty env is not cached so credentials configured later are picked up.
+            with self._credentials_lock:
+                self._credentials_env = env or None
+                self._credentials = creds
             return env
         except Exception as e:
             logger.warning(f"Could not extract session credentials: {e}")
@@ -90,35 +165,71 @@ class AWSRBACManager:
         Returns:
             bool: True if user has permission
         """
+        return self.check_permissions([action], resource)[action]
+
+    def check_permissions(self, actions: List[str], resource: str = "*") -> Dict[str, bool]:
+        """
+        Check several actions with at most one policy simulation call
+        
+        Args:
+            actions: AWS actions (e.g., ['ecs:CreateCluster', 'ecs:CreateService'])
+            resource: AWS resource ARN
+        
+        Returns:
+            Dict mapping each action to True if the user has permission
+        """
+        # Keyed by principal so a re-login as someone else never reuses answers.
+        principal = (self.identity or {}).get("Arn")
+        decisions: Dict[str, bool] = {}
+        pending: List[str] = []
+        for action in actions:
+            cached = self._permission_cache.get((principal, action, resource))
+            if cached is None:
+                pending.append(action)
+            else:
+                decisions[action] = cached
+        if not pending:
+            return decisions
+
         try:
             # Root user check - SimulatePrincipalPolicy doesn't support the root user ARN
-            if self.identity and self.identity.get("Arn") and ":root" in self.identity["Arn"]:
+            if principal and ":root" in principal:
                 logger.info("Root user detected, skipping permission check (Full Access)")
-                return True
+                decisions.update((action, True) for action in pending)
+                return decisions
 
             # Use IAM policy simulator to check permissions
             response = self.iam_client.simulate_principal_policy(
                 PolicySourceArn=self.identity["Arn"],
-                ActionNames=[action],
+                ActionNames=pending,
                 ResourceArns=[resource]
             )
             
+            allowed = {action: False for action in pending}
             for result in response.get("EvaluationResults", []):
                 if result["EvalDecision"] == "allowed":
-                    return True
-            
-            return False
+                    allowed[result.get("EvalActionName", pending[0])] = True
+            for action in pending:
+                self._permission_cache[(principal, action, resource)] = allowed[action]
+            decisions.update(allowed)
+            return decisions
         except Exception as e:
             logger.warning(f"Permission check failed: {e}")
             # Default to allowing if check fails (most common for restricted accounts or Root)
-            return True
+            decisions.update((action, True) for action in pending)
+            return decisions
     
     def get_allowed_regions(self) -> List[str]:
         """Get list of AWS regions the user can access"""
+        regions = self._regions_cache.get("ec2")
+        if regions is not None:
+            return list(regions)
         try:
-            ec2_client = boto3.client('ec2')
+            ec2_client = get_aws_client('ec2')
             response = ec2_client.describe_regions()
-            return [region['RegionName'] for region in response['Regions']]
+            regions = [region['RegionName'] for region in response['Regions']]
+            self._regions_cache["ec2"] = regions
+            return list(regions)
         except Exception as e:
             logger.error(f"Failed to get regions: {e}")
             return ["us-east-1"]  # Default fallback
@@ -135,7 +246,7 @@ class AWSRBACManager:
             Security group ID if found, None otherwise
         """
         try:
-            ec2_client = boto3.client('ec2', region_name=region)
+            ec2_client = get_aws_client('ec2', region_name=region)
             response = ec2_client.describe_security_groups(
                 Filters=[{'Name': 'group-name', 'Values': [sg_name]}]
             )
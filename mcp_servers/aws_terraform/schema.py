@@ -0,0 +1,156 @@
+"""Compiled validators for MCP tool parameter schemas."""
+
+import re
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+Validator = Callable[[Any, str], Any]
+
+_INTEGER_RE = re.compile(r"^\s*[+-]?\d+\s*$")
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    # bool is a subclass of int; JSON Schema treats them as distinct types.
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+}
+
+
+class ToolParameterError(ValueError):
+    """Raised when tool parameters do not match the published tool schema."""
+
+    def __init__(self, message: str, field_path: str, suggestion: str):
+        super().__init__(message)
+        self.field_path = field_path
+        self.suggestion = suggestion
+
+    def to_response(self) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": str(self),
+            "field_path": self.field_path,
+            "suggestion": self.suggestion,
+        }
+
+
+def compile_schema(
+    schema: Dict[str, Any],
+    skip_enum: Iterable[str] = (),
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Compile a tool ``parameters`` schema into a validator function.
+
+    The schema is walked once up front, so each call only runs the checks that
+    apply. Only ``type``, ``enum``, ``properties`` and ``items`` are enforced:
+    ``required`` is left to the tool handlers, which answer missing fields with
+    follow-up questions, and ``None`` values are treated as "not provided".
+
+    Values are normalised the way the handlers accept them before they are
+    checked: string enums match case-insensitively and are returned in their
+    canonical spelling, and integer fields accept integer strings such as
+    ``"2"``. The validator returns the normalised parameters (the input object
+    itself when nothing changed). Enums on properties named in ``skip_enum``
+    are not enforced, for fields whose handlers give their own guidance.
+    """
+    validator = _compile(schema, frozenset(skip_enum))
+
+    def validate(params: Dict[str, Any]) -> Dict[str, Any]:
+        return validator(params, "")
+
+    return validate
+
+
+def _coerce_integer(value: Any) -> Any:
+    if isinstance(value, str) and _INTEGER_RE.match(value):
+        return int(value)
+    return value
+
+
+def _compile(schema: Dict[str, Any], skip_enum: FrozenSet[str], name: Optional[str] = None) -> Validator:
+    checks: List[Validator] = []
+
+    expected_type = schema.get("type")
+    if expected_type in _TYPE_CHECKS:
+        type_check = _TYPE_CHECKS[expected_type]
+        coerce = _coerce_integer if expected_type == "integer" else None
+
+        def check_type(value: Any, path: str) -> Any:
+            if coerce is not None:
+                value = coerce(value)
+            if not type_check(value):
+                raise ToolParameterError(
+                    f"{path or 'parameters'} must be of type {expected_type}, got {type(value).__name__}",
+                    path,
+                    f"Provide {path or 'parameters'} as a JSON {expected_type}.",
+                )
+            return value
+
+        checks.append(check_type)
+
+    allowed = schema.get("enum")
+    if allowed and name not in skip_enum:
+        allowed_set = frozenset(allowed)
+        canonical = {a.casefold(): a for a in allowed if isinstance(a, str)}
+
+        def check_enum(value: Any, path: str) -> Any:
+            if value in allowed_set:
+                return value
+            if isinstance(value, str) and value.casefold() in canonical:
+                return canonical[value.casefold()]
+            raise ToolParameterError(
+                f"{path} must be one of {list(allowed)}, got {value!r}",
+                path,
+                f"Use one of: {', '.join(str(a) for a in allowed)}.",
+            )
+
+        checks.append(check_enum)
+
+    properties = schema.get("properties")
+    if properties:
+        property_validators = {prop: _compile(sub, skip_enum, prop) for prop, sub in properties.items()}
+
+        def check_properties(value: Any, path: str) -> Any:
+            if not isinstance(value, dict):
+                return value
+            result = value
+            for prop, sub_validator in property_validators.items():
+                sub_value = value.get(prop)
+                if sub_value is None:
+                    continue
+                normalized = sub_validator(sub_value, f"{path}.{prop}" if path else prop)
+                if normalized is not sub_value:
+                    if result is value:
+                        result = dict(value)
+                    result[prop] = normalized
+            return result
+
+        checks.append(check_properties)
+
+    items = schema.get("items")
+    if items:
+        item_validator = _compile(items, skip_enum)
+
+        def check_items(value: Any, path: str) -> Any:
+            if not isinstance(value, list):
+                return value
+            result = value
+            for index, item in enumerate(value):
+                normalized = item_validator(item, f"{path}[{index}]")
+                if normalized is not item:
+                    if result is value:
+                        result = list(value)
+                    result[index] = normalized
+            return result
+
+        checks.append(check_items)
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def run_all(value: Any, path: str) -> Any:
+        for check in checks:
+            value = check(value, path)
+        return value
+
+    return run_all
@@ -0,0 +1,104 @@
+"""Index of resource identifiers found in workspace Terraform state files."""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+try:
+    import orjson
+    _loads_state = orjson.loads
+except ImportError:
+    _loads_state = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Instance attributes that identify a resource (IDs, ARNs and service names).
+INDEXED_ATTRIBUTES = ("id", "arn", "bucket", "name", "function_name", "identifier")
+
+StateKey = Tuple[str, str]
+
+
+class TerraformStateIndex:
+    """Maps (attribute, value) pairs from project state files to their project.
+
+    Each ``terraform.tfstate`` is parsed once and re-parsed only when its mtime
+    or size changes, so a lookup costs one stat per project instead of a full
+    JSON parse of every state file in the workspace.
+    """
+
+    def __init__(self, workspace_dir: Path):
+        self.workspace_dir = Path(workspace_dir)
+        self._projects: Dict[str, Tuple[Tuple[int, int], FrozenSet[StateKey]]] = {}
+        self._owners: Dict[StateKey, str] = {}
+        self._lock = threading.Lock()
+
+    def find(self, keys: Iterable[StateKey]) -> Optional[Tuple[str, StateKey]]:
+        """Return ``(project, key)`` for the first key owned by a project, if any."""
+        with self._lock:
+            self._refresh()
+            for key in keys:
+                project = self._owners.get(key)
+                if project is not None:
+                    return project, key
+        return None
+
+    def _refresh(self) -> None:
+        try:
+            entries = os.scandir(self.workspace_dir)
+        except FileNotFoundError:
+            entries = None
+
+        seen = set()
+        changed = False
+        if entries is not None:
+            with entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    state_file = os.path.join(entry.path, "terraform.tfstate")
+                    try:
+                        stat = os.stat(state_file)
+                    except OSError:
+                        continue
+                    seen.add(entry.name)
+                    stamp = (stat.st_mtime_ns, stat.st_size)
+                    cached = self._projects.get(entry.name)
+                    if cached is not None and cached[0] == stamp:
+                        continue
+                    self._projects[entry.name] = (stamp, self._read_state_keys(state_file))
+                    changed = True
+
+        for name in [name for name in self._projects if name not in seen]:
+            del self._projects[name]
+            changed = True
+
+        if changed:
+            owners: Dict[StateKey, str] = {}
+            for name in sorted(self._projects):
+                for key in self._projects[name][1]:
+                    owners.setdefault(key, name)
+            self._owners = owners
+
+    @staticmethod
+    def _read_state_keys(state_file: str) -> FrozenSet[StateKey]:
+        try:
+            # Parse straight from bytes; orjson, when installed, is several
+            # times faster than the stdlib parser on large state files.
+            with open(state_file, "rb") as f:
+                state_data = _loads_state(f.read())
+        except Exception as e:
+            logger.debug(f"Error reading state file {state_file}: {e}")
+            return frozenset()
+
+        keys = set()
+        for resource in state_data.get("resources", []):
+            for instance in resource.get("instances", []):
+                attributes = instance.get("attributes") or {}
+                for attr in INDEXED_ATTRIBUTES:
+                    value = attributes.get(attr)
+                    if isinstance(value, str) and value:
+                        keys.add((attr, value))
+        return frozenset(keys)
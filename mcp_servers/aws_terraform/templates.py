@@ -1,12 +1,20 @@
 """Terraform template builders for common AWS infra patterns."""
 
+from functools import lru_cache
 from typing import List
 
+# Rendered HCL is a pure function of the template arguments. Agents often
+# retry or re-run the same create (same name, type and region), and those
+# calls reuse the finished string. The bound keeps distinct one-off configs
+# from accumulating for the life of the process.
+TEMPLATE_CACHE_MAX_ENTRIES = 128
+
 
 class AWSInfrastructureTemplates:
     """Pre-built Terraform templates for common AWS infrastructure"""
     
     @staticmethod
+    @lru_cache(maxsize=TEMPLATE_CACHE_MAX_ENTRIES)
     def ec2_instance(instance_type: str = "t2.micro", ami_id: str = None, region: str = "us-east-1", security_group_id: str = None) -> str:
         """Generate Terraform config for EC2 instance
         
@@ -119,6 +127,7 @@ output "public_ip" {{
 """
     
     @staticmethod
+    @lru_cache(maxsize=TEMPLATE_CACHE_MAX_ENTRIES)
     def s3_bucket(bucket_name: str, region: str = "us-east-1", versioning: bool = True) -> str:
         """Generate Terraform config for S3 bucket"""
         versioning_block = ""
@@ -165,6 +174,7 @@ output "bucket_arn" {{
 """
     
     @staticmethod
+    @lru_cache(maxsize=TEMPLATE_CACHE_MAX_ENTRIES)
     def vpc_network(cidr_block: str = "10.0.0.0/16", region: str = "us-east-1") -> str:
         """Generate production-grade VPC config with public/private subnets across multiple AZs"""
         return f"""
@@ -256,6 +266,7 @@ output "private_subnet_ids" {{
 """
 
     @staticmethod
+    @lru_cache(maxsize=TEMPLATE_CACHE_MAX_ENTRIES)
     def rds_instance(db_name: str, instance_class: str = "db.t3.micro", region: str = "us-east-1") -> str:
         """Generate Terraform config for an RDS PostgreSQL instance"""
         return f"""
@@ -290,6 +301,7 @@ resource "aws_db_instance" "default" {{
 """
 
     @staticmethod
+    @lru_cache(maxsize=TEMPLATE_CACHE_MAX_ENTRIES)
     def lambda_function(function_name: str, region: str = "us-east-1") -> str:
         """Generate Terraform config for a Lambda function"""
         return f"""
@@ -1,16 +1,192 @@
 """Terraform execution helpers for MCP server."""
 
+import hashlib
 import json
 import logging
 import os
 import re
+import selectors
 import subprocess
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Union
+
+try:
+    import orjson
+    _loads_json = orjson.loads
+except ImportError:
+    _loads_json = json.loads
 
 logger = logging.getLogger(__name__)
 ANSI_ESCAPE_RE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
 
+# Written after a successful init; holds the digest of the .tf files it saw.
+INIT_MARKER_FILE = ".tfinit-cache"
+
+# Written after a successful plan with the plan's inputs digest and result; a
+# saved plan younger than the TTL whose inputs still hash the same is reused
+# instead of planning again. Apply and destroy remove it.
+PLAN_MARKER_FILE = ".plan-digest"
+PLAN_CACHE_TTL_SECONDS = 300
+
+# Providers are downloaded once into this workspace directory and linked into
+# each project's .terraform directory. Being a dot-directory, it is never listed
+# as a project. An existing TF_PLUGIN_CACHE_DIR takes precedence.
+PLUGIN_CACHE_DIRNAME = ".terraform-plugin-cache"
+
+# Lines of stdout/stderr kept per terraform run; older output is dropped.
+OUTPUT_TAIL_LINES = 10_000
+
+# Terraform walks the graph with 10 concurrent operations by default; provider
+# calls are I/O bound, so about 3x the logical cores finishes wide graphs sooner.
+# The cap keeps large hosts from running into AWS API throttling.
+MAX_DEFAULT_PARALLELISM = 32
+
+
+def _default_parallelism() -> int:
+    """TERRAFORM_PARALLELISM if set to a number, else 3x the logical cores within [16, 32]."""
+    computed = min(MAX_DEFAULT_PARALLELISM, max(16, 3 * (os.cpu_count() or 1)))
+    configured = os.getenv("TERRAFORM_PARALLELISM", "").strip()
+    if not configured:
+        return computed
+    try:
+        return max(1, int(configured))
+    except ValueError:
+        logger.warning(f"Ignoring invalid TERRAFORM_PARALLELISM={configured!r}; using {computed}")
+        return computed
+
+
+DEFAULT_PARALLELISM = _default_parallelism()
+
+
+def summarize_apply_events(stdout: str) -> Dict[str, Any]:
+    """Collect planned changes, change summaries and diagnostics from ``-json`` output."""
+    planned_changes: List[Dict[str, str]] = []
+    summaries: Dict[str, Dict[str, Any]] = {}
+    diagnostics: List[Dict[str, Any]] = []
+    for line in stdout.splitlines():
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(event, dict):
+            continue
+        event_type = event.get("type")
+        if event_type == "planned_change":
+            change = event.get("change") or {}
+            planned_changes.append({
+                "resource": (change.get("resource") or {}).get("addr", ""),
+                "action": change.get("action", ""),
+            })
+        elif event_type == "change_summary":
+            changes = event.get("changes") or {}
+            summaries[changes.get("operation", "apply")] = changes
+        elif event_type == "diagnostic":
+            diagnostic = event.get("diagnostic") or {}
+            diagnostics.append({
+                "severity": diagnostic.get("severity", ""),
+                "summary": diagnostic.get("summary", ""),
+                "detail": diagnostic.get("detail", ""),
+            })
+    return {
+        "planned_changes": planned_changes,
+        "plan_summary": summaries.get("plan"),
+        "apply_summary": summaries.get("apply"),
+        "diagnostics": diagnostics,
+    }
+
+
+def run_captured(
+    cmd: List[str],
+    cwd: Union[str, Path],
+    env: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+    max_lines: Optional[int] = OUTPUT_TAIL_LINES,
+    text: bool = True,
+) -> subprocess.CompletedProcess:
+    """Run a command, draining stdout/stderr as they are produced.
+
+    Both pipes are read through a selector so neither can fill up and stall
+    the child, and only the last ``max_lines`` lines of each are kept, which
+    bounds memory for long applies. With ``text=False`` the output is returned
+    as bytes. Raises ``subprocess.TimeoutExpired`` like ``subprocess.run``.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with subprocess.Popen(cmd, cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+        lines = {proc.stdout.fileno(): deque(maxlen=max_lines), proc.stderr.fileno(): deque(maxlen=max_lines)}
+        pending = {fd: b"" for fd in lines}
+        with selectors.DefaultSelector() as selector:
+            selector.register(proc.stdout, selectors.EVENT_READ)
+            selector.register(proc.stderr, selectors.EVENT_READ)
+            while selector.get_map():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    proc.kill()
+                    proc.wait()
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+                for key, _ in selector.select(remaining):
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        selector.unregister(key.fileobj)
+                        if pending[key.fd]:
+                            lines[key.fd].append(pending[key.fd])
+                        continue
+                    parts = (pending[key.fd] + chunk).split(b"\n")
+                    pending[key.fd] = parts.pop()
+                    lines[key.fd].extend(part + b"\n" for part in parts)
+        returncode = proc.wait()
+
+    stdout, stderr = (b"".join(lines[fd]) for fd in lines)
+    if text:
+        stdout, stderr = stdout.decode("utf-8", errors="replace"), stderr.decode("utf-8", errors="replace")
+    return subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
+
+
+def _config_digest(project_path: Path, extra_files: Iterable[Path] = (), salt: str = "") -> str:
+    """SHA-256 over ``salt`` and the names and contents of a project's .tf files and ``extra_files``."""
+    digest = hashlib.sha256()
+    if salt:
+        digest.update(salt.encode("utf-8") + b"\0")
+    for path in [*sorted(project_path.glob("*.tf")), *extra_files]:
+        digest.update(path.name.encode("utf-8") + b"\0")
+        try:
+            digest.update(path.read_bytes() + b"\0")
+        except FileNotFoundError:
+            digest.update(b"<missing>\0")
+    return digest.hexdigest()
+
+
+def _plugin_cache_env(cache_dir: str) -> Dict[str, str]:
+    """Env vars enabling the shared provider cache, unless the user configured one.
+
+    TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE is left to the user: it
+    makes Terraform record only the cached providers' hashes in the lock
+    file instead of verifying them against the registry. Without it the
+    cache serves projects whose lock file already pins the providers.
+    """
+    if os.environ.get("TF_PLUGIN_CACHE_DIR"):
+        return {}
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Terraform plugin cache disabled, cannot create {cache_dir}: {e}")
+        return {}
+    return {"TF_PLUGIN_CACHE_DIR": cache_dir}
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """Write pre-encoded bytes straight to a file descriptor, without a text layer."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 class TerraformManager:
     """Manages Terraform operations"""
     
@@ -18,25 +194,61 @@ class TerraformManager:
         self.workspace_dir = Path(workspace_dir)
         self.workspace_dir.mkdir(parents=True, exist_ok=True)
         self.rbac = rbac_manager
+        self._project_names: FrozenSet[str] = frozenset()
+        self._project_names_mtime: Optional[int] = None
+        # Resolved by the first init; only init installs providers.
+        self._plugin_cache_overlay: Optional[Dict[str, str]] = None
+        # Terraform does not make the plugin cache safe for concurrent installs.
+        self._init_lock = threading.Lock()
+
+    def project_names(self) -> FrozenSet[str]:
+        """Names of the project directories in the workspace.
+
+        Re-listed only when the workspace directory's mtime changes, which
+        happens whenever a project directory is created, renamed or removed.
+        """
+        try:
+            mtime = self.workspace_dir.stat().st_mtime_ns
+        except OSError:
+            return frozenset()
+        if mtime != self._project_names_mtime:
+            with os.scandir(self.workspace_dir) as entries:
+                self._project_names = frozenset(
+                    e.name for e in entries if e.is_dir() and not e.name.startswith(".")
+                )
+            self._project_names_mtime = mtime
+        return self._project_names
         
-    def _run_terraform(self, cmd: List[str], cwd: Path) -> Dict[str, Any]:
+    def _subprocess_env(self, overlay: Optional[Dict[str, str]] = None) -> Optional[Dict[str, str]]:
+        """Inherited environment overlaid with ``overlay`` and the active session credentials.
+
+        Returns None when there is nothing to inject, so the child inherits
+        the parent environment without a copy.
+        """
+        creds = self.rbac.get_credentials_env() if self.rbac else None
+        if not creds and not overlay:
+            return None
+        env = {**os.environ, **(overlay or {})}
+        if creds:
+            env.update(creds)
+            # Remove AWS_PROFILE to ensure injected credentials are used
+            env.pop("AWS_PROFILE", None)
+        return env
+
+    def _plan_principal(self) -> str:
+        """Account and caller ARN a plan is made for; saved plans are never reused across them."""
+        identity = (self.rbac.identity if self.rbac else None) or {}
+        return f"{identity.get('Account', '')}:{identity.get('Arn', '')}"
+
+    def _run_terraform(self, cmd: List[str], cwd: Path, env_overlay: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Run terraform command with inherited environment and explicit credentials"""
         try:
-            # Inherit current env and overlay with active session credentials
-            env = os.environ.copy()
-            if self.rbac:
-                creds = self.rbac.get_credentials_env()
-                env.update(creds)
-                if "AWS_PROFILE" in env:
-                    # Remove AWS_PROFILE to ensure injected credentials are used
-                    del env["AWS_PROFILE"]
+            env = self._subprocess_env(env_overlay)
             
             logger.info(f"EXECUTION: Real AWS Provisioning - Running command: {' '.join(cmd)} in {cwd}")
-            result = subprocess.run(
+            result = run_captured(
                 cmd,
                 cwd=cwd,
-                capture_output=True,
-                text=True,
                 env=env,
                 timeout=1800
             )
@@ -61,30 +273,103 @@ class TerraformManager:
             logger.error(f"Error running terraform: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    def write_project(self, project_dir: str, files: Dict[str, Union[str, bytes]]) -> str:
+        """Create a project directory and write its files in one pass.
+
+        Works on plain string paths; this runs for every create tool and
+        ``Path`` joins allocate and re-normalise on each step.
+        """
+        project_path = os.path.join(self.workspace_dir, project_dir)
+        os.makedirs(project_path, exist_ok=True)
+        for name, content in files.items():
+            data = content.encode("utf-8") if isinstance(content, str) else content
+            _write_file(os.path.join(project_path, name), data)
+        return project_path
+
+    def init_new_project(self, project_dir: str, files: Dict[str, Union[str, bytes]]) -> Optional[Dict[str, Any]]:
+        """Create a project from ``files`` and initialize it.
+
+        Returns None without touching anything when the project already
+        exists. The directory is claimed with an atomic mkdir, so two callers
+        cannot both claim the same new project.
+        """
+        try:
+            os.mkdir(os.path.join(self.workspace_dir, project_dir))
+        except FileExistsError:
+            return None
+        self.write_project(project_dir, files)
+        return self.init(project_dir)
+
     def init(self, project_dir: str) -> Dict[str, Any]:
-        """Initialize Terraform in a project directory"""
+        """Initialize Terraform in a project directory
+
+        Skipped when the project's .tf files (which pin providers, modules and
+        backend) are unchanged since the last successful init.
+        """
         project_path = self.workspace_dir / project_dir
         project_path.mkdir(parents=True, exist_ok=True)
-        return self._run_terraform(["terraform", "init"], project_path)
+        marker = project_path / INIT_MARKER_FILE
+        digest = _config_digest(project_path)
+        try:
+            if (project_path / ".terraform").is_dir() and marker.read_text() == digest:
+                logger.info(f"Skipping terraform init for {project_dir}: configuration unchanged")
+                return {"success": True, "cached": True}
+        except OSError:
+            pass
+
+        with self._init_lock:
+            if self._plugin_cache_overlay is None:
+                # Absolute: terraform runs with each project directory as its cwd.
+                cache_dir = os.path.abspath(os.path.join(self.workspace_dir, PLUGIN_CACHE_DIRNAME))
+                self._plugin_cache_overlay = _plugin_cache_env(cache_dir)
+            result = self._run_terraform(["terraform", "init"], project_path, env_overlay=self._plugin_cache_overlay)
+        if result.get("success"):
+            marker.write_text(digest)
+        else:
+            marker.unlink(missing_ok=True)
+        return result
     
-    def plan(self, project_dir: str, var_file: Optional[str] = None) -> Dict[str, Any]:
+    def plan(self, project_dir: str, var_file: Optional[str] = None, parallelism: Optional[int] = None) -> Dict[str, Any]:
         """Run terraform plan"""
         project_path = self.workspace_dir / project_dir
-        cmd = ["terraform", "plan", "-out=tfplan", "-input=false"]
+        plan_file = project_path / "tfplan"
+        marker = project_path / PLAN_MARKER_FILE
+        # Local state is part of the input: after an apply the digest changes.
+        digest = _config_digest(project_path, [
+            project_path / ".terraform.lock.hcl",
+            project_path / "terraform.tfstate",
+            *([project_path / var_file] if var_file else []),
+        ], salt=self._plan_principal())
+        try:
+            fresh = time.time() - plan_file.stat().st_mtime < PLAN_CACHE_TTL_SECONDS
+            saved = _loads_json(marker.read_bytes()) if fresh else None
+            if isinstance(saved, dict) and saved.get("digest") == digest:
+                logger.info(f"Reusing saved plan for {project_dir}: inputs unchanged")
+                return {**saved["result"], "cached": True}
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        cmd = ["terraform", "plan", "-out=tfplan", "-input=false", f"-parallelism={parallelism or DEFAULT_PARALLELISM}"]
         if var_file:
             cmd.extend(["-var-file", var_file])
-        return self._run_terraform(cmd, project_path)
+        result = self._run_terraform(cmd, project_path)
+        if result.get("success"):
+            marker.write_text(json.dumps({"digest": digest, "result": result}))
+        else:
+            marker.unlink(missing_ok=True)
+        return result
     
-    def apply(self, project_dir: str, auto_approve: bool = False) -> Dict[str, Any]:
+    def apply(self, project_dir: str, auto_approve: bool = False, parallelism: Optional[int] = None) -> Dict[str, Any]:
         """Run terraform apply"""
         project_path = self.workspace_dir / project_dir
         plan_file = project_path / "tfplan"
+        parallelism_flag = f"-parallelism={parallelism or DEFAULT_PARALLELISM}"
         
         # If we have a saved plan, use it
         if plan_file.exists():
-            cmd = ["terraform", "apply", "-input=false", "tfplan"]
+            cmd = ["terraform", "apply", "-input=false", parallelism_flag, "tfplan"]
         elif auto_approve:
-            cmd = ["terraform", "apply", "-auto-approve", "-input=false"]
+            cmd = ["terraform", "apply", "-auto-approve", "-input=false", parallelism_flag]
         else:
             available = self._projects_with_tfplan()
             if available:
@@ -98,6 +383,11 @@ class TerraformManager:
             return {"success": False, "error": "No tfplan file found. Please run terraform_plan first."}
 
         result = self._run_terraform(cmd, project_path)
+        # Even a failed apply may have changed resources the saved plan read.
+        (project_path / PLAN_MARKER_FILE).unlink(missing_ok=True)
+        if result.get("success") and cmd[-1] == "tfplan":
+            # A saved plan can only be applied once.
+            plan_file.unlink(missing_ok=True)
         if not result.get("success"):
             stderr = result.get("stderr", "") or ""
             if "VPCIdNotSpecified" in stderr:
@@ -113,6 +403,41 @@ class TerraformManager:
                     result["error"] = hint
         return result
     
+    def plan_and_apply(self, project_dir: str, parallelism: Optional[int] = None) -> Dict[str, Any]:
+        """Plan and apply in a single ``terraform apply -auto-approve -json`` run.
+
+        Saves the second process start, state lock and provider load of a
+        separate plan + apply. The machine-readable event stream is summarised
+        into the planned changes and the apply totals.
+        """
+        project_path = self.workspace_dir / project_dir
+        if not project_path.exists():
+            return {
+                "success": False,
+                "error": f"Project directory '{project_dir}' not found. Create the project before applying it."
+            }
+
+        result = self._run_terraform(
+            [
+                "terraform", "apply", "-auto-approve", "-input=false", "-json",
+                f"-parallelism={parallelism or DEFAULT_PARALLELISM}",
+            ],
+            project_path,
+        )
+        (project_path / PLAN_MARKER_FILE).unlink(missing_ok=True)
+        if "stdout" in result:
+            result.update(summarize_apply_events(result["stdout"]))
+            if not result.get("success") and result["diagnostics"]:
+                result["error"] = "\n".join(
+                    d["summary"] for d in result["diagnostics"] if d.get("severity") == "error"
+                ) or result.get("error")
+
+        # A saved plan from an earlier terraform_plan no longer matches the state.
+        plan_file = project_path / "tfplan"
+        if result.get("success") and plan_file.exists():
+            plan_file.unlink()
+        return result
+
     def destroy(self, project_dir: str, auto_approve: bool = True) -> Dict[str, Any]:
         """Run terraform destroy"""
         project_path = self.workspace_dir / project_dir
@@ -126,6 +451,7 @@ class TerraformManager:
             }
         
         # Remove any existing tfplan file to avoid conflicts
+        (project_path / PLAN_MARKER_FILE).unlink(missing_ok=True)
         plan_file = project_path / "tfplan"
         if plan_file.exists():
             try:
@@ -138,21 +464,12 @@ class TerraformManager:
         cmd = ["terraform", "destroy", "-input=false", "-auto-approve"]
         
         try:
-            # Inherit current env and overlay with active session credentials
-            env = os.environ.copy()
-            if self.rbac:
-                creds = self.rbac.get_credentials_env()
-                env.update(creds)
-                if "AWS_PROFILE" in env:
-                    # Remove AWS_PROFILE to ensure injected credentials are used
-                    del env["AWS_PROFILE"]
+            env = self._subprocess_env()
             
             logger.info(f"EXECUTION: Real AWS Destruction - Running command: {' '.join(cmd)} in {project_path}")
-            result = subprocess.run(
+            result = run_captured(
                 cmd,
                 cwd=project_path,
-                capture_output=True,
-                text=True,
                 env=env,
                 timeout=1800
             )
@@ -178,24 +495,26 @@ class TerraformManager:
         project_path = self.workspace_dir / project_dir
         
         try:
-            result = subprocess.run(
+            # The full document is returned to the caller, so keep every line
+            # and parse straight from bytes instead of decoding to str first.
+            result = run_captured(
                 ["terraform", "show", "-json"],
                 cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=60
+                timeout=60,
+                max_lines=None,
+                text=False,
             )
             
             if result.returncode == 0:
                 try:
-                    state = json.loads(result.stdout)
+                    state = _loads_json(result.stdout)
                     return {"success": True, "state": state}
                 except json.JSONDecodeError:
                     return {"success": False, "error": "Failed to parse state JSON"}
             
             return {
                 "success": False,
-                "stderr": result.stderr
+                "stderr": result.stderr.decode("utf-8", errors="replace")
             }
         except subprocess.TimeoutExpired:
             return {"success": False, "error": "Terraform show timed out"}
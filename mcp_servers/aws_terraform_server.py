@@ -5,26 +5,648 @@ This MCP server provides tools for provisioning AWS infrastructure using Terrafo
 It includes RBAC based on AWS IAM credentials and supports various infrastructure operations.
 """
 
+import copy
+import heapq
+import io
 import json
 import logging
 import os
+import re
+import shutil
+import threading
 import uuid
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import zipfile
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-import boto3
 from botocore.exceptions import ClientError
 
+from core.architecture_parser import ArchitectureParser
 from mcp_servers.aws_terraform import (
     AWSInfrastructureTemplates,
     AWSRBACManager,
     TerraformManager,
+    TerraformStateIndex,
+    ToolParameterError,
+    TTLCache,
+    compile_schema,
+    get_aws_client,
+    paginate_items,
 )
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Matches IAM role ARNs (including role paths) and captures the role name.
+ROLE_ARN_RE = re.compile(r"^arn:aws[a-z-]*:iam::\d{12}:role/(?:[^/]+/)*([^/]+)$")
+
+THROTTLING_ERROR_CODES = frozenset({"Throttling", "ThrottlingException", "RequestLimitExceeded"})
+
+# Shared pool for network-bound, read-only AWS calls. It lives for the whole
+# process so inventory scans and ECS preflights do not pay thread start-up.
+AWS_READ_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="aws-read")
+
+# Short-lived cache for read-only AWS tool results; agents often re-ask the
+# same question a few turns apart.
+READ_CACHE_MAX_ENTRIES = 512
+READ_CACHE_TTL_SECONDS = float(os.getenv("AWS_READ_CACHE_TTL_SECONDS", "60"))
+READ_CACHE_INVALIDATING_TOOLS = frozenset(
+    {"terraform_apply", "terraform_plan_and_apply", "terraform_destroy", "deploy_architecture"}
+)
+
+# Enum fields whose handlers explain rejected values themselves (for example
+# the CLI-mode decommission notice), so the schema must not reject them first.
+HANDLER_CHECKED_ENUMS = frozenset({"mode"})
+
+# arn:partition:service:region:account:resource (resource may contain colons).
+ARN_RE = re.compile(r"^arn:[^:]*:([^:]*):([^:]*):([^:]*):(.*)$")
+
+# Resource ID prefix -> (service, resource type).
+RESOURCE_ID_PATTERNS = {
+    'i-': ('ec2', 'instance'),
+    'vpc-': ('ec2', 'vpc'),
+    'sg-': ('ec2', 'security-group'),
+    'subnet-': ('ec2', 'subnet'),
+    'nat-': ('ec2', 'nat-gateway'),
+    'eni-': ('ec2', 'network-interface'),
+    'vol-': ('ec2', 'volume'),
+    'snap-': ('ec2', 'snapshot'),
+    'ami-': ('ec2', 'image'),
+    'rds-': ('rds', 'db-instance'),
+    'lambda-': ('lambda', 'function'),
+}
+RESOURCE_ID_PREFIX_RE = re.compile("^(" + "|".join(re.escape(p) for p in RESOURCE_ID_PATTERNS) + ")")
+
+# Parsed (service, resource type) -> describe_resource type for bare IDs.
+DESCRIBE_TYPE_BY_PARSED_ID = {
+    ('ec2', 'instance'): 'ec2',
+    ('ec2', 'vpc'): 'vpc',
+}
+
+# State attribute holding the resource name for services whose ARNs end in it.
+STATE_NAME_ATTRIBUTES = {
+    's3': 'bucket',
+    'dynamodb': 'name',
+    'lambda': 'function_name',
+    'rds': 'identifier',
+}
+
+# Inputs that look like AWS resource references rather than project names.
+AWS_REFERENCE_PREFIXES = (
+    "i-", "vpc-", "sg-", "subnet-", "arn:aws:", "nat-", "eni-", "vol-", "snap-", "ami-", "rds-",
+)
+
+# Project directory prefixes tried for abbreviated project names.
+PROJECT_NAME_PREFIXES = ("s3_", "ec2_", "vpc_", "rds_", "lambda_", "dynamodb_")
+
+INVENTORY_MAX_REGIONS = 40
+INVENTORY_REGIONAL_TYPES = ("ec2", "vpc", "rds", "lambda", "ecs")
+
+# Static notes attached to every ECS workflow review; shared, never mutated.
+ECS_SAFETY_NOTES = (
+    "This flow assumes existing VPC subnets and security groups.",
+    "Review IAM role ARNs before apply.",
+    "Fargate costs scale with desired_count, CPU, and memory.",
+)
+# IAM actions required by create_ecs_service, checked in this order.
+ECS_CREATE_ACTIONS = ("ecs:CreateCluster", "ecs:RegisterTaskDefinition", "ecs:CreateService")
+
+# Background terraform init for generated architecture projects. The generator
+# targets the AWS provider ~> 5.0, so init can start on just that requirement.
+TERRAFORM_INIT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tf-init")
+ARCHITECTURE_PROVIDERS_TF = """terraform {
+  required_providers {
+    aws = {
+      source  = "hashicorp/aws"
+      version = "~> 5.0"
+    }
+  }
+}
+"""
+
+# ECS preflight results are reused while a workflow is updated and reviewed.
+PREFLIGHT_CACHE_MAX_ENTRIES = 256
+PREFLIGHT_CACHE_TTL_SECONDS = 60.0
+
+WORKFLOW_MAX_ENTRIES = 1024
+WORKFLOW_TTL_SECONDS = float(os.getenv("WORKFLOW_TTL_SECONDS", "3600"))
+
+# Published MCP tool schemas. Built once at import; list_tools() hands out
+# this shared list, so callers must treat it as read-only.
+AWS_TOOLS_SCHEMA: List[Dict[str, Any]] = [
+    {
+        "name": "list_account_inventory",
+        "description": "Read-only. Summarize AWS resources in the account across regions.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "regions": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional list of AWS regions. If omitted, uses allowed regions."
+                }
+            }
+        }
+    },
+    {
+        "name": "get_cost_explorer_summary",
+        "description": "Read-only. Get AWS Cost Explorer totals for a date range, optionally grouped by service.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "start_date": {
+                    "type": "string",
+                    "description": "Inclusive start date in YYYY-MM-DD. Defaults to first day of current month."
+                },
+                "end_date": {
+                    "type": "string",
+                    "description": "Exclusive end date in YYYY-MM-DD. Defaults to tomorrow (UTC)."
+                },
+                "granularity": {
+                    "type": "string",
+                    "enum": ["DAILY", "MONTHLY"],
+                    "description": "Granularity for Cost Explorer results. Defaults to MONTHLY."
+                },
+                "group_by_service": {
+                    "type": "boolean",
+                    "description": "Whether to include service-level cost breakdown. Defaults to true."
+                },
+                "metric": {
+                    "type": "string",
+                    "enum": ["UnblendedCost", "BlendedCost", "AmortizedCost", "NetUnblendedCost", "NetAmortizedCost"],
+                    "description": "Cost metric to query. Defaults to UnblendedCost."
+                },
+                "top_n": {
+                    "type": "integer",
+                    "description": "Optional. Only return the N most expensive services in the breakdown."
+                }
+            }
+        }
+    },
+    {
+        "name": "list_aws_resources",
+        "description": "Read-only. List resources by type in a specific region.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "resource_type": {
+                    "type": "string",
+                    "enum": ["ec2", "vpc", "rds", "lambda", "s3", "ecs"],
+                    "description": "Resource type to list (required)."
+                },
+                "region": {
+                    "type": "string",
+                    "description": "AWS region for regional services. Ignored for S3."
+                },
+                "include_regions": {
+                    "type": "boolean",
+                    "description": "S3 only: look up the region of buckets list_buckets returns without one (one extra call per bucket)."
+                }
+            },
+            "required": ["resource_type"]
+        }
+    },
+    {
+        "name": "describe_resource",
+        "description": "Read-only. Return details for a specific resource.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "resource_type": {
+                    "type": "string",
+                    "enum": ["ec2", "vpc", "rds", "lambda", "s3", "ecs"],
+                    "description": "Resource type (required)."
+                },
+                "resource_id": {
+                    "type": "string",
+                    "description": "Resource identifier (instance id, vpc id, DB identifier, function name, bucket name)."
+                },
+                "region": {
+                    "type": "string",
+                    "description": "AWS region for regional services. Ignored for S3."
+                }
+            },
+            "required": ["resource_type", "resource_id"]
+        }
+    },
+    {
+        "name": "start_ecs_deployment_workflow",
+        "description": "Start a guided ECS Fargate deployment workflow and return missing inputs.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "region": {"type": "string", "description": "AWS region (for example ap-south-1)."},
+                "cluster_name": {"type": "string", "description": "ECS cluster name."},
+                "service_name": {"type": "string", "description": "ECS service name / task family name."},
+                "container_image": {"type": "string", "description": "Container image URI (ECR or public)."},
+                "execution_role_arn": {"type": "string", "description": "ECS task execution role ARN."},
+                "task_role_arn": {"type": "string", "description": "ECS task role ARN."},
+                "subnet_ids": {"type": "array", "items": {"type": "string"}, "description": "Subnets for awsvpc network mode."},
+                "security_group_ids": {"type": "array", "items": {"type": "string"}, "description": "Security groups for the service ENIs."},
+                "desired_count": {"type": "integer", "description": "Desired task count (default 1)."},
+                "container_port": {"type": "integer", "description": "Container port (default 8080)."},
+                "cpu": {"type": "integer", "description": "Task CPU units (default 256)."},
+                "memory": {"type": "integer", "description": "Task memory MB (default 512)."},
+                "assign_public_ip": {"type": "boolean", "description": "Assign public IP in awsvpc mode (default true)."}
+            }
+        }
+    },
+    {
+        "name": "update_ecs_deployment_workflow",
+        "description": "Update an in-progress ECS deployment workflow with new inputs.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "workflow_id": {"type": "string", "description": "Workflow identifier returned by start_ecs_deployment_workflow."},
+                "region": {"type": "string"},
+                "cluster_name": {"type": "string"},
+                "service_name": {"type": "string"},
+                "container_image": {"type": "string"},
+                "execution_role_arn": {"type": "string"},
+                "task_role_arn": {"type": "string"},
+                "subnet_ids": {"type": "array", "items": {"type": "string"}},
+                "security_group_ids": {"type": "array", "items": {"type": "string"}},
+                "desired_count": {"type": "integer"},
+                "container_port": {"type": "integer"},
+                "cpu": {"type": "integer"},
+                "memory": {"type": "integer"},
+                "assign_public_ip": {"type": "boolean"}
+            },
+            "required": ["workflow_id"]
+        }
+    },
+    {
+        "name": "review_ecs_deployment_workflow",
+        "description": "Review the ECS workflow config, show readiness/missing fields, and next action.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "workflow_id": {"type": "string", "description": "Workflow identifier."}
+            },
+            "required": ["workflow_id"]
+        }
+    },
+    {
+        "name": "create_ecs_service",
+        "description": "Create ECS Fargate Terraform project from workflow_id or direct parameters.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "workflow_id": {"type": "string", "description": "Optional workflow identifier to source config from."},
+                "region": {"type": "string"},
+                "cluster_name": {"type": "string"},
+                "service_name": {"type": "string"},
+                "container_image": {"type": "string"},
+                "execution_role_arn": {"type": "string"},
+                "task_role_arn": {"type": "string"},
+                "subnet_ids": {"type": "array", "items": {"type": "string"}},
+                "security_group_ids": {"type": "array", "items": {"type": "string"}},
+                "desired_count": {"type": "integer"},
+                "container_port": {"type": "integer"},
+                "cpu": {"type": "integer"},
+                "memory": {"type": "integer"},
+                "assign_public_ip": {"type": "boolean"}
+            }
+        }
+    },
+    {
+        "name": "create_ec2_instance",
+        "description": "Create an EC2 instance using Terraform",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "instance_type": {
+                    "type": "string", 
+                    "description": "EC2 instance type (default: t2.micro)"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "AWS region (required, for example ap-south-1)"
+                },
+                "ami_id": {
+                    "type": "string",
+                    "description": "AMI ID (optional)"
+                },
+                "mode": {
+                    "type": "string",
+                    "enum": ["terraform"],
+                    "description": "Provisioning method (terraform only; default: terraform)"
+                }
+            },
+            "required": ["region"]
+        }
+    },
+    {
+        "name": "create_s3_bucket",
+        "description": "Create an S3 bucket using Terraform.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "bucket_name": {
+                    "type": "string",
+                    "description": "S3 bucket name (required)"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "AWS region (required, for example ap-south-1)"
+                },
+                "versioning": {
+                    "type": "boolean",
+                    "description": "Enable versioning (default: true)"
+                },
+                "mode": {
+                    "type": "string",
+                    "enum": ["terraform"],
+                    "description": "Provisioning method (terraform only; default: terraform)"
+                }
+            },
+            "required": ["bucket_name", "region"]
+        }
+    },
+    {
+        "name": "create_vpc",
+        "description": "Create a VPC with subnets using Terraform",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "cidr_block": {
+                    "type": "string",
+                    "description": "VPC CIDR block (default: 10.0.0.0/16)"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "AWS region (required, for example ap-south-1)"
+                },
+                "mode": {
+                    "type": "string",
+                    "enum": ["terraform"],
+                    "description": "Provisioning method (terraform only; default: terraform)"
+                }
+            },
+            "required": ["region"]
+        }
+    },
+    {
+        "name": "create_rds_instance",
+        "description": "Create an RDS PostgreSQL instance using Terraform",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "db_name": {
+                    "type": "string",
+                    "description": "Database name (required)"
+                },
+                "instance_class": {
+                    "type": "string",
+                    "description": "RDS instance class (default: db.t3.micro)"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "AWS region (required, for example ap-south-1)"
+                },
+                "mode": {
+                    "type": "string",
+                    "enum": ["terraform"],
+                    "description": "Provisioning method (terraform only; default: terraform)"
+                }
+            },
+            "required": ["db_name", "region"]
+        }
+    },
+    {
+        "name": "create_lambda_function",
+        "description": "Create a Lambda function using Terraform",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "function_name": {
+                    "type": "string",
+                    "description": "Lambda function name (required)"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "AWS region (required, for example ap-south-1)"
+                },
+                "mode": {
+                    "type": "string",
+                    "enum": ["terraform"],
+                    "description": "Provisioning method (terraform only; default: terraform)"
+                }
+            },
+            "required": ["function_name", "region"]
+        }
+    },
+    {
+        "name": "terraform_plan",
+        "description": "Run terraform plan for a project",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "project_name": {
+                    "type": "string",
+                    "description": "Project directory name (required)"
+                }
+            },
+            "required": ["project_name"]
+        }
+    },
+    {
+        "name": "terraform_apply",
+        "description": "Apply Terraform changes (will automatically approve if a plan file exists)",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "project_name": {
+                    "type": "string",
+                    "description": "Project directory name (required)"
+                },
+                "auto_approve": {
+                    "type": "boolean",
+                    "description": "Auto-approve changes (default: true if tfplan exists)"
+                }
+            },
+            "required": ["project_name"]
+        }
+    },
+    {
+        "name": "terraform_plan_and_apply",
+        "description": "Plan and apply Terraform changes in a single run without a separate terraform_plan step",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "project_name": {
+                    "type": "string",
+                    "description": "Project directory name (required)"
+                }
+            },
+            "required": ["project_name"]
+        }
+    },
+    {
+        "name": "terraform_destroy",
+        "description": "Destroy Terraform-managed infrastructure",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "project_name": {
+                    "type": "string",
+                    "description": "Project directory name (required)"
+                },
+                "auto_approve": {
+                    "type": "boolean",
+                    "description": "Auto-approve destruction (default: false)"
+                }
+            },
+            "required": ["project_name"]
+        }
+    },
+    {
+        "name": "get_infrastructure_state",
+        "description": "Get current infrastructure state",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "project_name": {
+                    "type": "string",
+                    "description": "Project directory name (required)"
+                }
+            },
+            "required": ["project_name"]
+        }
+    },
+    {
+        "name": "get_user_permissions",
+        "description": "Get current AWS user permissions and info",
+        "parameters": {
+            "type": "object",
+            "properties": {}
+        }
+    },
+    {
+        "name": "parse_mermaid_architecture",
+        "description": "Parse a Mermaid diagram to extract AWS architecture components and relationships",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "mermaid_content": {
+                    "type": "string",
+                    "description": "Mermaid diagram syntax (e.g., graph LR...)"
+                }
+            },
+            "required": ["mermaid_content"]
+        }
+    },
+    {
+        "name": "generate_terraform_from_architecture",
+        "description": "Generate Terraform code from a parsed architecture",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "architecture": {
+                    "type": "object",
+                    "description": "Parsed architecture dict with resources and relationships"
+                }
+            },
+            "required": ["architecture"]
+        }
+    },
+    {
+        "name": "deploy_architecture",
+        "description": "Generate and deploy AWS infrastructure from architecture (one-shot: generate + plan)",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "architecture": {
+                    "type": "object",
+                    "description": "Parsed architecture dict with resources and relationships"
+                }
+            },
+            "required": ["architecture"]
+        }
+    }
+]
+
+AWS_TOOLS_SCHEMA_JSON = json.dumps(AWS_TOOLS_SCHEMA, separators=(",", ":")).encode("utf-8")
+
+
+def format_timestamp(value: Any) -> str:
+    """Render a boto3 timestamp (datetime) as ISO 8601, or "N/A" when missing."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value) if value else "N/A"
+
+
+def _build_lambda_payload_zip() -> bytes:
+    """Zip the placeholder Lambda handler. A fixed timestamp keeps the bytes (and hash) stable."""
+    payload = io.BytesIO()
+    with zipfile.ZipFile(payload, 'w') as zipf:
+        zipf.writestr(
+            zipfile.ZipInfo('index.py', date_time=(1980, 1, 1, 0, 0, 0)),
+            'def handler(event, context):\n    print("Hello from MCP Lambda!")\n    return {"statusCode": 200, "body": "Success"}',
+        )
+    return payload.getvalue()
+
+
+LAMBDA_PAYLOAD_ZIP = _build_lambda_payload_zip()
+
+
+# Follow-up questions for missing create/workflow fields, keyed by field name.
+COMMON_QUESTIONS = MappingProxyType({
+    "region": "Which AWS region should be used (for example: ap-south-1)?",
+})
+_ECS_QUESTIONS = {
+    "cluster_name": "What is the ECS cluster name?",
+    "service_name": "What service name should we use?",
+    "container_image": "What container image URI should be deployed (ECR/public image)?",
+    "execution_role_arn": "What is the ECS task execution role ARN?",
+    "task_role_arn": "What is the ECS task role ARN?",
+    "subnet_ids": "Which subnet IDs should ECS tasks use? Provide at least one (same VPC).",
+    "security_group_ids": "Which security group IDs should be attached to the service ENIs?",
+}
+_PER_TOOL_QUESTIONS = {
+    "create_s3_bucket": {
+        "bucket_name": "What globally unique S3 bucket name should be created?",
+    },
+    "create_ec2_instance": {
+        "instance_type": "Which EC2 instance type should be used (for example: t3.micro)?",
+    },
+    "create_vpc": {
+        "cidr_block": "What VPC CIDR block should be used (for example: 10.0.0.0/16)?",
+    },
+    "create_rds_instance": {
+        "db_name": "What database identifier/name should be used for the RDS instance?",
+    },
+    "create_lambda_function": {
+        "function_name": "What Lambda function name should be created?",
+    },
+    "start_ecs_deployment_workflow": _ECS_QUESTIONS,
+    "update_ecs_deployment_workflow": _ECS_QUESTIONS,
+    "review_ecs_deployment_workflow": _ECS_QUESTIONS,
+    "create_ecs_service": _ECS_QUESTIONS,
+}
+# (tool, field) -> question, flattened once at import.
+TOOL_QUESTIONS = MappingProxyType({
+    (tool_name, field): question
+    for tool_name, questions in _PER_TOOL_QUESTIONS.items()
+    for field, question in questions.items()
+})
+
+# Parameters each create tool needs before it can generate Terraform.
+REQUIRED_CREATE_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "create_rds_instance": ("db_name", "region"),
+    "create_lambda_function": ("function_name", "region"),
+    "create_ec2_instance": ("region",),
+    "create_s3_bucket": ("bucket_name", "region"),
+    "create_vpc": ("region",),
+}
+
+
 class MCPAWSManagerServer:
     """MCP Server for AWS provisioning via Terraform or CLI"""
     
@@ -32,10 +654,40 @@ class MCPAWSManagerServer:
         self.rbac = AWSRBACManager()
         self.terraform = TerraformManager(rbac_manager=self.rbac)
         self.templates = AWSInfrastructureTemplates()
-        self.ecs_workflows: Dict[str, Dict[str, Any]] = {}
+        self.state_index = TerraformStateIndex(self.terraform.workspace_dir)
+        # Bounded LRU+TTL store so abandoned workflows do not accumulate forever.
+        self.ecs_workflows = TTLCache(
+            maxsize=WORKFLOW_MAX_ENTRIES,
+            ttl=WORKFLOW_TTL_SECONDS,
+            name="ECS workflow",
+        )
+        self.read_cache = TTLCache(
+            maxsize=READ_CACHE_MAX_ENTRIES,
+            ttl=READ_CACHE_TTL_SECONDS,
+            name="AWS read",
+            touch=False,
+        )
+        # Cache misses currently being fetched, so identical concurrent reads share one call.
+        self._inflight_reads: Dict[Tuple[str, str], Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.preflight_cache = TTLCache(
+            maxsize=PREFLIGHT_CACHE_MAX_ENTRIES,
+            ttl=PREFLIGHT_CACHE_TTL_SECONDS,
+            name="ECS preflight",
+            touch=False,
+        )
+        # LLM clients for the architecture tools, created on first use.
+        self._llm_cache: Dict[Tuple[str, float], Any] = {}
+        self._llm_lock = threading.Lock()
+        # Compile each tool's parameter schema once.
+        self._tool_validators: Dict[str, Any] = {
+            tool["name"]: compile_schema(tool["parameters"], skip_enum=HANDLER_CHECKED_ENUMS)
+            for tool in self.list_tools()
+        }
 
-    def _reject_non_terraform_mode(self, mode: str) -> Optional[Dict[str, Any]]:
-        if mode != "terraform":
+    def _reject_non_terraform_mode(self, mode: Optional[str]) -> Optional[Dict[str, Any]]:
+        # Only lower-case when the caller sent something other than the default.
+        if mode and mode != "terraform" and mode.lower() != "terraform":
             return {
                 "success": False,
                 "error": (
@@ -45,7 +697,7 @@ class MCPAWSManagerServer:
             }
         return None
 
-    def _ecs_missing_fields(self, config: Dict[str, Any]) -> List[str]:
+    def _ecs_missing_fields(self, config: Mapping[str, Any]) -> List[str]:
         required = (
             "region",
             "cluster_name",
@@ -74,85 +726,58 @@ class MCPAWSManagerServer:
         lines = config_text.splitlines()
         head = [line.rstrip() for line in lines[:preview_lines]]
         return {
-            "main_tf_path": str(self.terraform.workspace_dir / project_name / "main.tf"),
+            "main_tf_path": os.path.join(self.terraform.workspace_dir, project_name, "main.tf"),
             "line_count": len(lines),
             "char_count": len(config_text),
             "preview_head": head,
             "preview_truncated": len(lines) > preview_lines,
         }
 
-    def _ecs_preflight_help(self, region: str) -> List[str]:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _ecs_preflight_help(region: str) -> Tuple[str, ...]:
         """Return actionable commands for discovering valid ECS networking prerequisites."""
-        return [
+        return (
             f"aws ec2 describe-subnets --region {region} --query 'Subnets[].{{SubnetId:SubnetId,VpcId:VpcId,Az:AvailabilityZone}}' --output table",
             f"aws ec2 describe-security-groups --region {region} --query 'SecurityGroups[].{{GroupId:GroupId,VpcId:VpcId,Name:GroupName}}' --output table",
             "Use subnet_ids and security_group_ids from the same VPC.",
             "Use real IAM role ARNs for execution_role_arn and task_role_arn."
-        ]
+        )
+
+    def _check_required(self, tool_name: str, params: Dict[str, Any]) -> List[str]:
+        return [field for field in REQUIRED_CREATE_FIELDS[tool_name] if not params.get(field)]
 
     def _questions_for_tool(self, tool_name: str, missing_fields: List[str]) -> List[str]:
-        common_prompts = {
-            "region": "Which AWS region should be used (for example: ap-south-1)?",
-        }
-        per_tool_prompts = {
-            "create_s3_bucket": {
-                "bucket_name": "What globally unique S3 bucket name should be created?",
-            },
-            "create_ec2_instance": {
-                "instance_type": "Which EC2 instance type should be used (for example: t3.micro)?",
-            },
-            "create_vpc": {
-                "cidr_block": "What VPC CIDR block should be used (for example: 10.0.0.0/16)?",
-            },
-            "create_rds_instance": {
-                "db_name": "What database identifier/name should be used for the RDS instance?",
-            },
-            "create_lambda_function": {
-                "function_name": "What Lambda function name should be created?",
-            },
-            "start_ecs_deployment_workflow": {
-                "cluster_name": "What is the ECS cluster name?",
-                "service_name": "What service name should we use?",
-                "container_image": "What container image URI should be deployed (ECR/public image)?",
-                "execution_role_arn": "What is the ECS task execution role ARN?",
-                "task_role_arn": "What is the ECS task role ARN?",
-                "subnet_ids": "Which subnet IDs should ECS tasks use? Provide at least one (same VPC).",
-                "security_group_ids": "Which security group IDs should be attached to the service ENIs?",
-            },
-            "update_ecs_deployment_workflow": {
-                "cluster_name": "What is the ECS cluster name?",
-                "service_name": "What service name should we use?",
-                "container_image": "What container image URI should be deployed (ECR/public image)?",
-                "execution_role_arn": "What is the ECS task execution role ARN?",
-                "task_role_arn": "What is the ECS task role ARN?",
-                "subnet_ids": "Which subnet IDs should ECS tasks use? Provide at least one (same VPC).",
-                "security_group_ids": "Which security group IDs should be attached to the service ENIs?",
-            },
-            "review_ecs_deployment_workflow": {
-                "cluster_name": "What is the ECS cluster name?",
-                "service_name": "What service name should we use?",
-                "container_image": "What container image URI should be deployed (ECR/public image)?",
-                "execution_role_arn": "What is the ECS task execution role ARN?",
-                "task_role_arn": "What is the ECS task role ARN?",
-                "subnet_ids": "Which subnet IDs should ECS tasks use? Provide at least one (same VPC).",
-                "security_group_ids": "Which security group IDs should be attached to the service ENIs?",
-            },
-            "create_ecs_service": {
-                "cluster_name": "What is the ECS cluster name?",
-                "service_name": "What service name should we use?",
-                "container_image": "What container image URI should be deployed (ECR/public image)?",
-                "execution_role_arn": "What is the ECS task execution role ARN?",
-                "task_role_arn": "What is the ECS task role ARN?",
-                "subnet_ids": "Which subnet IDs should ECS tasks use? Provide at least one (same VPC).",
-                "security_group_ids": "Which security group IDs should be attached to the service ENIs?",
-            },
-        }
-        prompts = dict(common_prompts)
-        prompts.update(per_tool_prompts.get(tool_name, {}))
-        return [prompts[field] for field in missing_fields if field in prompts]
+        return [
+            question
+            for question in (
+                TOOL_QUESTIONS.get((tool_name, field)) or COMMON_QUESTIONS.get(field) for field in missing_fields
+            )
+            if question
+        ]
 
-    def _validate_ecs_prereqs(self, config: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_ecs_prereqs(self, config: Mapping[str, Any]) -> Dict[str, Any]:
         """Validate ECS workflow prerequisites before terraform plan/apply."""
+        key = (
+            config.get("region") or "us-east-1",
+            tuple(config.get("subnet_ids") or ()),
+            tuple(config.get("security_group_ids") or ()),
+            config.get("execution_role_arn"),
+            config.get("task_role_arn"),
+        )
+        cached = self.preflight_cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        validation = self._validate_ecs_prereqs_uncached(config)
+        # Warnings mean a check could not run (throttling, missing permissions),
+        # so only fully checked results are reused.
+        if not validation["warnings"]:
+            self.preflight_cache[key] = copy.deepcopy(validation)
+        return validation
+
+    def _validate_ecs_prereqs_uncached(self, config: Mapping[str, Any]) -> Dict[str, Any]:
+        """Uncached implementation of _validate_ecs_prereqs."""
         region = config.get("region") or "us-east-1"
         subnet_ids = list(config.get("subnet_ids") or [])
         security_group_ids = list(config.get("security_group_ids") or [])
@@ -168,89 +793,146 @@ class MCPAWSManagerServer:
                 "subnet_ids": subnet_ids,
                 "security_group_ids": security_group_ids,
             },
-            "remediation": self._ecs_preflight_help(region),
+            "remediation": list(self._ecs_preflight_help(region)),
         }
 
-        subnet_vpcs: List[str] = []
-        sg_vpcs: List[str] = []
+        # Nothing to look up yet (workflow still gathering inputs): skip client setup.
+        if not (subnet_ids or security_group_ids or execution_role_arn or task_role_arn):
+            validation["valid"] = False
+            validation["warnings"].append("No inputs to validate yet")
+            return validation
 
-        # Validate subnet IDs and capture VPC mapping.
-        if subnet_ids:
+        def _new_check() -> Dict[str, Any]:
+            # "vpcs" stays None unless the describe call succeeded.
+            return {"errors": [], "warnings": [], "vpcs": None}
+
+        def _check_subnets(ec2) -> Dict[str, Any]:
+            check = _new_check()
             try:
-                ec2 = boto3.client("ec2", region_name=region)
                 subnets = ec2.describe_subnets(SubnetIds=subnet_ids).get("Subnets", [])
-                found_subnet_ids = [s.get("SubnetId") for s in subnets if s.get("SubnetId")]
-                missing_subnet_ids = sorted(set(subnet_ids) - set(found_subnet_ids))
+                found_subnet_ids = frozenset(s.get("SubnetId") for s in subnets)
+                missing_subnet_ids = [s for s in subnet_ids if s not in found_subnet_ids]
                 if missing_subnet_ids:
-                    validation["errors"].append(f"Invalid or missing subnet IDs: {missing_subnet_ids}")
+                    check["errors"].append(f"Invalid or missing subnet IDs: {missing_subnet_ids}")
 
-                subnet_vpcs = sorted({s.get("VpcId") for s in subnets if s.get("VpcId")})
-                if len(subnet_vpcs) > 1:
-                    validation["errors"].append(f"Subnets belong to multiple VPCs: {subnet_vpcs}")
-                validation["details"]["subnet_vpcs"] = subnet_vpcs
+                check["vpcs"] = sorted({s.get("VpcId") for s in subnets if s.get("VpcId")})
+                if len(check["vpcs"]) > 1:
+                    check["errors"].append(f"Subnets belong to multiple VPCs: {check['vpcs']}")
             except ClientError as e:
-                validation["errors"].append(f"Subnet validation failed: {str(e)}")
+                if e.response.get("Error", {}).get("Code", "") in THROTTLING_ERROR_CODES:
+                    check["warnings"].append(f"Subnet validation was throttled by AWS; retry shortly: {str(e)}")
+                else:
+                    check["errors"].append(f"Subnet validation failed: {str(e)}")
             except Exception as e:
-                validation["warnings"].append(f"Could not fully validate subnets: {str(e)}")
+                check["warnings"].append(f"Could not fully validate subnets: {str(e)}")
+            return check
 
-        # Validate security groups and capture VPC mapping.
-        if security_group_ids:
+        def _check_security_groups(ec2) -> Dict[str, Any]:
+            check = _new_check()
             try:
-                ec2 = boto3.client("ec2", region_name=region)
                 sgs = ec2.describe_security_groups(GroupIds=security_group_ids).get("SecurityGroups", [])
-                found_sg_ids = [sg.get("GroupId") for sg in sgs if sg.get("GroupId")]
-                missing_sg_ids = sorted(set(security_group_ids) - set(found_sg_ids))
+                found_sg_ids = frozenset(sg.get("GroupId") for sg in sgs)
+                missing_sg_ids = [sg for sg in security_group_ids if sg not in found_sg_ids]
                 if missing_sg_ids:
-                    validation["errors"].append(f"Invalid or missing security group IDs: {missing_sg_ids}")
+                    check["errors"].append(f"Invalid or missing security group IDs: {missing_sg_ids}")
 
-                sg_vpcs = sorted({sg.get("VpcId") for sg in sgs if sg.get("VpcId")})
-                if len(sg_vpcs) > 1:
-                    validation["errors"].append(f"Security groups belong to multiple VPCs: {sg_vpcs}")
-                validation["details"]["security_group_vpcs"] = sg_vpcs
+                check["vpcs"] = sorted({sg.get("VpcId") for sg in sgs if sg.get("VpcId")})
+                if len(check["vpcs"]) > 1:
+                    check["errors"].append(f"Security groups belong to multiple VPCs: {check['vpcs']}")
             except ClientError as e:
-                validation["errors"].append(f"Security group validation failed: {str(e)}")
+                if e.response.get("Error", {}).get("Code", "") in THROTTLING_ERROR_CODES:
+                    check["warnings"].append(f"Security group validation was throttled by AWS; retry shortly: {str(e)}")
+                else:
+                    check["errors"].append(f"Security group validation failed: {str(e)}")
             except Exception as e:
-                validation["warnings"].append(f"Could not fully validate security groups: {str(e)}")
-
-        # Cross-check subnet and security group VPCs.
-        if len(subnet_vpcs) == 1 and len(sg_vpcs) == 1 and subnet_vpcs[0] != sg_vpcs[0]:
-            validation["errors"].append(
-                f"VPC mismatch: subnets are in {subnet_vpcs[0]} but security groups are in {sg_vpcs[0]}"
-            )
-
-        # Validate role ARNs by resolving role names.
-        iam = None
-        try:
-            iam = boto3.client("iam")
-        except Exception as e:
-            validation["warnings"].append(f"Could not initialize IAM client for role validation: {str(e)}")
+                check["warnings"].append(f"Could not fully validate security groups: {str(e)}")
+            return check
 
-        def _check_role(role_arn: Optional[str], label: str):
+        def _check_role(iam, role_arn: Optional[str], label: str) -> Dict[str, Any]:
+            check = _new_check()
             if not role_arn:
-                return
-            role_name = role_arn.split("role/")[-1].split("/")[-1]
+                return check
+            match = ROLE_ARN_RE.match(role_arn)
+            role_name = match.group(1) if match else None
             if not role_name:
-                validation["errors"].append(f"{label} is not a valid IAM role ARN: {role_arn}")
-                return
+                check["errors"].append(f"{label} is not a valid IAM role ARN: {role_arn}")
+                return check
             if iam is None:
-                return
+                return check
             try:
                 iam.get_role(RoleName=role_name)
             except ClientError as e:
                 code = e.response.get("Error", {}).get("Code", "")
                 if code in {"NoSuchEntity", "NoSuchEntityException"}:
-                    validation["errors"].append(f"{label} does not exist: {role_arn}")
+                    check["errors"].append(f"{label} does not exist: {role_arn}")
                 elif code in {"AccessDenied", "AccessDeniedException"}:
-                    validation["warnings"].append(
+                    check["warnings"].append(
                         f"Access denied validating {label}; ensure role exists and is assumable: {role_arn}"
                     )
+                elif code in THROTTLING_ERROR_CODES:
+                    check["warnings"].append(f"Validation of {label} was throttled by AWS; retry shortly: {role_arn}")
                 else:
-                    validation["warnings"].append(f"Could not validate {label}: {str(e)}")
+                    check["warnings"].append(f"Could not validate {label}: {str(e)}")
             except Exception as e:
-                validation["warnings"].append(f"Could not validate {label}: {str(e)}")
+                check["warnings"].append(f"Could not validate {label}: {str(e)}")
+            return check
+
+        # Clients are created up front from the shared session and then shared
+        # by the workers.
+        ec2 = None
+        if subnet_ids or security_group_ids:
+            try:
+                ec2 = get_aws_client("ec2", region_name=region)
+            except Exception as e:
+                validation["warnings"].append(f"Could not initialize EC2 client for network validation: {str(e)}")
+
+        iam = None
+        try:
+            iam = get_aws_client("iam")
+        except Exception as e:
+            validation["warnings"].append(f"Could not initialize IAM client for role validation: {str(e)}")
 
-        _check_role(execution_role_arn, "execution_role_arn")
-        _check_role(task_role_arn, "task_role_arn")
+        # The AWS lookups are independent, so run them concurrently; latency is
+        # bounded by the slowest call instead of the sum of all of them.
+        subnet_future = AWS_READ_POOL.submit(_check_subnets, ec2) if ec2 and subnet_ids else None
+        sg_future = AWS_READ_POOL.submit(_check_security_groups, ec2) if ec2 and security_group_ids else None
+        role_futures = [
+            AWS_READ_POOL.submit(_check_role, iam, role_arn, label)
+            for role_arn, label in (
+                (execution_role_arn, "execution_role_arn"),
+                (task_role_arn, "task_role_arn"),
+            )
+            if role_arn
+        ]
+
+        # Merge in a fixed order so messages stay deterministic.
+        subnet_vpcs: List[str] = []
+        sg_vpcs: List[str] = []
+        if subnet_future:
+            subnet_check = subnet_future.result()
+            validation["errors"].extend(subnet_check["errors"])
+            validation["warnings"].extend(subnet_check["warnings"])
+            if subnet_check["vpcs"] is not None:
+                subnet_vpcs = subnet_check["vpcs"]
+                validation["details"]["subnet_vpcs"] = subnet_vpcs
+        if sg_future:
+            sg_check = sg_future.result()
+            validation["errors"].extend(sg_check["errors"])
+            validation["warnings"].extend(sg_check["warnings"])
+            if sg_check["vpcs"] is not None:
+                sg_vpcs = sg_check["vpcs"]
+                validation["details"]["security_group_vpcs"] = sg_vpcs
+
+        # Cross-check subnet and security group VPCs.
+        if len(subnet_vpcs) == 1 and len(sg_vpcs) == 1 and subnet_vpcs[0] != sg_vpcs[0]:
+            validation["errors"].append(
+                f"VPC mismatch: subnets are in {subnet_vpcs[0]} but security groups are in {sg_vpcs[0]}"
+            )
+
+        for role_future in role_futures:
+            role_check = role_future.result()
+            validation["errors"].extend(role_check["errors"])
+            validation["warnings"].extend(role_check["warnings"])
 
         validation["valid"] = len(validation["errors"]) == 0
         return validation
@@ -275,918 +957,55 @@ class MCPAWSManagerServer:
     
     def list_tools(self) -> List[Dict[str, Any]]:
         """List available MCP tools"""
-        return [
-            {
-                "name": "list_account_inventory",
-                "description": "Read-only. Summarize AWS resources in the account across regions.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "regions": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Optional list of AWS regions. If omitted, uses allowed regions."
-                        }
-                    }
-                }
-            },
-            {
-                "name": "get_cost_explorer_summary",
-                "description": "Read-only. Get AWS Cost Explorer totals for a date range, optionally grouped by service.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "start_date": {
-                            "type": "string",
-                            "description": "Inclusive start date in YYYY-MM-DD. Defaults to first day of current month."
-                        },
-                        "end_date": {
-                            "type": "string",
-                            "description": "Exclusive end date in YYYY-MM-DD. Defaults to tomorrow (UTC)."
-                        },
-                        "granularity": {
-                            "type": "string",
-                            "enum": ["DAILY", "MONTHLY"],
-                            "description": "Granularity for Cost Explorer results. Defaults to MONTHLY."
-                        },
-                        "group_by_service": {
-                            "type": "boolean",
-                            "description": "Whether to include service-level cost breakdown. Defaults to true."
-                        },
-                        "metric": {
-                            "type": "string",
-                            "enum": ["UnblendedCost", "BlendedCost", "AmortizedCost", "NetUnblendedCost", "NetAmortizedCost"],
-                            "description": "Cost metric to query. Defaults to UnblendedCost."
-                        }
-                    }
-                }
-            },
-            {
-                "name": "list_aws_resources",
-                "description": "Read-only. List resources by type in a specific region.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "resource_type": {
-                            "type": "string",
-                            "enum": ["ec2", "vpc", "rds", "lambda", "s3", "ecs"],
-                            "description": "Resource type to list (required)."
-                        },
-                        "region": {
-                            "type": "string",
-                            "description": "AWS region for regional services. Ignored for S3."
-                        }
-                    },
-                    "required": ["resource_type"]
-                }
-            },
-            {
-                "name": "describe_resource",
-                "description": "Read-only. Return details for a specific resource.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "resource_type": {
-                            "type": "string",
-                            "enum": ["ec2", "vpc", "rds", "lambda", "s3", "ecs"],
-                            "description": "Resource type (required)."
-                        },
-                        "resource_id": {
-                            "type": "string",
-                            "description": "Resource identifier (instance id, vpc id, DB identifier, function name, bucket name)."
-                        },
-                        "region": {
-                            "type": "string",
-                            "description": "AWS region for regional services. Ignored for S3."
-                        }
-                    },
-                    "required": ["resource_type", "resource_id"]
-                }
-            },
-            {
-                "name": "start_ecs_deployment_workflow",
-                "description": "Start a guided ECS Fargate deployment workflow and return missing inputs.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "region": {"type": "string", "description": "AWS region (for example ap-south-1)."},
-                        "cluster_name": {"type": "string", "description": "ECS cluster name."},
-                        "service_name": {"type": "string", "description": "ECS service name / task family name."},
-                        "container_image": {"type": "string", "description": "Container image URI (ECR or public)."},
-                        "execution_role_arn": {"type": "string", "description": "ECS task execution role ARN."},
-                        "task_role_arn": {"type": "string", "description": "ECS task role ARN."},
-                        "subnet_ids": {"type": "array", "items": {"type": "string"}, "description": "Subnets for awsvpc network mode."},
-                        "security_group_ids": {"type": "array", "items": {"type": "string"}, "description": "Security groups for the service ENIs."},
-                        "desired_count": {"type": "integer", "description": "Desired task count (default 1)."},
-                        "container_port": {"type": "integer", "description": "Container port (default 8080)."},
-                        "cpu": {"type": "integer", "description": "Task CPU units (default 256)."},
-                        "memory": {"type": "integer", "description": "Task memory MB (default 512)."},
-                        "assign_public_ip": {"type": "boolean", "description": "Assign public IP in awsvpc mode (default true)."}
-                    }
-                }
-            },
-            {
-                "name": "update_ecs_deployment_workflow",
-                "description": "Update an in-progress ECS deployment workflow with new inputs.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "workflow_id": {"type": "string", "description": "Workflow identifier returned by start_ecs_deployment_workflow."},
-                        "region": {"type": "string"},
-                        "cluster_name": {"type": "string"},
-                        "service_name": {"type": "string"},
-                        "container_image": {"type": "string"},
-                        "execution_role_arn": {"type": "string"},
-                        "task_role_arn": {"type": "string"},
-                        "subnet_ids": {"type": "array", "items": {"type": "string"}},
-                        "security_group_ids": {"type": "array", "items": {"type": "string"}},
-                        "desired_count": {"type": "integer"},
-                        "container_port": {"type": "integer"},
-                        "cpu": {"type": "integer"},
-                        "memory": {"type": "integer"},
-                        "assign_public_ip": {"type": "boolean"}
-                    },
-                    "required": ["workflow_id"]
-                }
-            },
-            {
-                "name": "review_ecs_deployment_workflow",
-                "description": "Review the ECS workflow config, show readiness/missing fields, and next action.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "workflow_id": {"type": "string", "description": "Workflow identifier."}
-                    },
-                    "required": ["workflow_id"]
-                }
-            },
-            {
-                "name": "create_ecs_service",
-                "description": "Create ECS Fargate Terraform project from workflow_id or direct parameters.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "workflow_id": {"type": "string", "description": "Optional workflow identifier to source config from."},
-                        "region": {"type": "string"},
-                        "cluster_name": {"type": "string"},
-                        "service_name": {"type": "string"},
-                        "container_image": {"type": "string"},
-                        "execution_role_arn": {"type": "string"},
-                        "task_role_arn": {"type": "string"},
-                        "subnet_ids": {"type": "array", "items": {"type": "string"}},
-                        "security_group_ids": {"type": "array", "items": {"type": "string"}},
-                        "desired_count": {"type": "integer"},
-                        "container_port": {"type": "integer"},
-                        "cpu": {"type": "integer"},
-                        "memory": {"type": "integer"},
-                        "assign_public_ip": {"type": "boolean"}
-                    }
-                }
-            },
-            {
-                "name": "create_ec2_instance",
-                "description": "Create an EC2 instance using Terraform",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "instance_type": {
-                            "type": "string", 
-                            "description": "EC2 instance type (default: t2.micro)"
-                        },
-                        "region": {
-                            "type": "string",
-                            "description": "AWS region (required, for example ap-south-1)"
-                        },
-                        "ami_id": {
-                            "type": "string",
-                            "description": "AMI ID (optional)"
-                        },
-                        "mode": {
-                            "type": "string",
-                            "enum": ["terraform"],
-                            "description": "Provisioning method (terraform only; default: terraform)"
-                        }
-                    },
-                    "required": ["region"]
-                }
-            },
-            {
-                "name": "create_s3_bucket",
-                "description": "Create an S3 bucket using Terraform.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "bucket_name": {
-                            "type": "string",
-                            "description": "S3 bucket name (required)"
-                        },
-                        "region": {
-                            "type": "string",
-                            "description": "AWS region (required, for example ap-south-1)"
-                        },
-                        "versioning": {
-                            "type": "boolean",
-                            "description": "Enable versioning (default: true)"
-                        },
-                        "mode": {
-                            "type": "string",
-                            "enum": ["terraform"],
-                            "description": "Provisioning method (terraform only; default: terraform)"
-                        }
-                    },
-                    "required": ["bucket_name", "region"]
-                }
-            },
-            {
-                "name": "create_vpc",
-                "description": "Create a VPC with subnets using Terraform",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "cidr_block": {
-                            "type": "string",
-                            "description": "VPC CIDR block (default: 10.0.0.0/16)"
-                        },
-                        "region": {
-                            "type": "string",
-                            "description": "AWS region (required, for example ap-south-1)"
-                        },
-                        "mode": {
-                            "type": "string",
-                            "enum": ["terraform"],
-                            "description": "Provisioning method (terraform only; default: terraform)"
-                        }
-                    },
-                    "required": ["region"]
-                }
-            },
-            {
-                "name": "create_rds_instance",
-                "description": "Create an RDS PostgreSQL instance using Terraform",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "db_name": {
-                            "type": "string",
-                            "description": "Database name (required)"
-                        },
-                        "instance_class": {
-                            "type": "string",
-                            "description": "RDS instance class (default: db.t3.micro)"
-                        },
-                        "region": {
-                            "type": "string",
-                            "description": "AWS region (required, for example ap-south-1)"
-                        },
-                        "mode": {
-                            "type": "string",
-                            "enum": ["terraform"],
-                            "description": "Provisioning method (terraform only; default: terraform)"
-                        }
-                    },
-                    "required": ["db_name", "region"]
-                }
-            },
-            {
-                "name": "create_lambda_function",
-                "description": "Create a Lambda function using Terraform",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "function_name": {
-                            "type": "string",
-                            "description": "Lambda function name (required)"
-                        },
-                        "region": {
-                            "type": "string",
-                            "description": "AWS region (required, for example ap-south-1)"
-                        },
-                        "mode": {
-                            "type": "string",
-                            "enum": ["terraform"],
-                            "description": "Provisioning method (terraform only; default: terraform)"
-                        }
-                    },
-                    "required": ["function_name", "region"]
-                }
-            },
-            {
-                "name": "terraform_plan",
-                "description": "Run terraform plan for a project",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "project_name": {
-                            "type": "string",
-                            "description": "Project directory name (required)"
-                        }
-                    },
-                    "required": ["project_name"]
-                }
-            },
-            {
-                "name": "terraform_apply",
-                "description": "Apply Terraform changes (will automatically approve if a plan file exists)",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "project_name": {
-                            "type": "string",
-                            "description": "Project directory name (required)"
-                        },
-                        "auto_approve": {
-                            "type": "boolean",
-                            "description": "Auto-approve changes (default: true if tfplan exists)"
-                        }
-                    },
-                    "required": ["project_name"]
-                }
-            },
-            {
-                "name": "terraform_destroy",
-                "description": "Destroy Terraform-managed infrastructure",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "project_name": {
-                            "type": "string",
-                            "description": "Project directory name (required)"
-                        },
-                        "auto_approve": {
-                            "type": "boolean",
-                            "description": "Auto-approve destruction (default: false)"
-                        }
-                    },
-                    "required": ["project_name"]
-                }
-            },
-            {
-                "name": "get_infrastructure_state",
-                "description": "Get current infrastructure state",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "project_name": {
-                            "type": "string",
-                            "description": "Project directory name (required)"
-                        }
-                    },
-                    "required": ["project_name"]
-                }
-            },
-            {
-                "name": "get_user_permissions",
-                "description": "Get current AWS user permissions and info",
-                "parameters": {
-                    "type": "object",
-                    "properties": {}
-                }
-            },
-            {
-                "name": "parse_mermaid_architecture",
-                "description": "Parse a Mermaid diagram to extract AWS architecture components and relationships",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "mermaid_content": {
-                            "type": "string",
-                            "description": "Mermaid diagram syntax (e.g., graph LR...)"
-                        }
-                    },
-                    "required": ["mermaid_content"]
-                }
-            },
-            {
-                "name": "generate_terraform_from_architecture",
-                "description": "Generate Terraform code from a parsed architecture",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "architecture": {
-                            "type": "object",
-                            "description": "Parsed architecture dict with resources and relationships"
-                        }
-                    },
-                    "required": ["architecture"]
-                }
-            },
-            {
-                "name": "deploy_architecture",
-                "description": "Generate and deploy AWS infrastructure from architecture (one-shot: generate + plan)",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "architecture": {
-                            "type": "object",
-                            "description": "Parsed architecture dict with resources and relationships"
-                        }
-                    },
-                    "required": ["architecture"]
-                }
-            },
-            {
-                "name": "list_aws_resources",
-                "description": "List AWS resources in the account by type (ec2, s3, rds, lambda, vpc, etc.)",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "resource_type": {
-                            "type": "string",
-                            "description": "AWS resource type to list (ec2_instances, s3_buckets, rds_instances, lambda_functions, vpcs, security_groups, subnets, etc.). If not specified, lists all resource types.",
-                            "enum": ["ec2_instances", "s3_buckets", "rds_instances", "lambda_functions", "vpcs", "security_groups", "subnets", "iam_roles", "iam_policies", "dynamodb_tables", "all"]
-                        },
-                        "region": {
-                            "type": "string",
-                            "description": "AWS region to list resources from (default: current region)"
-                        },
-                        "filters": {
-                            "type": "object",
-                            "description": "Optional filters (e.g., {Name: value, Status: active})"
-                        }
-                    }
-                }
-            },
-            {
-                "name": "describe_resource",
-                "description": "Get detailed information about a specific AWS resource",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "resource_id": {
-                            "type": "string",
-                            "description": "AWS resource ID, ARN, or name (required)"
-                        },
-                        "region": {
-                            "type": "string",
-                            "description": "AWS region (optional, will try to infer from ARN)"
-                        }
-                    },
-                    "required": ["resource_id"]
-                }
-            },
-            {
-                "name": "list_account_inventory",
-                "description": "Get a summary inventory of all AWS resources in the account across all regions",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "regions": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of regions to scan (default: all available regions)"
-                        },
-                        "include_details": {
-                            "type": "boolean",
-                            "description": "Include detailed information for each resource (default: false)"
-                        }
-                    }
-                }
-            }
-        ]
+        return AWS_TOOLS_SCHEMA
     
-    def _list_aws_resources(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """List AWS resources by type"""
-        resource_type = params.get("resource_type", "all")
-        region = params.get("region")
-        filters = params.get("filters", {})
-        
-        try:
-            session = boto3.Session()
-            
-            # Get region(s) to scan
-            if region:
-                regions_to_scan = [region]
-            else:
-                # Use current region or us-east-1
-                regions_to_scan = [session.region_name or "us-east-1"]
-            
-            resources = {}
-            
-            # EC2 Instances
-            if resource_type in ["ec2_instances", "all"]:
-                instances_by_region = {}
-                for reg in regions_to_scan:
-                    try:
-                        ec2_client = session.client("ec2", region_name=reg)
-                        response = ec2_client.describe_instances()
-                        instances = []
-                        for reservation in response.get("Reservations", []):
-                            for instance in reservation.get("Instances", []):
-                                instances.append({
-                                    "InstanceId": instance["InstanceId"],
-                                    "InstanceType": instance["InstanceType"],
-                                    "State": instance["State"]["Name"],
-                                    "LaunchTime": instance["LaunchTime"].isoformat() if isinstance(instance["LaunchTime"], object) else str(instance["LaunchTime"]),
-                                    "PublicIpAddress": instance.get("PublicIpAddress", "N/A"),
-                                    "PrivateIpAddress": instance.get("PrivateIpAddress", "N/A"),
-                                    "Tags": {tag["Key"]: tag["Value"] for tag in instance.get("Tags", [])}
-                                })
-                        if instances:
-                            instances_by_region[reg] = instances
-                    except Exception as e:
-                        logger.warning(f"Failed to list EC2 instances in {reg}: {e}")
-                if instances_by_region:
-                    resources["ec2_instances"] = instances_by_region
-            
-            # S3 Buckets
-            if resource_type in ["s3_buckets", "all"]:
-                try:
-                    s3_client = session.client("s3")
-                    response = s3_client.list_buckets()
-                    buckets = []
-                    for bucket in response.get("Buckets", []):
-                        buckets.append({
-                            "BucketName": bucket["Name"],
-                            "CreationDate": bucket["CreationDate"].isoformat() if isinstance(bucket["CreationDate"], object) else str(bucket["CreationDate"])
-                        })
-                    if buckets:
-                        resources["s3_buckets"] = buckets
-                except Exception as e:
-                    logger.warning(f"Failed to list S3 buckets: {e}")
-            
-            # RDS Instances
-            if resource_type in ["rds_instances", "all"]:
-                rds_by_region = {}
-                for reg in regions_to_scan:
-                    try:
-                        rds_client = session.client("rds", region_name=reg)
-                        response = rds_client.describe_db_instances()
-                        instances = []
-                        for db in response.get("DBInstances", []):
-                            instances.append({
-                                "DBInstanceIdentifier": db["DBInstanceIdentifier"],
-                                "DBInstanceClass": db["DBInstanceClass"],
-                                "Engine": db["Engine"],
-                                "DBInstanceStatus": db["DBInstanceStatus"],
-                                "AllocatedStorage": db.get("AllocatedStorage", "N/A"),
-                                "Endpoint": db.get("Endpoint", {}).get("Address", "N/A")
-                            })
-                        if instances:
-                            rds_by_region[reg] = instances
-                    except Exception as e:
-                        logger.warning(f"Failed to list RDS instances in {reg}: {e}")
-                if rds_by_region:
-                    resources["rds_instances"] = rds_by_region
-            
-            # Lambda Functions
-            if resource_type in ["lambda_functions", "all"]:
-                lambda_by_region = {}
-                for reg in regions_to_scan:
-                    try:
-                        lambda_client = session.client("lambda", region_name=reg)
-                        response = lambda_client.list_functions()
-                        functions = []
-                        for func in response.get("Functions", []):
-                            functions.append({
-                                "FunctionName": func["FunctionName"],
-                                "Runtime": func.get("Runtime", "N/A"),
-                                "Handler": func.get("Handler", "N/A"),
-                                "CodeSize": func.get("CodeSize", 0),
-                                "LastModified": func.get("LastModified", "N/A")
-                            })
-                        if functions:
-                            lambda_by_region[reg] = functions
-                    except Exception as e:
-                        logger.warning(f"Failed to list Lambda functions in {reg}: {e}")
-                if lambda_by_region:
-                    resources["lambda_functions"] = lambda_by_region
-            
-            # VPCs
-            if resource_type in ["vpcs", "all"]:
-                vpcs_by_region = {}
-                for reg in regions_to_scan:
-                    try:
-                        ec2_client = session.client("ec2", region_name=reg)
-                        response = ec2_client.describe_vpcs()
-                        vpcs = []
-                        for vpc in response.get("Vpcs", []):
-                            vpcs.append({
-                                "VpcId": vpc["VpcId"],
-                                "CidrBlock": vpc["CidrBlock"],
-                                "State": vpc["State"],
-                                "IsDefault": vpc.get("IsDefault", False),
-                                "Tags": {tag["Key"]: tag["Value"] for tag in vpc.get("Tags", [])}
-                            })
-                        if vpcs:
-                            vpcs_by_region[reg] = vpcs
-                    except Exception as e:
-                        logger.warning(f"Failed to list VPCs in {reg}: {e}")
-                if vpcs_by_region:
-                    resources["vpcs"] = vpcs_by_region
-            
-            # Security Groups
-            if resource_type in ["security_groups", "all"]:
-                sg_by_region = {}
-                for reg in regions_to_scan:
-                    try:
-                        ec2_client = session.client("ec2", region_name=reg)
-                        response = ec2_client.describe_security_groups()
-                        sgs = []
-                        for sg in response.get("SecurityGroups", []):
-                            sgs.append({
-                                "GroupId": sg["GroupId"],
-                                "GroupName": sg["GroupName"],
-                                "Description": sg.get("Description", ""),
-                                "VpcId": sg.get("VpcId", "N/A"),
-                                "IngressRules": len(sg.get("IpPermissions", [])),
-                                "EgressRules": len(sg.get("IpPermissionsEgress", []))
-                            })
-                        if sgs:
-                            sg_by_region[reg] = sgs
-                    except Exception as e:
-                        logger.warning(f"Failed to list Security Groups in {reg}: {e}")
-                if sg_by_region:
-                    resources["security_groups"] = sg_by_region
-            
-            # Subnets
-            if resource_type in ["subnets", "all"]:
-                subnet_by_region = {}
-                for reg in regions_to_scan:
-                    try:
-                        ec2_client = session.client("ec2", region_name=reg)
-                        response = ec2_client.describe_subnets()
-                        subnets = []
-                        for subnet in response.get("Subnets", []):
-                            subnets.append({
-                                "SubnetId": subnet["SubnetId"],
-                                "VpcId": subnet["VpcId"],
-                                "CidrBlock": subnet["CidrBlock"],
-                                "AvailabilityZone": subnet["AvailabilityZone"],
-                                "AvailableIpAddressCount": subnet.get("AvailableIpAddressCount", 0)
-                            })
-                        if subnets:
-                            subnet_by_region[reg] = subnets
-                    except Exception as e:
-                        logger.warning(f"Failed to list Subnets in {reg}: {e}")
-                if subnet_by_region:
-                    resources["subnets"] = subnet_by_region
-            
-            # IAM Roles
-            if resource_type in ["iam_roles", "all"]:
-                try:
-                    iam_client = session.client("iam")
-                    response = iam_client.list_roles()
-                    roles = []
-                    for role in response.get("Roles", []):
-                        roles.append({
-                            "RoleName": role["RoleName"],
-                            "RoleId": role["RoleId"],
-                            "Arn": role["Arn"],
-                            "CreateDate": role["CreateDate"].isoformat() if isinstance(role["CreateDate"], object) else str(role["CreateDate"])
-                        })
-                    if roles:
-                        resources["iam_roles"] = roles
-                except Exception as e:
-                    logger.warning(f"Failed to list IAM roles: {e}")
-            
-            # DynamoDB Tables
-            if resource_type in ["dynamodb_tables", "all"]:
-                dynamodb_by_region = {}
-                for reg in regions_to_scan:
-                    try:
-                        dynamodb_client = session.client("dynamodb", region_name=reg)
-                        response = dynamodb_client.list_tables()
-                        tables = []
-                        for table_name in response.get("TableNames", []):
-                            tables.append({
-                                "TableName": table_name
-                            })
-                        if tables:
-                            dynamodb_by_region[reg] = tables
-                    except Exception as e:
-                        logger.warning(f"Failed to list DynamoDB tables in {reg}: {e}")
-                if dynamodb_by_region:
-                    resources["dynamodb_tables"] = dynamodb_by_region
-            
-            return {
-                "success": True,
-                "region": region or session.region_name or "us-east-1",
-                "resources": resources,
-                "resource_count": sum(
-                    len(v) if isinstance(v, list) else sum(len(vv) for vv in v.values() if isinstance(vv, list))
-                    for v in resources.values()
-                )
-            }
-        
-        except Exception as e:
-            logger.error(f"Error listing AWS resources: {e}")
-            return {
-                "success": False,
-                "error": f"Failed to list resources: {str(e)}"
-            }
+    def list_tools_json_bytes(self) -> bytes:
+        """Return the tool list pre-serialized as compact JSON for transports that can send raw bytes."""
+        return AWS_TOOLS_SCHEMA_JSON
     
-    def _describe_resource(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Get detailed information about a specific AWS resource"""
-        resource_id = params.get("resource_id")
-        region = params.get("region")
-        
-        if not resource_id:
-            return {"success": False, "error": "resource_id is required"}
-        
-        try:
-            parsed = self._parse_resource_identifier(resource_id)
-            
-            session = boto3.Session()
-            if not region:
-                region = parsed.get("region") if parsed else (session.region_name or "us-east-1")
-            
-            # Determine resource type and fetch details
-            if resource_id.startswith("i-"):
-                # EC2 Instance
-                ec2_client = session.client("ec2", region_name=region)
-                response = ec2_client.describe_instances(InstanceIds=[resource_id])
-                if response["Reservations"]:
-                    instance = response["Reservations"][0]["Instances"][0]
-                    return {
-                        "success": True,
-                        "resource_type": "EC2 Instance",
-                        "resource_id": resource_id,
-                        "details": {
-                            "InstanceId": instance["InstanceId"],
-                            "InstanceType": instance["InstanceType"],
-                            "State": instance["State"]["Name"],
-                            "LaunchTime": str(instance.get("LaunchTime")),
-                            "PublicIpAddress": instance.get("PublicIpAddress", "N/A"),
-                            "PrivateIpAddress": instance.get("PrivateIpAddress", "N/A"),
-                            "SubnetId": instance.get("SubnetId"),
-                            "VpcId": instance.get("VpcId"),
-                            "SecurityGroups": [sg["GroupId"] for sg in instance.get("SecurityGroups", [])],
-                            "Tags": {tag["Key"]: tag["Value"] for tag in instance.get("Tags", [])}
-                        }
-                    }
-            
-            elif resource_id.startswith("vpc-"):
-                # VPC
-                ec2_client = session.client("ec2", region_name=region)
-                response = ec2_client.describe_vpcs(VpcIds=[resource_id])
-                if response["Vpcs"]:
-                    vpc = response["Vpcs"][0]
-                    return {
-                        "success": True,
-                        "resource_type": "VPC",
-                        "resource_id": resource_id,
-                        "details": {
-                            "VpcId": vpc["VpcId"],
-                            "CidrBlock": vpc["CidrBlock"],
-                            "State": vpc["State"],
-                            "IsDefault": vpc.get("IsDefault", False),
-                            "Tags": {tag["Key"]: tag["Value"] for tag in vpc.get("Tags", [])}
-                        }
-                    }
-            
-            elif resource_id.startswith("sg-"):
-                # Security Group
-                ec2_client = session.client("ec2", region_name=region)
-                response = ec2_client.describe_security_groups(GroupIds=[resource_id])
-                if response["SecurityGroups"]:
-                    sg = response["SecurityGroups"][0]
-                    return {
-                        "success": True,
-                        "resource_type": "Security Group",
-                        "resource_id": resource_id,
-                        "details": {
-                            "GroupId": sg["GroupId"],
-                            "GroupName": sg["GroupName"],
-                            "Description": sg.get("Description", ""),
-                            "VpcId": sg.get("VpcId", "N/A"),
-                            "IngressRules": sg.get("IpPermissions", []),
-                            "EgressRules": sg.get("IpPermissionsEgress", [])
-                        }
-                    }
-            
-            # Try S3 bucket
-            elif not any(resource_id.startswith(prefix) for prefix in ["i-", "vpc-", "sg-", "subnet-", "ami-"]):
-                try:
-                    s3_client = session.client("s3")
-                    s3_client.head_bucket(Bucket=resource_id)
-                    response = s3_client.get_bucket_location(Bucket=resource_id)
-                    return {
-                        "success": True,
-                        "resource_type": "S3 Bucket",
-                        "resource_id": resource_id,
-                        "details": {
-                            "BucketName": resource_id,
-                            "Region": response.get("LocationConstraint", "us-east-1")
-                        }
-                    }
-                except:
-                    pass
-            
-            return {
-                "success": False,
-                "error": f"Could not describe resource '{resource_id}'. Resource not found or type not supported."
-            }
-        
-        except Exception as e:
-            logger.error(f"Error describing resource: {e}")
-            return {
-                "success": False,
-                "error": f"Failed to describe resource: {str(e)}"
-            }
-    
-    def _list_account_inventory(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Get a summary inventory of all AWS resources"""
-        regions_param = params.get("regions")
-        include_details = params.get("include_details", False)
-        
+    def _cached_read(self, operation: str, params: Dict[str, Any], fetch) -> Dict[str, Any]:
+        """Return a cached result for a read-only call, fetching and caching successes on a miss.
+
+        Cached results and results shared with concurrent callers are kept as
+        private snapshots; every caller gets its own copy to modify.
+        """
+        key = (operation, json.dumps(params or {}, sort_keys=True, default=str))
+        cached = self.read_cache.get(key)
+        if cached is not None:
+            logger.debug(f"AWS read cache hit: {operation}")
+            return copy.deepcopy(cached)
+
+        with self._inflight_lock:
+            cached = self.read_cache.get(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+            future = self._inflight_reads.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight_reads[key] = Future()
+        if not leader:
+            logger.debug(f"Joining in-flight AWS read: {operation}")
+            return copy.deepcopy(future.result())
+
         try:
-            session = boto3.Session()
-            
-            # Get regions to scan
-            if regions_param:
-                regions_to_scan = regions_param
-            else:
-                try:
-                    ec2_client = session.client("ec2")
-                    response = ec2_client.describe_regions()
-                    regions_to_scan = [region["RegionName"] for region in response["Regions"]]
-                except:
-                    regions_to_scan = [session.region_name or "us-east-1"]
-            
-            inventory = {
-                "summary": {},
-                "by_region": {},
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            # Scan each region
-            for region in regions_to_scan:
-                region_resources = {}
-                
-                try:
-                    ec2_client = session.client("ec2", region_name=region)
-                    
-                    # Count EC2 instances
-                    response = ec2_client.describe_instances()
-                    instance_count = sum(len(res["Instances"]) for res in response["Reservations"])
-                    region_resources["ec2_instances"] = instance_count
-                    
-                    # Count VPCs
-                    response = ec2_client.describe_vpcs()
-                    region_resources["vpcs"] = len(response["Vpcs"])
-                    
-                    # Count Security Groups
-                    response = ec2_client.describe_security_groups()
-                    region_resources["security_groups"] = len(response["SecurityGroups"])
-                    
-                    # Count Subnets
-                    response = ec2_client.describe_subnets()
-                    region_resources["subnets"] = len(response["Subnets"])
-                    
-                    # RDS Instances
-                    try:
-                        rds_client = session.client("rds", region_name=region)
-                        response = rds_client.describe_db_instances()
-                        region_resources["rds_instances"] = len(response["DBInstances"])
-                    except:
-                        region_resources["rds_instances"] = 0
-                    
-                    # Lambda Functions
-                    try:
-                        lambda_client = session.client("lambda", region_name=region)
-                        response = lambda_client.list_functions()
-                        region_resources["lambda_functions"] = len(response["Functions"])
-                    except:
-                        region_resources["lambda_functions"] = 0
-                    
-                    # DynamoDB Tables
-                    try:
-                        dynamodb_client = session.client("dynamodb", region_name=region)
-                        response = dynamodb_client.list_tables()
-                        region_resources["dynamodb_tables"] = len(response["TableNames"])
-                    except:
-                        region_resources["dynamodb_tables"] = 0
-                    
-                except Exception as e:
-                    logger.warning(f"Error scanning region {region}: {e}")
-                    region_resources["error"] = str(e)
-                
-                if region_resources:
-                    inventory["by_region"][region] = region_resources
-            
-            # Calculate global summary
-            summary = {}
-            for region_data in inventory["by_region"].values():
-                for resource_type, count in region_data.items():
-                    if resource_type != "error" and isinstance(count, int):
-                        summary[resource_type] = summary.get(resource_type, 0) + count
-            
-            inventory["summary"] = summary
-            inventory["total_resources"] = sum(summary.values())
-            inventory["regions_scanned"] = len([r for r in inventory["by_region"] if "error" not in inventory["by_region"][r]])
-            
-            return {
-                "success": True,
-                "inventory": inventory
-            }
-        
-        except Exception as e:
-            logger.error(f"Error generating account inventory: {e}")
-            return {
-                "success": False,
-                "error": f"Failed to generate inventory: {str(e)}"
-            }
-    
+            result = fetch(params)
+            snapshot = copy.deepcopy(result)
+            if result.get("success"):
+                self.read_cache[key] = snapshot
+            future.set_result(snapshot)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight_reads[key]
+
+    def invalidate_read_cache(self) -> None:
+        """Drop cached read-only results, e.g. after infrastructure changes."""
+        self.read_cache.clear()
+        self.preflight_cache.clear()
+
     def _parse_resource_identifier(self, resource_id: str) -> Optional[Dict[str, str]]:
         """
         Parse resource identifier to extract resource type and ID.
@@ -1199,20 +1018,27 @@ class MCPAWSManagerServer:
             Dict with keys: resource_type, resource_id, region (if available)
             None if unable to parse
         """
+        parsed = self._parse_resource_identifier_cached(resource_id)
+        # Hand out a copy so callers cannot mutate the cached entry.
+        return dict(parsed) if parsed is not None else None
+
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _parse_resource_identifier_cached(resource_id: str) -> Optional[Dict[str, str]]:
+        """Memoized parser behind _parse_resource_identifier; the same IDs recur across tool calls."""
         if not resource_id:
             return None
         
         # Handle ARN format
         if resource_id.startswith('arn:'):
             try:
-                parts = resource_id.split(':')
-                if len(parts) < 6:
+                match = ARN_RE.match(resource_id)
+                if not match:
                     return None
                 
-                service = parts[2]  # ec2, s3, rds, dynamodb, lambda, etc.
-                region = parts[3]
-                account = parts[4]
-                resource_part = ':'.join(parts[5:])  # Handle resources with colons
+                # service: ec2, s3, rds, dynamodb, lambda, etc.
+                # resource_part keeps any colons inside the resource segment.
+                service, region, account, resource_part = match.groups()
                 
                 # Parse resource_part to extract resource type and ID
                 # Examples:
@@ -1238,32 +1064,17 @@ class MCPAWSManagerServer:
                 logger.warning(f"Failed to parse ARN: {resource_id}: {e}")
                 return None
         
-        # Handle resource ID patterns
-        resource_patterns = {
-            'i-': ('ec2', 'instance'),
-            'vpc-': ('ec2', 'vpc'),
-            'sg-': ('ec2', 'security-group'),
-            'subnet-': ('ec2', 'subnet'),
-            'nat-': ('ec2', 'nat-gateway'),
-            'eni-': ('ec2', 'network-interface'),
-            'vol-': ('ec2', 'volume'),
-            'snap-': ('ec2', 'snapshot'),
-            'ami-': ('ec2', 'image'),
-            'rds-': ('rds', 'db-instance'),
-            'arn:aws:rds:': ('rds', 'db-instance'),
-            'lambda-': ('lambda', 'function'),
-        }
-        
         # Check if it's a known pattern
-        for prefix, (service, resource_type) in resource_patterns.items():
-            if resource_id.startswith(prefix):
-                return {
-                    'service': service,
-                    'resource_type': resource_type,
-                    'resource_id': resource_id,
-                    'region': None,
-                    'account': None
-                }
+        match = RESOURCE_ID_PREFIX_RE.match(resource_id)
+        if match:
+            service, resource_type = RESOURCE_ID_PATTERNS[match.group(1)]
+            return {
+                'service': service,
+                'resource_type': resource_type,
+                'resource_id': resource_id,
+                'region': None,
+                'account': None
+            }
         
         # If it doesn't match known patterns, it might be:
         # - S3 bucket name
@@ -1306,79 +1117,22 @@ class MCPAWSManagerServer:
         if not workspace_dir.exists():
             logger.warning(f"Workspace directory does not exist: {workspace_dir}")
             return None
-        
-        for project_dir in workspace_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-            
-            state_file = project_dir / "terraform.tfstate"
-            if not state_file.exists():
-                continue
-            
-            try:
-                with open(state_file, 'r') as f:
-                    state_data = json.load(f)
-                
-                # Check if this state file contains the resource
-                resources = state_data.get('resources', [])
-                for resource in resources:
-                    resource_type = resource.get('type')
-                    
-                    # Check instances in this resource type
-                    for instance in resource.get('instances', []):
-                        attributes = instance.get('attributes', {})
-                        
-                        # Try multiple ways to match the resource:
-                        # 1. By ID (e.g., instance ID, bucket name)
-                        if attributes.get('id') == resource_id:
-                            project_name = project_dir.name
-                            logger.info(f"Found resource {resource_id} managed by project: {project_name} (matched by id)")
-                            return project_name
-                        
-                        # 2. By ARN
-                        if attributes.get('arn') == resource_id:
-                            project_name = project_dir.name
-                            logger.info(f"Found resource {resource_id} managed by project: {project_name} (matched by arn)")
-                            return project_name
-                        
-                        # 3. For parsed resources, check specific attributes
-                        if parsed:
-                            resource_id_from_arn = parsed.get('resource_id')
-                            
-                            # Check by parsed resource ID
-                            if attributes.get('id') == resource_id_from_arn:
-                                project_name = project_dir.name
-                                logger.info(f"Found resource {resource_id_from_arn} managed by project: {project_name} (matched by parsed id)")
-                                return project_name
-                            
-                            # For S3 buckets, check bucket name
-                            if parsed.get('service') == 's3' and attributes.get('bucket') == resource_id_from_arn:
-                                project_name = project_dir.name
-                                logger.info(f"Found S3 bucket {resource_id_from_arn} managed by project: {project_name}")
-                                return project_name
-                            
-                            # For DynamoDB tables, check table name
-                            if parsed.get('service') == 'dynamodb' and attributes.get('name') == resource_id_from_arn:
-                                project_name = project_dir.name
-                                logger.info(f"Found DynamoDB table {resource_id_from_arn} managed by project: {project_name}")
-                                return project_name
-                            
-                            # For Lambda functions, check function name
-                            if parsed.get('service') == 'lambda' and attributes.get('function_name') == resource_id_from_arn:
-                                project_name = project_dir.name
-                                logger.info(f"Found Lambda function {resource_id_from_arn} managed by project: {project_name}")
-                                return project_name
-                            
-                            # For RDS instances, check identifier
-                            if parsed.get('service') == 'rds' and attributes.get('identifier') == resource_id_from_arn:
-                                project_name = project_dir.name
-                                logger.info(f"Found RDS instance {resource_id_from_arn} managed by project: {project_name}")
-                                return project_name
-            
-            except Exception as e:
-                logger.debug(f"Error reading state file {state_file}: {e}")
-                continue
-        
+
+        # Candidate (attribute, value) keys in match priority order.
+        keys = [("id", resource_id), ("arn", resource_id)]
+        if parsed:
+            resource_id_from_arn = parsed.get('resource_id')
+            keys.append(("id", resource_id_from_arn))
+            name_attribute = STATE_NAME_ATTRIBUTES.get(parsed.get('service'))
+            if name_attribute:
+                keys.append((name_attribute, resource_id_from_arn))
+
+        match = self.state_index.find(keys)
+        if match:
+            project_name, (attribute, value) = match
+            logger.info(f"Found resource {value} managed by project: {project_name} (matched by {attribute})")
+            return project_name
+
         logger.warning(f"Resource {resource_id} not found in any Terraform state files")
         return None
     
@@ -1407,35 +1161,23 @@ class MCPAWSManagerServer:
         if not project_name:
             return project_name
             
+        project_names = self.terraform.project_names()
+
         # 1. Try exact match
-        if (self.terraform.workspace_dir / project_name).exists():
+        if project_name in project_names:
             return project_name
             
-        # 2. Try common prefixes
-        prefixes = ["s3_", "ec2_", "vpc_", "rds_", "lambda_", "ecs_"]
-        
         # 2. Check if it's an AWS resource ID or ARN (starts with common prefixes or 'arn:')
-        if (project_name.startswith('i-') or 
-            project_name.startswith('vpc-') or 
-            project_name.startswith('sg-') or 
-            project_name.startswith('subnet-') or 
-            project_name.startswith('arn:aws:') or
-            project_name.startswith('nat-') or
-            project_name.startswith('eni-') or
-            project_name.startswith('vol-') or
-            project_name.startswith('snap-') or
-            project_name.startswith('ami-') or
-            project_name.startswith('rds-')):
+        if project_name.startswith(AWS_REFERENCE_PREFIXES):
             found_project = self._find_project_by_resource_id(project_name)
             if found_project:
                 return found_project
         
         # 3. Try common prefixes for abbreviated names
-        prefixes = ["s3_", "ec2_", "vpc_", "rds_", "lambda_", "dynamodb_"]
-        for prefix in prefixes:
+        for prefix in PROJECT_NAME_PREFIXES:
             if not project_name.startswith(prefix):
                 candidate = f"{prefix}{project_name}"
-                if (self.terraform.workspace_dir / candidate).exists():
+                if candidate in project_names:
                     logger.info(f"Resolved project '{project_name}' to '{candidate}'")
                     return candidate
         
@@ -1447,6 +1189,32 @@ class MCPAWSManagerServer:
                     
         return project_name
 
+    # Tool name -> handler method name.
+    _TOOL_HANDLERS = {
+        "list_account_inventory": "_list_account_inventory",
+        "get_cost_explorer_summary": "_get_cost_explorer_summary",
+        "list_aws_resources": "_list_aws_resources",
+        "describe_resource": "_describe_resource",
+        "start_ecs_deployment_workflow": "_start_ecs_deployment_workflow",
+        "update_ecs_deployment_workflow": "_update_ecs_deployment_workflow",
+        "review_ecs_deployment_workflow": "_review_ecs_deployment_workflow",
+        "create_ecs_service": "_create_ecs_service",
+        "create_ec2_instance": "_create_ec2_instance",
+        "create_s3_bucket": "_create_s3_bucket",
+        "create_vpc": "_create_vpc",
+        "create_rds_instance": "_create_rds_instance",
+        "create_lambda_function": "_create_lambda_function",
+        "terraform_plan": "_terraform_plan",
+        "terraform_apply": "_terraform_apply",
+        "terraform_plan_and_apply": "_terraform_plan_and_apply",
+        "terraform_destroy": "_terraform_destroy",
+        "get_infrastructure_state": "_get_infrastructure_state",
+        "get_user_permissions": "_get_user_permissions",
+        "parse_mermaid_architecture": "_parse_mermaid_architecture",
+        "generate_terraform_from_architecture": "_generate_terraform_from_architecture",
+        "deploy_architecture": "_deploy_architecture",
+    }
+
     def execute_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute an MCP tool"""
         logger.info(f"Executing tool: {tool_name} with parameters: {parameters}")
@@ -1463,113 +1231,151 @@ class MCPAWSManagerServer:
         # Identity might be stale, but we'll try to use it. 
         # The individual handlers will catch permission errors.
         
-        # Route to appropriate handler
-        handlers = {
-            "list_account_inventory": self._list_account_inventory,
-            "get_cost_explorer_summary": self._get_cost_explorer_summary,
-            "list_aws_resources": self._list_aws_resources,
-            "describe_resource": self._describe_resource,
-            "start_ecs_deployment_workflow": self._start_ecs_deployment_workflow,
-            "update_ecs_deployment_workflow": self._update_ecs_deployment_workflow,
-            "review_ecs_deployment_workflow": self._review_ecs_deployment_workflow,
-            "create_ecs_service": self._create_ecs_service,
-            "create_ec2_instance": self._create_ec2_instance,
-            "create_s3_bucket": self._create_s3_bucket,
-            "create_vpc": self._create_vpc,
-            "create_rds_instance": self._create_rds_instance,
-            "create_lambda_function": self._create_lambda_function,
-            "terraform_plan": self._terraform_plan,
-            "terraform_apply": self._terraform_apply,
-            "terraform_destroy": self._terraform_destroy,
-            "get_infrastructure_state": self._get_infrastructure_state,
-            "get_user_permissions": self._get_user_permissions,
-            "parse_mermaid_architecture": self._parse_mermaid_architecture,
-            "generate_terraform_from_architecture": self._generate_terraform_from_architecture,
-            "deploy_architecture": self._deploy_architecture,
-        }
-        
-        handler = handlers.get(tool_name)
-        if not handler:
+        # Route to appropriate handler. Resolved per call so instance-level
+        # overrides of a handler method are honoured.
+        handler_name = self._TOOL_HANDLERS.get(tool_name)
+        if not handler_name:
             return {"success": False, "error": f"Unknown tool: {tool_name}"}
-        
-        return handler(parameters)
+        handler = getattr(self, handler_name)
+
+        validator = self._tool_validators.get(tool_name)
+        if validator:
+            try:
+                parameters = validator(parameters or {})
+            except ToolParameterError as e:
+                logger.warning(f"Rejected parameters for {tool_name}: {e}")
+                return e.to_response()
+
+        result = handler(parameters)
+        if tool_name in READ_CACHE_INVALIDATING_TOOLS:
+            self.invalidate_read_cache()
+        return result
 
     def _list_aws_resources(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Read-only resource listing by type."""
+        return self._cached_read("list_aws_resources", params, self._list_aws_resources_uncached)
+
+    def _list_aws_resources_uncached(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Uncached implementation of _list_aws_resources."""
         resource_type = (params.get("resource_type") or "").lower()
         region = params.get("region") or os.getenv("AWS_REGION") or "us-east-1"
 
-        try:
-            if resource_type == "s3":
-                s3 = boto3.client("s3")
-                buckets = [{"name": b.get("Name"), "created": str(b.get("CreationDate"))} for b in s3.list_buckets().get("Buckets", [])]
-                return {"success": True, "resource_type": "s3", "count": len(buckets), "items": buckets}
-
-            if resource_type == "ec2":
-                ec2 = boto3.client("ec2", region_name=region)
-                reservations = ec2.describe_instances().get("Reservations", [])
-                instances = []
-                for r in reservations:
-                    for i in r.get("Instances", []):
-                        instances.append({
-                            "instance_id": i.get("InstanceId"),
-                            "state": i.get("State", {}).get("Name"),
-                            "instance_type": i.get("InstanceType"),
-                            "private_ip": i.get("PrivateIpAddress"),
-                            "public_ip": i.get("PublicIpAddress"),
-                        })
-                return {"success": True, "resource_type": "ec2", "region": region, "count": len(instances), "items": instances}
-
-            if resource_type == "vpc":
-                ec2 = boto3.client("ec2", region_name=region)
-                vpcs = [{
-                    "vpc_id": v.get("VpcId"),
-                    "cidr": v.get("CidrBlock"),
-                    "state": v.get("State")
-                } for v in ec2.describe_vpcs().get("Vpcs", [])]
-                return {"success": True, "resource_type": "vpc", "region": region, "count": len(vpcs), "items": vpcs}
-
-            if resource_type == "rds":
-                rds = boto3.client("rds", region_name=region)
-                dbs = [{
-                    "db_identifier": d.get("DBInstanceIdentifier"),
-                    "engine": d.get("Engine"),
-                    "status": d.get("DBInstanceStatus"),
-                    "class": d.get("DBInstanceClass")
-                } for d in rds.describe_db_instances().get("DBInstances", [])]
-                return {"success": True, "resource_type": "rds", "region": region, "count": len(dbs), "items": dbs}
-
-            if resource_type == "lambda":
-                lam = boto3.client("lambda", region_name=region)
-                funcs = [{
-                    "function_name": f.get("FunctionName"),
-                    "runtime": f.get("Runtime"),
-                    "last_modified": f.get("LastModified")
-                } for f in lam.list_functions().get("Functions", [])]
-                return {"success": True, "resource_type": "lambda", "region": region, "count": len(funcs), "items": funcs}
-
-            if resource_type == "ecs":
-                ecs = boto3.client("ecs", region_name=region)
-                cluster_arns = ecs.list_clusters().get("clusterArns", [])
-                clusters = []
-                if cluster_arns:
-                    described = ecs.describe_clusters(clusters=cluster_arns).get("clusters", [])
-                    for c in described:
-                        clusters.append({
-                            "cluster_name": c.get("clusterName"),
-                            "cluster_arn": c.get("clusterArn"),
-                            "status": c.get("status"),
-                            "running_tasks_count": c.get("runningTasksCount"),
-                            "active_services_count": c.get("activeServicesCount"),
-                        })
-                return {"success": True, "resource_type": "ecs", "region": region, "count": len(clusters), "items": clusters}
-
+        list_resources = self._LIST_HANDLERS.get(resource_type)
+        if list_resources is None:
             return {"success": False, "error": f"Unsupported resource_type '{resource_type}'"}
+
+        try:
+            result = list_resources(self, region)
+            if resource_type == "s3" and params.get("include_regions"):
+                self._fill_bucket_regions(get_aws_client("s3"), result["items"])
+            return result
         except Exception as e:
             return {"success": False, "error": f"Failed to list {resource_type} resources: {str(e)}"}
 
+    def _list_s3_buckets(self, region: str) -> Dict[str, Any]:
+        s3 = get_aws_client("s3")
+        buckets = [{
+            "name": b.get("Name"),
+            "created": format_timestamp(b.get("CreationDate")),
+            "region": b.get("BucketRegion")
+        } for b in paginate_items(s3, "list_buckets", "Buckets", page_size=1000)]
+        return {"success": True, "resource_type": "s3", "count": len(buckets), "items": buckets}
+
+    def _list_ec2_instances(self, region: str) -> Dict[str, Any]:
+        ec2 = get_aws_client("ec2", region_name=region)
+        reservations = paginate_items(ec2, "describe_instances", "Reservations", page_size=1000)
+        instances = []
+        for r in reservations:
+            for i in r.get("Instances", []):
+                instances.append({
+                    "instance_id": i.get("InstanceId"),
+                    "state": i.get("State", {}).get("Name"),
+                    "instance_type": i.get("InstanceType"),
+                    "private_ip": i.get("PrivateIpAddress"),
+                    "public_ip": i.get("PublicIpAddress"),
+                })
+        return {"success": True, "resource_type": "ec2", "region": region, "count": len(instances), "items": instances}
+
+    def _list_vpcs(self, region: str) -> Dict[str, Any]:
+        ec2 = get_aws_client("ec2", region_name=region)
+        vpcs = [{
+            "vpc_id": v.get("VpcId"),
+            "cidr": v.get("CidrBlock"),
+            "state": v.get("State")
+        } for v in paginate_items(ec2, "describe_vpcs", "Vpcs", page_size=1000)]
+        return {"success": True, "resource_type": "vpc", "region": region, "count": len(vpcs), "items": vpcs}
+
+    def _list_rds_instances(self, region: str) -> Dict[str, Any]:
+        rds = get_aws_client("rds", region_name=region)
+        dbs = [{
+            "db_identifier": d.get("DBInstanceIdentifier"),
+            "engine": d.get("Engine"),
+            "status": d.get("DBInstanceStatus"),
+            "class": d.get("DBInstanceClass")
+        } for d in paginate_items(rds, "describe_db_instances", "DBInstances", page_size=100)]
+        return {"success": True, "resource_type": "rds", "region": region, "count": len(dbs), "items": dbs}
+
+    def _list_lambda_functions(self, region: str) -> Dict[str, Any]:
+        lam = get_aws_client("lambda", region_name=region)
+        funcs = [{
+            "function_name": f.get("FunctionName"),
+            "runtime": f.get("Runtime"),
+            "last_modified": f.get("LastModified")
+        } for f in paginate_items(lam, "list_functions", "Functions", page_size=50)]
+        return {"success": True, "resource_type": "lambda", "region": region, "count": len(funcs), "items": funcs}
+
+    def _list_ecs_clusters(self, region: str) -> Dict[str, Any]:
+        ecs = get_aws_client("ecs", region_name=region)
+        cluster_arns = list(paginate_items(ecs, "list_clusters", "clusterArns", page_size=100))
+        clusters = []
+        # describe_clusters accepts at most 100 clusters per call.
+        for start in range(0, len(cluster_arns), 100):
+            described = ecs.describe_clusters(clusters=cluster_arns[start:start + 100]).get("clusters", [])
+            for c in described:
+                clusters.append({
+                    "cluster_name": c.get("clusterName"),
+                    "cluster_arn": c.get("clusterArn"),
+                    "status": c.get("status"),
+                    "running_tasks_count": c.get("runningTasksCount"),
+                    "active_services_count": c.get("activeServicesCount"),
+                })
+        return {"success": True, "resource_type": "ecs", "region": region, "count": len(clusters), "items": clusters}
+
+    # resource_type -> list handler, built once with the class.
+    _LIST_HANDLERS = {
+        "s3": _list_s3_buckets,
+        "ec2": _list_ec2_instances,
+        "vpc": _list_vpcs,
+        "rds": _list_rds_instances,
+        "lambda": _list_lambda_functions,
+        "ecs": _list_ecs_clusters,
+    }
+
+    def _fill_bucket_regions(self, s3: Any, buckets: List[Dict[str, Any]]) -> None:
+        """Look up the region of any bucket list_buckets returned without BucketRegion."""
+        missing = [b for b in buckets if not b["region"]]
+        if not missing:
+            return
+        # Only direct list_aws_resources calls ask for regions, never the
+        # inventory scan, so these lookups never wait on their own pool.
+        regions = AWS_READ_POOL.map(lambda b: self._bucket_region(s3, b["name"]), missing)
+        for bucket, bucket_region in zip(missing, regions):
+            bucket["region"] = bucket_region
+
+    @staticmethod
+    def _bucket_region(s3: Any, bucket_name: str) -> Optional[str]:
+        try:
+            return s3.get_bucket_location(Bucket=bucket_name).get("LocationConstraint") or "us-east-1"
+        except ClientError as e:
+            logger.warning(f"Could not resolve region for bucket {bucket_name}: {e}")
+            return None
+
     def _describe_resource(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Read-only resource details."""
+        return self._cached_read("describe_resource", params, self._describe_resource_uncached)
+
+    def _describe_resource_uncached(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Uncached implementation of _describe_resource."""
         resource_type = (params.get("resource_type") or "").lower()
         resource_id = params.get("resource_id")
         region = params.get("region") or os.getenv("AWS_REGION") or "us-east-1"
@@ -1577,108 +1383,156 @@ class MCPAWSManagerServer:
         if not resource_id:
             return {"success": False, "error": "resource_id is required"}
 
-        try:
-            if resource_type == "s3":
-                s3 = boto3.client("s3")
-                location = s3.get_bucket_location(Bucket=resource_id).get("LocationConstraint") or "us-east-1"
-                return {
-                    "success": True,
-                    "resource_type": "s3",
-                    "resource_id": resource_id,
-                    "details": {"bucket_name": resource_id, "region": location}
-                }
-
-            if resource_type == "ec2":
-                ec2 = boto3.client("ec2", region_name=region)
-                res = ec2.describe_instances(InstanceIds=[resource_id]).get("Reservations", [])
-                if not res or not res[0].get("Instances"):
-                    return {"success": False, "error": f"EC2 instance '{resource_id}' not found in {region}"}
-                return {"success": True, "resource_type": "ec2", "region": region, "resource_id": resource_id, "details": res[0]["Instances"][0]}
-
-            if resource_type == "vpc":
-                ec2 = boto3.client("ec2", region_name=region)
-                vpcs = ec2.describe_vpcs(VpcIds=[resource_id]).get("Vpcs", [])
-                if not vpcs:
-                    return {"success": False, "error": f"VPC '{resource_id}' not found in {region}"}
-                return {"success": True, "resource_type": "vpc", "region": region, "resource_id": resource_id, "details": vpcs[0]}
-
-            if resource_type == "rds":
-                rds = boto3.client("rds", region_name=region)
-                dbs = rds.describe_db_instances(DBInstanceIdentifier=resource_id).get("DBInstances", [])
-                if not dbs:
-                    return {"success": False, "error": f"RDS instance '{resource_id}' not found in {region}"}
-                return {"success": True, "resource_type": "rds", "region": region, "resource_id": resource_id, "details": dbs[0]}
-
-            if resource_type == "lambda":
-                lam = boto3.client("lambda", region_name=region)
-                func = lam.get_function(FunctionName=resource_id)
-                return {"success": True, "resource_type": "lambda", "region": region, "resource_id": resource_id, "details": func.get("Configuration", {})}
-
-            if resource_type == "ecs":
-                ecs = boto3.client("ecs", region_name=region)
-                # resource_id can be cluster name/arn or cluster/service tuple: cluster_name/service_name
-                if "/" in resource_id and not resource_id.startswith("arn:"):
-                    cluster_name, service_name = resource_id.split("/", 1)
-                    service = ecs.describe_services(cluster=cluster_name, services=[service_name]).get("services", [])
-                    if not service:
-                        return {"success": False, "error": f"ECS service '{resource_id}' not found in {region}"}
-                    return {
-                        "success": True,
-                        "resource_type": "ecs",
-                        "region": region,
-                        "resource_id": resource_id,
-                        "details": service[0]
-                    }
-
-                cluster = ecs.describe_clusters(clusters=[resource_id]).get("clusters", [])
-                if not cluster:
-                    return {"success": False, "error": f"ECS cluster '{resource_id}' not found in {region}"}
-                return {
-                    "success": True,
-                    "resource_type": "ecs",
-                    "region": region,
-                    "resource_id": resource_id,
-                    "details": cluster[0]
-                }
+        if not resource_type:
+            # Bare EC2/VPC IDs identify their own type.
+            parsed = self._parse_resource_identifier(resource_id)
+            if parsed and not resource_id.startswith("arn:"):
+                resource_type = DESCRIBE_TYPE_BY_PARSED_ID.get((parsed["service"], parsed["resource_type"]), "")
 
+        describe = self._DESCRIBE_HANDLERS.get(resource_type)
+        if describe is None:
             return {"success": False, "error": f"Unsupported resource_type '{resource_type}'"}
+
+        try:
+            return describe(self, resource_id, region)
         except Exception as e:
             return {"success": False, "error": f"Failed to describe {resource_type} resource '{resource_id}': {str(e)}"}
 
+    def _describe_s3_bucket(self, resource_id: str, region: str) -> Dict[str, Any]:
+        s3 = get_aws_client("s3")
+        location = s3.get_bucket_location(Bucket=resource_id).get("LocationConstraint") or "us-east-1"
+        return {
+            "success": True,
+            "resource_type": "s3",
+            "resource_id": resource_id,
+            "details": {"bucket_name": resource_id, "region": location}
+        }
+
+    def _describe_ec2_instance(self, resource_id: str, region: str) -> Dict[str, Any]:
+        ec2 = get_aws_client("ec2", region_name=region)
+        res = ec2.describe_instances(InstanceIds=[resource_id]).get("Reservations", [])
+        if not res or not res[0].get("Instances"):
+            return {"success": False, "error": f"EC2 instance '{resource_id}' not found in {region}"}
+        return {"success": True, "resource_type": "ec2", "region": region, "resource_id": resource_id, "details": res[0]["Instances"][0]}
+
+    def _describe_vpc(self, resource_id: str, region: str) -> Dict[str, Any]:
+        ec2 = get_aws_client("ec2", region_name=region)
+        vpcs = ec2.describe_vpcs(VpcIds=[resource_id]).get("Vpcs", [])
+        if not vpcs:
+            return {"success": False, "error": f"VPC '{resource_id}' not found in {region}"}
+        return {"success": True, "resource_type": "vpc", "region": region, "resource_id": resource_id, "details": vpcs[0]}
+
+    def _describe_rds_instance(self, resource_id: str, region: str) -> Dict[str, Any]:
+        rds = get_aws_client("rds", region_name=region)
+        dbs = rds.describe_db_instances(DBInstanceIdentifier=resource_id).get("DBInstances", [])
+        if not dbs:
+            return {"success": False, "error": f"RDS instance '{resource_id}' not found in {region}"}
+        return {"success": True, "resource_type": "rds", "region": region, "resource_id": resource_id, "details": dbs[0]}
+
+    def _describe_lambda_function(self, resource_id: str, region: str) -> Dict[str, Any]:
+        lam = get_aws_client("lambda", region_name=region)
+        func = lam.get_function(FunctionName=resource_id)
+        return {"success": True, "resource_type": "lambda", "region": region, "resource_id": resource_id, "details": func.get("Configuration", {})}
+
+    def _describe_ecs(self, resource_id: str, region: str) -> Dict[str, Any]:
+        ecs = get_aws_client("ecs", region_name=region)
+        # resource_id can be cluster name/arn or cluster/service tuple: cluster_name/service_name
+        cluster_name, sep, service_name = resource_id.partition("/")
+        if sep and not cluster_name.startswith("arn:"):
+            service = ecs.describe_services(cluster=cluster_name, services=[service_name]).get("services", [])
+            if not service:
+                return {"success": False, "error": f"ECS service '{resource_id}' not found in {region}"}
+            return {
+                "success": True,
+                "resource_type": "ecs",
+                "region": region,
+                "resource_id": resource_id,
+                "details": service[0]
+            }
+
+        cluster = ecs.describe_clusters(clusters=[resource_id]).get("clusters", [])
+        if not cluster:
+            return {"success": False, "error": f"ECS cluster '{resource_id}' not found in {region}"}
+        return {
+            "success": True,
+            "resource_type": "ecs",
+            "region": region,
+            "resource_id": resource_id,
+            "details": cluster[0]
+        }
+
+    # resource_type -> describe handler, built once with the class.
+    _DESCRIBE_HANDLERS = {
+        "s3": _describe_s3_bucket,
+        "ec2": _describe_ec2_instance,
+        "vpc": _describe_vpc,
+        "rds": _describe_rds_instance,
+        "lambda": _describe_lambda_function,
+        "ecs": _describe_ecs,
+    }
+
     def _list_account_inventory(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Read-only account inventory summary across regions."""
+        return self._cached_read("list_account_inventory", params, self._list_account_inventory_uncached)
+
+    def _list_account_inventory_uncached(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Uncached implementation of _list_account_inventory."""
         regions = params.get("regions")
         if not regions:
             regions = self.rbac.get_allowed_regions()
 
-        # Keep bounded for latency/safety in LLM loops.
-        regions = list(regions)[:20]
+        # Keep bounded for latency/safety in LLM loops. Regions are scanned in
+        # parallel, so the bound covers every region AWS currently offers.
+        regions = list(regions)[:INVENTORY_MAX_REGIONS]
 
         summary = {"ec2": 0, "vpc": 0, "rds": 0, "lambda": 0, "ecs": 0, "s3": 0}
         regional_breakdown = []
 
+        # Every (resource type, region) listing is an independent network call,
+        # so submit them all up front and collect the results in request order.
+        s3_future = AWS_READ_POOL.submit(self._list_aws_resources, {"resource_type": "s3"})
+        region_scans = [(region, self._submit_region_scan(region)) for region in regions]
+
         # Global S3 count
-        s3_result = self._list_aws_resources({"resource_type": "s3"})
+        s3_result = s3_future.result()
         if s3_result.get("success"):
             summary["s3"] = s3_result.get("count", 0)
 
-        for region in regions:
-            region_counts = {"region": region, "ec2": 0, "vpc": 0, "rds": 0, "lambda": 0, "ecs": 0}
-            for rtype in ("ec2", "vpc", "rds", "lambda", "ecs"):
-                result = self._list_aws_resources({"resource_type": rtype, "region": region})
-                if result.get("success"):
-                    count = result.get("count", 0)
-                    summary[rtype] += count
-                    region_counts[rtype] = count
+        regions_succeeded = 0
+        for region, type_futures in region_scans:
+            region_counts = self._collect_region_scan(region, type_futures)
+            for rtype in INVENTORY_REGIONAL_TYPES:
+                summary[rtype] += region_counts[rtype]
+            if "errors" not in region_counts:
+                regions_succeeded += 1
             regional_breakdown.append(region_counts)
 
         return {
             "success": True,
             "summary": summary,
             "regions_scanned": regions,
+            "regions_succeeded": regions_succeeded,
             "regional_breakdown": regional_breakdown
         }
 
+    def _submit_region_scan(self, region: str) -> List[Tuple[str, Future]]:
+        """Queue one listing per regional resource type on the shared read pool."""
+        return [
+            (rtype, AWS_READ_POOL.submit(self._list_aws_resources, {"resource_type": rtype, "region": region}))
+            for rtype in INVENTORY_REGIONAL_TYPES
+        ]
+
+    def _collect_region_scan(self, region: str, type_futures: List[Tuple[str, Future]]) -> Dict[str, Any]:
+        """Wait for a region's listings and return its per-type counts."""
+        region_counts: Dict[str, Any] = {"region": region, "ec2": 0, "vpc": 0, "rds": 0, "lambda": 0, "ecs": 0}
+        for rtype, future in type_futures:
+            result = future.result()
+            if result.get("success"):
+                region_counts[rtype] = result.get("count", 0)
+            else:
+                region_counts.setdefault("errors", {})[rtype] = result.get("error")
+        return region_counts
+
     def _get_cost_explorer_summary(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Read-only AWS Cost Explorer summary for a date window."""
         params = params or {}
@@ -1686,18 +1540,22 @@ class MCPAWSManagerServer:
         if granularity not in {"DAILY", "MONTHLY"}:
             return {"success": False, "error": "granularity must be DAILY or MONTHLY"}
 
+        top_n = params.get("top_n")
+        if top_n is not None and top_n < 1:
+            return {"success": False, "error": "top_n must be a positive integer"}
+
         metric = params.get("metric") or "UnblendedCost"
         allowed_metrics = {"UnblendedCost", "BlendedCost", "AmortizedCost", "NetUnblendedCost", "NetAmortizedCost"}
         if metric not in allowed_metrics:
             return {"success": False, "error": f"metric must be one of: {', '.join(sorted(allowed_metrics))}"}
 
         try:
-            today_utc = datetime.utcnow().date()
+            today_utc = datetime.now(timezone.utc).date()
             default_start = today_utc.replace(day=1)
             default_end = today_utc + timedelta(days=1)  # Cost Explorer End is exclusive.
 
-            start_date = datetime.strptime(params.get("start_date") or default_start.isoformat(), "%Y-%m-%d").date()
-            end_date = datetime.strptime(params.get("end_date") or default_end.isoformat(), "%Y-%m-%d").date()
+            start_date = date.fromisoformat(params.get("start_date") or default_start.isoformat())
+            end_date = date.fromisoformat(params.get("end_date") or default_end.isoformat())
             if start_date >= end_date:
                 return {"success": False, "error": "start_date must be earlier than end_date"}
 
@@ -1710,12 +1568,12 @@ class MCPAWSManagerServer:
             if group_by_service:
                 request["GroupBy"] = [{"Type": "DIMENSION", "Key": "SERVICE"}]
 
-            ce = boto3.client("ce", region_name="us-east-1")
+            ce = get_aws_client("ce", region_name="us-east-1")
             response = ce.get_cost_and_usage(**request)
 
             total_cost = 0.0
             currency = "USD"
-            by_service: Dict[str, float] = {}
+            by_service: Dict[str, float] = defaultdict(float)
             periods = response.get("ResultsByTime", [])
 
             for period in periods:
@@ -1730,16 +1588,21 @@ class MCPAWSManagerServer:
                     metric_data = group.get("Metrics", {}).get(metric, {})
                     amount = float(metric_data.get("Amount", "0") or 0.0)
                     period_group_total += amount
-                    by_service[service] = by_service.get(service, 0.0) + amount
+                    by_service[service] += amount
                     currency = metric_data.get("Unit", currency) or currency
 
                 # Cost Explorer commonly omits period Total when GroupBy is used.
                 if not total_metric and period_group_total:
                     total_cost += period_group_total
 
+            if top_n:
+                # Partial selection instead of sorting every service.
+                ranked = heapq.nlargest(top_n, by_service.items(), key=itemgetter(1))
+            else:
+                ranked = sorted(by_service.items(), key=itemgetter(1), reverse=True)
             service_breakdown = [
                 {"service": service, "amount": round(amount, 4), "currency": currency}
-                for service, amount in sorted(by_service.items(), key=lambda x: x[1], reverse=True)
+                for service, amount in ranked
             ]
 
             return {
@@ -1749,7 +1612,7 @@ class MCPAWSManagerServer:
                 "granularity": granularity,
                 "metric": metric,
                 "total_cost": {"amount": round(total_cost, 4), "currency": currency},
-                "service_count": len(service_breakdown),
+                "service_count": len(by_service),
                 "services": service_breakdown if group_by_service else [],
                 "message": "Cost Explorer summary retrieved successfully."
             }
@@ -1801,7 +1664,10 @@ class MCPAWSManagerServer:
             return {"success": False, "error": "workflow_id is required"}
         workflow = self.ecs_workflows.get(workflow_id)
         if not workflow:
-            return {"success": False, "error": f"ECS workflow '{workflow_id}' not found"}
+            return {
+                "success": False,
+                "error": f"ECS workflow '{workflow_id}' not found (workflows expire after {WORKFLOW_TTL_SECONDS:.0f}s idle)",
+            }
 
         config = workflow["config"]
         for key in (
@@ -1842,7 +1708,10 @@ class MCPAWSManagerServer:
             return {"success": False, "error": "workflow_id is required"}
         workflow = self.ecs_workflows.get(workflow_id)
         if not workflow:
-            return {"success": False, "error": f"ECS workflow '{workflow_id}' not found"}
+            return {
+                "success": False,
+                "error": f"ECS workflow '{workflow_id}' not found (workflows expire after {WORKFLOW_TTL_SECONDS:.0f}s idle)",
+            }
 
         config = workflow["config"]
         missing = self._ecs_missing_fields(config)
@@ -1870,28 +1739,28 @@ class MCPAWSManagerServer:
                 "security_group_ids": config.get("security_group_ids"),
             },
             "next_action": "call create_ecs_service and then terraform_plan/terraform_apply" if not missing else "fill missing_fields using update_ecs_deployment_workflow",
-            "safety_notes": [
-                "This flow assumes existing VPC subnets and security groups.",
-                "Review IAM role ARNs before apply.",
-                "Fargate costs scale with desired_count, CPU, and memory."
-            ]
+            "safety_notes": ECS_SAFETY_NOTES,
         }
 
     def _create_ecs_service(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create ECS Fargate Terraform project from workflow or direct parameters."""
-        if not self.rbac.check_permission("ecs:CreateCluster"):
-            return {"success": False, "error": "User lacks ecs:CreateCluster permission"}
-        if not self.rbac.check_permission("ecs:RegisterTaskDefinition"):
-            return {"success": False, "error": "User lacks ecs:RegisterTaskDefinition permission"}
-        if not self.rbac.check_permission("ecs:CreateService"):
-            return {"success": False, "error": "User lacks ecs:CreateService permission"}
+        permissions = self.rbac.check_permissions(list(ECS_CREATE_ACTIONS))
+        for action in ECS_CREATE_ACTIONS:
+            if not permissions[action]:
+                return {"success": False, "error": f"User lacks {action} permission"}
 
         workflow_id = params.get("workflow_id")
         if workflow_id:
             workflow = self.ecs_workflows.get(workflow_id)
             if not workflow:
-                return {"success": False, "error": f"ECS workflow '{workflow_id}' not found"}
-            config = dict(workflow["config"])
+                return {
+                    "success": False,
+                    "error": f"ECS workflow '{workflow_id}' not found (workflows expire after {WORKFLOW_TTL_SECONDS:.0f}s idle)",
+                }
+            # The config is the live entry stored in ecs_workflows. A read-only
+            # view keeps the helpers below from changing what a later
+            # review/update sees, without copying the config on every call.
+            config = MappingProxyType(workflow["config"])
         else:
             config = {
                 "region": params.get("region"),
@@ -1927,9 +1796,6 @@ class MCPAWSManagerServer:
             }
 
         project_name = f"ecs_{config['service_name']}_{config['region']}"
-        project_path = self.terraform.workspace_dir / project_name
-        project_path.mkdir(parents=True, exist_ok=True)
-
         tf_config = self.templates.ecs_fargate_service(
             region=config["region"],
             cluster_name=config["cluster_name"],
@@ -1945,7 +1811,7 @@ class MCPAWSManagerServer:
             memory=int(config["memory"]),
             assign_public_ip=bool(config["assign_public_ip"]),
         )
-        (project_path / "main.tf").write_text(tf_config)
+        self.terraform.write_project(project_name, {"main.tf": tf_config})
 
         init_result = self.terraform.init(project_name)
         if not init_result.get("success"):
@@ -1973,13 +1839,8 @@ class MCPAWSManagerServer:
         db_name = params.get("db_name")
         instance_class = params.get("instance_class", "db.t3.micro")
         region = params.get("region")
-        mode = params.get("mode", "terraform").lower() or "terraform"
 
-        missing = []
-        if not db_name:
-            missing.append("db_name")
-        if not region:
-            missing.append("region")
+        missing = self._check_required("create_rds_instance", params)
         if missing:
             return {
                 "success": False,
@@ -1988,17 +1849,14 @@ class MCPAWSManagerServer:
                 "questions": self._questions_for_tool("create_rds_instance", missing),
             }
         
-        rejected = self._reject_non_terraform_mode(mode)
+        rejected = self._reject_non_terraform_mode(params.get("mode"))
         if rejected:
             return rejected
             
         # Generate Terraform config (Default)
         project_name = f"rds_{db_name}"
-        project_path = self.terraform.workspace_dir / project_name
-        project_path.mkdir(parents=True, exist_ok=True)
-        
         config = self.templates.rds_instance(db_name, instance_class, region)
-        (project_path / "main.tf").write_text(config)
+        self.terraform.write_project(project_name, {"main.tf": config})
         
         init_result = self.terraform.init(project_name)
         if not init_result["success"]:
@@ -2014,13 +1872,8 @@ class MCPAWSManagerServer:
         """Create Lambda function using Terraform."""
         function_name = params.get("function_name")
         region = params.get("region")
-        mode = params.get("mode", "terraform").lower() or "terraform"
 
-        missing = []
-        if not function_name:
-            missing.append("function_name")
-        if not region:
-            missing.append("region")
+        missing = self._check_required("create_lambda_function", params)
         if missing:
             return {
                 "success": False,
@@ -2029,23 +1882,19 @@ class MCPAWSManagerServer:
                 "questions": self._questions_for_tool("create_lambda_function", missing),
             }
         
-        rejected = self._reject_non_terraform_mode(mode)
+        rejected = self._reject_non_terraform_mode(params.get("mode"))
         if rejected:
             return rejected
 
         # Generate Terraform config
         project_name = f"lambda_{function_name}"
-        project_path = self.terraform.workspace_dir / project_name
-        project_path.mkdir(parents=True, exist_ok=True)
-        
         config = self.templates.lambda_function(function_name, region)
-        (project_path / "main.tf").write_text(config)
         
-        # Create a dummy payload zip for Lambda
-        import zipfile
-        zip_path = project_path / "lambda_function_payload.zip"
-        with zipfile.ZipFile(zip_path, 'w') as zipf:
-            zipf.writestr('index.py', 'def handler(event, context):\n    print("Hello from MCP Lambda!")\n    return {"statusCode": 200, "body": "Success"}')
+        # Write the dummy payload zip for Lambda alongside main.tf
+        self.terraform.write_project(project_name, {
+            "main.tf": config,
+            "lambda_function_payload.zip": LAMBDA_PAYLOAD_ZIP,
+        })
 
         init_result = self.terraform.init(project_name)
         if not init_result["success"]:
@@ -2062,11 +1911,8 @@ class MCPAWSManagerServer:
         instance_type = params.get("instance_type", "t2.micro")
         region = params.get("region")
         ami_id = params.get("ami_id")
-        mode = params.get("mode", "terraform").lower() or "terraform"
 
-        missing = []
-        if not region:
-            missing.append("region")
+        missing = self._check_required("create_ec2_instance", params)
         if missing:
             return {
                 "success": False,
@@ -2079,7 +1925,7 @@ class MCPAWSManagerServer:
         if not self.rbac.check_permission("ec2:RunInstances"):
             return {"success": False, "error": "User lacks ec2:RunInstances permission"}
         
-        rejected = self._reject_non_terraform_mode(mode)
+        rejected = self._reject_non_terraform_mode(params.get("mode"))
         if rejected:
             return rejected
 
@@ -2091,11 +1937,8 @@ class MCPAWSManagerServer:
         
         # Generate Terraform config
         project_name = f"ec2_{instance_type}_{region}"
-        project_path = self.terraform.workspace_dir / project_name
-        project_path.mkdir(parents=True, exist_ok=True)
-        
         config = self.templates.ec2_instance(instance_type, ami_id, region, existing_sg_id)
-        (project_path / "main.tf").write_text(config)
+        self.terraform.write_project(project_name, {"main.tf": config})
         
         # Initialize Terraform
         init_result = self.terraform.init(project_name)
@@ -2114,13 +1957,8 @@ class MCPAWSManagerServer:
         bucket_name = params.get("bucket_name")
         region = params.get("region")
         versioning = params.get("versioning", True)
-        mode = params.get("mode", "terraform").lower() or "terraform"
 
-        missing = []
-        if not bucket_name:
-            missing.append("bucket_name")
-        if not region:
-            missing.append("region")
+        missing = self._check_required("create_s3_bucket", params)
         if missing:
             return {
                 "success": False,
@@ -2133,17 +1971,14 @@ class MCPAWSManagerServer:
         if not self.rbac.check_permission("s3:CreateBucket"):
             return {"success": False, "error": "User lacks s3:CreateBucket permission"}
         
-        rejected = self._reject_non_terraform_mode(mode)
+        rejected = self._reject_non_terraform_mode(params.get("mode"))
         if rejected:
             return rejected
 
         # Generate Terraform config
         project_name = f"s3_{bucket_name}"
-        project_path = self.terraform.workspace_dir / project_name
-        project_path.mkdir(parents=True, exist_ok=True)
-        
         config = self.templates.s3_bucket(bucket_name, region, versioning)
-        (project_path / "main.tf").write_text(config)
+        self.terraform.write_project(project_name, {"main.tf": config})
         
         # Initialize Terraform
         init_result = self.terraform.init(project_name)
@@ -2161,11 +1996,8 @@ class MCPAWSManagerServer:
         """Create VPC using Terraform."""
         cidr_block = params.get("cidr_block", "10.0.0.0/16")
         region = params.get("region")
-        mode = params.get("mode", "terraform").lower() or "terraform"
 
-        missing = []
-        if not region:
-            missing.append("region")
+        missing = self._check_required("create_vpc", params)
         if missing:
             return {
                 "success": False,
@@ -2178,17 +2010,14 @@ class MCPAWSManagerServer:
         if not self.rbac.check_permission("ec2:CreateVpc"):
             return {"success": False, "error": "User lacks ec2:CreateVpc permission"}
         
-        rejected = self._reject_non_terraform_mode(mode)
+        rejected = self._reject_non_terraform_mode(params.get("mode"))
         if rejected:
             return rejected
 
         # Generate Terraform config
         project_name = f"vpc_{region}"
-        project_path = self.terraform.workspace_dir / project_name
-        project_path.mkdir(parents=True, exist_ok=True)
-        
         config = self.templates.vpc_network(cidr_block, region)
-        (project_path / "main.tf").write_text(config)
+        self.terraform.write_project(project_name, {"main.tf": config})
         
         # Initialize Terraform
         init_result = self.terraform.init(project_name)
@@ -2219,6 +2048,14 @@ class MCPAWSManagerServer:
         auto_approve = params.get("auto_approve", False)
         return self.terraform.apply(project_name, auto_approve)
     
+    def _terraform_plan_and_apply(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Plan and apply in one terraform process"""
+        project_name = self._resolve_project_name(params.get("project_name"))
+        if not project_name:
+            return {"success": False, "error": "project_name is required"}
+
+        return self.terraform.plan_and_apply(project_name)
+    
     def _terraform_destroy(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Run terraform destroy"""
         project_name = self._resolve_project_name(params.get("project_name"))
@@ -2248,10 +2085,24 @@ class MCPAWSManagerServer:
             "allowed_regions": regions
         }
     
+    def _get_llm(self, provider: str, temperature: float = 0) -> Optional[Any]:
+        """Return a shared LLM client for architecture tools, or None if it cannot be created."""
+        key = (provider, temperature)
+        with self._llm_lock:
+            llm_instance = self._llm_cache.get(key)
+            if llm_instance is None:
+                try:
+                    from core.llm_config import initialize_llm
+                    llm_instance = initialize_llm(provider, temperature=temperature)
+                except Exception as e:
+                    # Not cached: credentials may be configured before the next call.
+                    logger.warning(f"Could not initialize LLM for terraform generation: {e}")
+                    return None
+                self._llm_cache[key] = llm_instance
+            return llm_instance
+
     def _parse_mermaid_architecture(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Parse Mermaid diagram to extract architecture"""
-        from core.architecture_parser import ArchitectureParser
-        
         mermaid_content = params.get("mermaid_content")
         if not mermaid_content:
             return {"success": False, "error": "mermaid_content is required"}
@@ -2262,7 +2113,7 @@ class MCPAWSManagerServer:
             result["success"] = True
             return result
         except Exception as e:
-            logger.error(f"Error parsing mermaid: {e}")
+            logger.exception(f"Error parsing mermaid: {e}")
             return {
                 "success": False,
                 "error": f"Failed to parse mermaid diagram: {str(e)}"
@@ -2270,50 +2121,62 @@ class MCPAWSManagerServer:
     
     def _generate_terraform_from_architecture(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Generate Terraform code from parsed architecture"""
-        from core.architecture_parser import ArchitectureParser
-        
         architecture = params.get("architecture")
         if not architecture:
             return {"success": False, "error": "architecture dict is required"}
         
         try:
             # Try to get LLM instance for better code generation
-            llm_instance = None
-            try:
-                from core.llm_config import initialize_llm
-                llm_instance = initialize_llm("claude", temperature=0)
-            except Exception as e:
-                logger.warning(f"Could not initialize LLM for terraform generation: {e}")
+            llm_instance = self._get_llm("claude", temperature=0)
             
             parser = ArchitectureParser(llm_provider="claude", llm_instance=llm_instance)
             result = parser.architecture_to_terraform(architecture)
             return result
         except Exception as e:
-            logger.error(f"Error generating terraform: {e}")
+            logger.exception(f"Error generating terraform: {e}")
             return {
                 "success": False,
                 "error": f"Failed to generate terraform: {str(e)}"
             }
     
+    def _start_provider_warmup(self, project_name: str) -> Optional[Future]:
+        """Start terraform init for a new project using only its provider requirements.
+
+        The future resolves to None when the project already exists; its
+        main.tf is left alone.
+        """
+        if not project_name:
+            return None
+        return TERRAFORM_INIT_POOL.submit(
+            self.terraform.init_new_project, project_name, {"main.tf": ARCHITECTURE_PROVIDERS_TF}
+        )
+
     def _deploy_architecture(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Deploy architecture from parsed resources (generate + plan)"""
-        from core.architecture_parser import ArchitectureParser
-        
         architecture = params.get("architecture")
         if not architecture:
             return {"success": False, "error": "architecture dict is required"}
         
         try:
             # Generate Terraform
-            llm_instance = None
-            try:
-                from core.llm_config import initialize_llm
-                llm_instance = initialize_llm("claude", temperature=0)
-            except Exception as e:
-                logger.warning(f"Could not initialize LLM: {e}")
+            llm_instance = self._get_llm("claude", temperature=0)
             
             parser = ArchitectureParser(llm_provider="claude", llm_instance=llm_instance)
+
+            # The project name does not depend on the LLM output, so a new
+            # project can download providers while the code is generated.
+            warmup = None
+            if llm_instance is not None:
+                expected_project = parser.extract_project_name(architecture)
+                warmup = self._start_provider_warmup(expected_project)
+
             gen_result = parser.architecture_to_terraform(architecture)
+
+            if warmup is not None:
+                # The skeleton must not be replaced while init is reading it.
+                warmed = warmup.result() is not None
+                if warmed and (not gen_result.get("success") or gen_result.get("project_name") != expected_project):
+                    shutil.rmtree(self.terraform.workspace_dir / expected_project, ignore_errors=True)
             
             if not gen_result.get("success"):
                 return gen_result
@@ -2322,11 +2185,7 @@ class MCPAWSManagerServer:
             terraform_code = gen_result.get("terraform_code")
             
             # Save terraform code to file
-            project_dir = self.terraform.workspace_dir / project_name
-            project_dir.mkdir(parents=True, exist_ok=True)
-            
-            main_tf = project_dir / "main.tf"
-            main_tf.write_text(terraform_code)
+            project_dir = self.terraform.write_project(project_name, {"main.tf": terraform_code})
             
             logger.info(f"Terraform code saved to {project_dir}/main.tf")
             
@@ -2351,7 +2210,7 @@ class MCPAWSManagerServer:
             }
         
         except Exception as e:
-            logger.error(f"Error deploying architecture: {e}")
+            logger.exception(f"Error deploying architecture: {e}")
             return {
                 "success": False,
                 "error": f"Failed to deploy architecture: {str(e)}"
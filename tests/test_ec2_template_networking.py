@@ -14,3 +14,12 @@ def test_ec2_template_uses_explicit_subnet_and_vpc_for_new_security_group():
     assert 'data "aws_subnet" "selected"' in config
     assert "subnet_id     = data.aws_subnet.selected.id" in config
     assert "vpc_id      = data.aws_subnet.selected.vpc_id" in config
+
+
+def test_ec2_template_reuses_rendered_config_for_same_inputs():
+    first = AWSInfrastructureTemplates.ec2_instance("t3.micro", None, "ap-south-1", None)
+    second = AWSInfrastructureTemplates.ec2_instance("t3.micro", None, "ap-south-1", None)
+    other = AWSInfrastructureTemplates.ec2_instance("t3.small", None, "ap-south-1", None)
+
+    assert first is second
+    assert "t3.small" in other
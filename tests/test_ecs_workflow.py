@@ -1,7 +1,11 @@
 """Unit tests for guided ECS deployment workflow tools."""
 
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
 import pytest
 
+from mcp_servers.aws_terraform import TTLCache
 from mcp_servers.aws_terraform_server import MCPAWSManagerServer
 
 
@@ -82,6 +86,31 @@ def test_create_ecs_service_from_workflow(server, monkeypatch):
     assert created["preflight"]["valid"] is True
 
 
+def test_create_ecs_service_cannot_modify_stored_workflow_config(server, monkeypatch):
+    seen = []
+    server._validate_ecs_prereqs = lambda config: seen.append(config) or {"valid": True, "errors": [], "warnings": [], "details": {}, "remediation": []}
+    started = server.execute_tool(
+        "start_ecs_deployment_workflow",
+        {
+            "region": "ap-south-1",
+            "cluster_name": "agent-cluster",
+            "service_name": "agent-service",
+            "container_image": "public.ecr.aws/docker/library/nginx:latest",
+            "execution_role_arn": "arn:aws:iam::123456789012:role/ecsTaskExecutionRole",
+            "task_role_arn": "arn:aws:iam::123456789012:role/langchain-task-role",
+            "subnet_ids": ["subnet-111"],
+            "security_group_ids": ["sg-111"],
+        },
+    )
+    monkeypatch.setattr(server.terraform, "init", lambda project_name: {"success": True})
+
+    assert server.execute_tool("create_ecs_service", {"workflow_id": started["workflow_id"]})["success"] is True
+    with pytest.raises(TypeError):
+        seen[-1]["region"] = "us-east-1"
+    reviewed = server.execute_tool("review_ecs_deployment_workflow", {"workflow_id": started["workflow_id"]})
+    assert reviewed["plan"]["region"] == "ap-south-1"
+
+
 def test_create_ecs_service_blocks_on_preflight_errors(server):
     server._validate_ecs_prereqs = lambda config: {
         "valid": False,
@@ -108,3 +137,128 @@ def test_create_ecs_service_blocks_on_preflight_errors(server):
     assert result["success"] is False
     assert "preflight validation failed" in result["error"].lower()
     assert result["preflight"]["valid"] is False
+
+
+def test_ecs_workflows_expire_after_idle_ttl(server):
+    now = [1000.0]
+    server.ecs_workflows = TTLCache(maxsize=8, ttl=60, name="ECS workflow", clock=lambda: now[0])
+
+    started = server.execute_tool("start_ecs_deployment_workflow", {"region": "ap-south-1"})
+    workflow_id = started["workflow_id"]
+
+    now[0] += 45
+    assert server.execute_tool("review_ecs_deployment_workflow", {"workflow_id": workflow_id})["success"] is True
+
+    # Access refreshed the TTL, so the workflow survives past the original deadline.
+    now[0] += 45
+    assert server.execute_tool("review_ecs_deployment_workflow", {"workflow_id": workflow_id})["success"] is True
+
+    now[0] += 61
+    expired = server.execute_tool("review_ecs_deployment_workflow", {"workflow_id": workflow_id})
+    assert expired["success"] is False
+    assert "not found" in expired["error"]
+
+
+def test_ecs_workflows_evict_least_recently_used():
+    store = TTLCache(maxsize=2, ttl=0, name="ECS workflow")
+    store["a"] = 1
+    store["b"] = 2
+    assert store.get("a") == 1
+    store["c"] = 3
+
+    assert "b" not in store
+    assert store.get("a") == 1
+    assert store.get("c") == 3
+
+
+def test_validate_ecs_prereqs_merges_concurrent_checks(server, monkeypatch):
+    fake_ec2 = MagicMock()
+    fake_ec2.describe_subnets.return_value = {"Subnets": [{"SubnetId": "subnet-111", "VpcId": "vpc-a"}]}
+    fake_ec2.describe_security_groups.return_value = {"SecurityGroups": [{"GroupId": "sg-111", "VpcId": "vpc-b"}]}
+    fake_iam = MagicMock()
+
+    def fake_client(service_name, region_name=None):
+        return fake_ec2 if service_name == "ec2" else fake_iam
+
+    monkeypatch.setattr("mcp_servers.aws_terraform_server.get_aws_client", fake_client)
+    result = server._validate_ecs_prereqs(
+        {
+            "region": "ap-south-1",
+            "subnet_ids": ["subnet-111", "subnet-222"],
+            "security_group_ids": ["sg-111"],
+            "execution_role_arn": "arn:aws:iam::123456789012:role/ecsTaskExecutionRole",
+            "task_role_arn": "arn:aws:iam::123456789012:role/langchain-task-role",
+        }
+    )
+
+    assert result["valid"] is False
+    assert result["errors"][0].startswith("Invalid or missing subnet IDs")
+    assert "subnet-222" in result["errors"][0]
+    assert result["errors"][1].startswith("VPC mismatch")
+    assert result["details"]["subnet_vpcs"] == ["vpc-a"]
+    assert result["details"]["security_group_vpcs"] == ["vpc-b"]
+    assert fake_iam.get_role.call_count == 2
+
+
+def test_validate_ecs_prereqs_rejects_malformed_role_arn_without_iam_call(server, monkeypatch):
+    fake_iam = MagicMock()
+    monkeypatch.setattr("mcp_servers.aws_terraform_server.get_aws_client", lambda *_a, **_k: fake_iam)
+
+    result = server._validate_ecs_prereqs(
+        {
+            "region": "ap-south-1",
+            "execution_role_arn": "ecsTaskExecutionRole",
+            "task_role_arn": "arn:aws:iam::123456789012:role/service-role/langchain-task-role",
+        }
+    )
+
+    assert result["errors"] == ["execution_role_arn is not a valid IAM role ARN: ecsTaskExecutionRole"]
+    fake_iam.get_role.assert_called_once_with(RoleName="langchain-task-role")
+
+
+def test_validate_ecs_prereqs_reports_throttling_as_warning(server, monkeypatch):
+    fake_iam = MagicMock()
+    fake_iam.get_role.side_effect = ClientError(
+        {"Error": {"Code": "Throttling", "Message": "Rate exceeded"}}, "GetRole"
+    )
+    monkeypatch.setattr("mcp_servers.aws_terraform_server.get_aws_client", lambda *_a, **_k: fake_iam)
+
+    result = server._validate_ecs_prereqs(
+        {"region": "ap-south-1", "task_role_arn": "arn:aws:iam::123456789012:role/langchain-task-role"}
+    )
+
+    assert result["valid"] is True
+    assert any("throttled" in w for w in result["warnings"])
+
+
+def test_validate_ecs_prereqs_skips_aws_when_nothing_to_validate(server, monkeypatch):
+    monkeypatch.setattr(
+        "mcp_servers.aws_terraform_server.get_aws_client",
+        lambda *_a, **_k: pytest.fail("no AWS client should be created"),
+    )
+
+    result = server._validate_ecs_prereqs({"region": "ap-south-1"})
+
+    assert result["valid"] is False
+    assert result["errors"] == []
+    assert result["warnings"] == ["No inputs to validate yet"]
+    assert result["remediation"]
+
+
+def test_validate_ecs_prereqs_reuses_complete_results_only(server, monkeypatch):
+    fake_iam = MagicMock()
+    monkeypatch.setattr("mcp_servers.aws_terraform_server.get_aws_client", lambda *_a, **_k: fake_iam)
+    config = {"region": "ap-south-1", "task_role_arn": "arn:aws:iam::123456789012:role/langchain-task-role"}
+
+    first = server._validate_ecs_prereqs(config)
+    first["errors"].append("mutated by caller")
+    second = server._validate_ecs_prereqs(dict(config))
+
+    assert second["errors"] == []
+    assert fake_iam.get_role.call_count == 1
+
+    fake_iam.get_role.side_effect = ClientError({"Error": {"Code": "Throttling", "Message": "Rate exceeded"}}, "GetRole")
+    throttled = {"region": "ap-south-1", "task_role_arn": "arn:aws:iam::123456789012:role/other-role"}
+    server._validate_ecs_prereqs(throttled)
+    server._validate_ecs_prereqs(throttled)
+    assert fake_iam.get_role.call_count == 3
@@ -24,6 +24,7 @@ def test_is_mutating_tool_classification():
     assert is_mutating_tool("create_vpc")
     assert is_mutating_tool("terraform_apply")
     assert is_mutating_tool("terraform_plan")
+    assert is_mutating_tool("terraform_plan_and_apply")
     assert is_mutating_tool("terraform_destroy")
     assert not is_mutating_tool("list_account_inventory")
     assert not is_mutating_tool("list_aws_resources")
@@ -0,0 +1,98 @@
+"""Unit tests for MCP tools that generate Terraform projects."""
+
+import zipfile
+
+from core.architecture_parser import ArchitectureParser
+from mcp_servers.aws_terraform.terraform import TerraformManager
+from mcp_servers.aws_terraform_server import MCPAWSManagerServer
+
+
+def test_create_lambda_function_writes_config_and_payload(tmp_path, monkeypatch):
+    server = MCPAWSManagerServer()
+    server.rbac.identity = {"Arn": "arn:aws:iam::123456789012:user/test"}
+    server.terraform = TerraformManager(workspace_dir=str(tmp_path))
+    monkeypatch.setattr(server.terraform, "init", lambda _project: {"success": True})
+
+    result = server._create_lambda_function({"function_name": "hello", "region": "ap-south-1"})
+
+    assert result["success"] is True
+    project_path = tmp_path / "lambda_hello"
+    assert 'region = "ap-south-1"' in (project_path / "main.tf").read_text()
+    with zipfile.ZipFile(project_path / "lambda_function_payload.zip") as payload:
+        assert "def handler(event, context)" in payload.read("index.py").decode()
+
+
+def test_architecture_tools_reuse_one_llm_client(monkeypatch):
+    import core.llm_config
+
+    created = []
+
+    def fake_initialize_llm(provider, **kwargs):
+        if not created:
+            created.append(None)
+            raise RuntimeError("no credentials yet")
+        created.append((provider, kwargs))
+        return object()
+
+    monkeypatch.setattr(core.llm_config, "initialize_llm", fake_initialize_llm)
+    server = MCPAWSManagerServer()
+
+    assert server._get_llm("claude", temperature=0) is None
+    first = server._get_llm("claude", temperature=0)
+    assert first is not None
+    assert server._get_llm("claude", temperature=0) is first
+    assert created[1:] == [("claude", {"temperature": 0})]
+
+
+def test_lambda_payload_zip_is_built_once_and_stable():
+    from mcp_servers import aws_terraform_server
+
+    assert aws_terraform_server._build_lambda_payload_zip() == aws_terraform_server.LAMBDA_PAYLOAD_ZIP
+
+
+def _architecture_server(tmp_path, monkeypatch, generated):
+    server = MCPAWSManagerServer()
+    server.terraform = TerraformManager(workspace_dir=str(tmp_path))
+    monkeypatch.setattr(server, "_get_llm", lambda *_a, **_k: object())
+    monkeypatch.setattr(ArchitectureParser, "architecture_to_terraform", lambda _self, _arch: generated)
+    init_calls = []
+
+    def fake_init(project):
+        init_calls.append((project, (tmp_path / project / "main.tf").read_text()))
+        return {"success": True}
+
+    monkeypatch.setattr(server.terraform, "init", fake_init)
+    monkeypatch.setattr(server.terraform, "plan", lambda _project: {"success": True})
+    return server, init_calls
+
+
+def test_deploy_architecture_installs_providers_while_generating(tmp_path, monkeypatch):
+    generated = {"success": True, "project_name": "web_app", "terraform_code": 'resource "aws_s3_bucket" "b" {}'}
+    server, init_calls = _architecture_server(tmp_path, monkeypatch, generated)
+
+    result = server._deploy_architecture({"architecture": {"description": "Web App"}})
+
+    assert result["success"] is True
+    assert [project for project, _ in init_calls] == ["web_app", "web_app"]
+    assert 'source  = "hashicorp/aws"' in init_calls[0][1]
+    assert init_calls[1][1] == generated["terraform_code"]
+
+
+def test_deploy_architecture_removes_warmup_project_when_generation_fails(tmp_path, monkeypatch):
+    server, _ = _architecture_server(tmp_path, monkeypatch, {"success": False, "error": "LLM unavailable"})
+
+    result = server._deploy_architecture({"architecture": {"description": "Web App"}})
+
+    assert result == {"success": False, "error": "LLM unavailable"}
+    assert not (tmp_path / "web_app").exists()
+
+
+def test_deploy_architecture_leaves_existing_projects_untouched_on_failure(tmp_path, monkeypatch):
+    (tmp_path / "web_app").mkdir()
+    (tmp_path / "web_app" / "main.tf").write_text("existing")
+    server, init_calls = _architecture_server(tmp_path, monkeypatch, {"success": False, "error": "LLM unavailable"})
+
+    server._deploy_architecture({"architecture": {"description": "Web App"}})
+
+    assert init_calls == []
+    assert (tmp_path / "web_app" / "main.tf").read_text() == "existing"
@@ -1,9 +1,15 @@
 """Unit tests for MCP read-only inventory/list/describe tools."""
 
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
 
+from mcp_servers.aws_terraform import clients
 from mcp_servers.aws_terraform_server import MCPAWSManagerServer
 
 
@@ -15,7 +21,9 @@ def server():
 
 
 def test_readonly_tools_are_exposed(server):
-    tool_names = {tool["name"] for tool in server.list_tools()}
+    names = [tool["name"] for tool in server.list_tools()]
+    tool_names = set(names)
+    assert len(names) == len(tool_names)
     assert "list_account_inventory" in tool_names
     assert "get_cost_explorer_summary" in tool_names
     assert "list_aws_resources" in tool_names
@@ -61,6 +69,8 @@ def test_list_account_inventory_summarizes_counts(server, monkeypatch):
         region = params.get("region")
         if rtype == "s3":
             return {"success": True, "count": 2, "items": []}
+        if rtype == "rds" and region == "us-east-1":
+            return {"success": False, "error": "AccessDenied"}
         per_region = {"ec2": 3, "vpc": 1, "rds": 0, "lambda": 4, "ecs": 2}
         return {"success": True, "resource_type": rtype, "region": region, "count": per_region[rtype], "items": []}
 
@@ -75,25 +85,59 @@ def test_list_account_inventory_summarizes_counts(server, monkeypatch):
     assert result["summary"]["lambda"] == 8
     assert result["summary"]["ecs"] == 4
     assert len(result["regional_breakdown"]) == 2
+    assert result["regions_succeeded"] == 1
+    assert result["regional_breakdown"][1]["errors"] == {"rds": "AccessDenied"}
 
 
 def test_list_aws_resources_s3_with_mocked_boto(server, monkeypatch):
     fake_s3 = MagicMock()
-    fake_s3.list_buckets.return_value = {
-        "Buckets": [{"Name": "bucket-a", "CreationDate": "2026-01-01"}]
-    }
+    fake_s3.get_paginator.return_value.paginate.return_value = [
+        {"Buckets": [{"Name": "bucket-a", "CreationDate": "2026-01-01"}]}
+    ]
 
     def fake_client(service_name, region_name=None):
         assert service_name == "s3"
         return fake_s3
 
-    monkeypatch.setattr("mcp_servers.aws_terraform_server.boto3.client", fake_client)
+    monkeypatch.setattr("mcp_servers.aws_terraform_server.get_aws_client", fake_client)
     result = server._list_aws_resources({"resource_type": "s3"})
     assert result["success"] is True
     assert result["count"] == 1
     assert result["items"][0]["name"] == "bucket-a"
 
 
+def test_list_aws_resources_s3_resolves_missing_regions_and_formats_dates(server, monkeypatch):
+    fake_s3 = MagicMock()
+    fake_s3.get_paginator.return_value.paginate.return_value = [
+        {"Buckets": [
+            {"Name": "bucket-a", "CreationDate": datetime(2026, 1, 1, tzinfo=timezone.utc), "BucketRegion": "ap-south-1"},
+            {"Name": "bucket-b", "CreationDate": "2026-01-02"},
+            {"Name": "bucket-c"},
+        ]}
+    ]
+    fake_s3.get_bucket_location.side_effect = lambda Bucket: {"LocationConstraint": "eu-west-1" if Bucket == "bucket-b" else None}
+    monkeypatch.setattr("mcp_servers.aws_terraform_server.get_aws_client", lambda *_a, **_k: fake_s3)
+
+    result = server._list_aws_resources({"resource_type": "s3", "include_regions": True})
+
+    assert [b["region"] for b in result["items"]] == ["ap-south-1", "eu-west-1", "us-east-1"]
+    assert fake_s3.get_bucket_location.call_count == 2
+    assert [b["created"] for b in result["items"]] == ["2026-01-01T00:00:00+00:00", "2026-01-02", "N/A"]
+
+
+def test_list_aws_resources_s3_skips_region_lookups_by_default(server, monkeypatch):
+    fake_s3 = MagicMock()
+    fake_s3.get_paginator.return_value.paginate.return_value = [
+        {"Buckets": [{"Name": "bucket-a", "BucketRegion": "ap-south-1"}, {"Name": "bucket-b"}]}
+    ]
+    monkeypatch.setattr("mcp_servers.aws_terraform_server.get_aws_client", lambda *_a, **_k: fake_s3)
+
+    result = server._list_aws_resources({"resource_type": "s3"})
+
+    assert [b["region"] for b in result["items"]] == ["ap-south-1", None]
+    fake_s3.get_bucket_location.assert_not_called()
+
+
 def test_cost_summary_uses_group_totals_when_total_is_empty(server, monkeypatch):
     fake_ce = MagicMock()
     fake_ce.get_cost_and_usage.return_value = {
@@ -114,10 +158,234 @@ def test_cost_summary_uses_group_totals_when_total_is_empty(server, monkeypatch)
         assert region_name == "us-east-1"
         return fake_ce
 
-    monkeypatch.setattr("mcp_servers.aws_terraform_server.boto3.client", fake_client)
+    monkeypatch.setattr("mcp_servers.aws_terraform_server.get_aws_client", fake_client)
     result = server._get_cost_explorer_summary(
         {"start_date": "2026-02-01", "end_date": "2026-02-24", "granularity": "MONTHLY"}
     )
     assert result["success"] is True
     assert result["total_cost"]["amount"] == 0.89
     assert result["service_count"] == 2
+
+
+def test_list_tools_json_bytes_is_cached_and_matches_list_tools(server):
+    payload = server.list_tools_json_bytes()
+    assert json.loads(payload) == server.list_tools()
+    assert server.list_tools_json_bytes() is payload
+    assert server.list_tools() is MCPAWSManagerServer().list_tools()
+
+
+def test_list_aws_resources_ec2_reads_every_page(server, monkeypatch):
+    fake_ec2 = MagicMock()
+    fake_ec2.get_paginator.return_value.paginate.return_value = [
+        {"Reservations": [{"Instances": [{"InstanceId": "i-1", "State": {"Name": "running"}}]}]},
+        {"Reservations": [{"Instances": [{"InstanceId": "i-2", "State": {"Name": "stopped"}}]}]},
+    ]
+    monkeypatch.setattr("mcp_servers.aws_terraform_server.get_aws_client", lambda *_a, **_k: fake_ec2)
+
+    result = server._list_aws_resources({"resource_type": "ec2", "region": "ap-south-1"})
+
+    assert result["success"] is True
+    assert [i["instance_id"] for i in result["items"]] == ["i-1", "i-2"]
+    fake_ec2.get_paginator.assert_called_once_with("describe_instances")
+
+
+def test_get_aws_client_reuses_clients_per_service_and_region(monkeypatch):
+    created = []
+
+    def fake_create(service_name, region_name=None):
+        created.append((service_name, region_name))
+        return object()
+
+    monkeypatch.setattr(clients, "create_aws_client", fake_create)
+    clients.reset_aws_session()
+
+    first = clients.get_aws_client("ec2", "ap-south-1")
+    assert clients.get_aws_client("ec2", "ap-south-1") is first
+    assert clients.get_aws_client("ec2", "us-east-1") is not first
+    assert created == [("ec2", "ap-south-1"), ("ec2", "us-east-1")]
+
+    clients.reset_aws_session()
+    assert clients.get_aws_client("ec2", "ap-south-1") is not first
+
+
+def test_read_results_are_cached_until_infrastructure_changes(server, monkeypatch):
+    calls = []
+
+    def fake_uncached(params):
+        calls.append(params)
+        return {"success": True, "resource_type": params["resource_type"], "count": 0, "items": []}
+
+    monkeypatch.setattr(server, "_list_aws_resources_uncached", fake_uncached)
+    monkeypatch.setattr(server.terraform, "apply", lambda project_name, auto_approve: {"success": True})
+
+    server.execute_tool("list_aws_resources", {"resource_type": "ec2", "region": "ap-south-1"})
+    server.execute_tool("list_aws_resources", {"resource_type": "ec2", "region": "ap-south-1"})
+    assert len(calls) == 1
+
+    server.execute_tool("terraform_apply", {"project_name": "ec2_project"})
+    server.execute_tool("list_aws_resources", {"resource_type": "ec2", "region": "ap-south-1"})
+    assert len(calls) == 2
+
+
+def test_cached_reads_return_private_copies(server, monkeypatch):
+    monkeypatch.setattr(
+        server,
+        "_list_aws_resources_uncached",
+        lambda _params: {"success": True, "count": 1, "items": [{"vpc_id": "vpc-1"}]},
+    )
+
+    first = server._list_aws_resources({"resource_type": "vpc"})
+    first["items"].append({"vpc_id": "vpc-injected"})
+    second = server._list_aws_resources({"resource_type": "vpc"})
+    second["items"][0]["vpc_id"] = "vpc-changed"
+
+    assert server._list_aws_resources({"resource_type": "vpc"})["items"] == [{"vpc_id": "vpc-1"}]
+
+
+def test_failed_reads_are_not_cached(server, monkeypatch):
+    calls = []
+
+    def fake_uncached(params):
+        calls.append(params)
+        return {"success": False, "error": "throttled"}
+
+    monkeypatch.setattr(server, "_list_aws_resources_uncached", fake_uncached)
+
+    server._list_aws_resources({"resource_type": "vpc"})
+    server._list_aws_resources({"resource_type": "vpc"})
+    assert len(calls) == 2
+
+
+def test_concurrent_identical_reads_share_one_fetch(server, monkeypatch):
+    release = threading.Event()
+    calls = []
+
+    def fake_uncached(params):
+        calls.append(params)
+        release.wait(5)
+        return {"success": False, "error": "throttled"}
+
+    monkeypatch.setattr(server, "_list_aws_resources_uncached", fake_uncached)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(server._list_aws_resources, {"resource_type": "vpc"}) for _ in range(4)]
+        while not calls:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert all(r == {"success": False, "error": "throttled"} for r in results)
+    assert len({id(r) for r in results}) == len(results)
+    assert server._inflight_reads == {}
+
+
+def test_describe_resource_dispatches_by_type_and_infers_bare_ids(server, monkeypatch):
+    fake_ec2 = MagicMock()
+    fake_ec2.describe_vpcs.return_value = {"Vpcs": [{"VpcId": "vpc-123", "CidrBlock": "10.0.0.0/16"}]}
+    monkeypatch.setattr("mcp_servers.aws_terraform_server.get_aws_client", lambda *_a, **_k: fake_ec2)
+
+    explicit = server._describe_resource({"resource_type": "vpc", "resource_id": "vpc-123", "region": "ap-south-1"})
+    inferred = server._describe_resource_uncached({"resource_id": "vpc-123", "region": "ap-south-1"})
+    unsupported = server._describe_resource({"resource_type": "sqs", "resource_id": "queue"})
+
+    assert explicit["success"] is True
+    assert explicit["details"]["CidrBlock"] == "10.0.0.0/16"
+    assert inferred["resource_type"] == "vpc"
+    assert unsupported == {"success": False, "error": "Unsupported resource_type 'sqs'"}
+
+
+def test_allowed_regions_are_cached_between_inventories(server, monkeypatch):
+    fake_ec2 = MagicMock()
+    fake_ec2.describe_regions.return_value = {"Regions": [{"RegionName": "us-east-1"}, {"RegionName": "ap-south-1"}]}
+    monkeypatch.setattr("mcp_servers.aws_terraform.rbac.get_aws_client", lambda *_a, **_k: fake_ec2)
+
+    first = server.rbac.get_allowed_regions()
+    first.append("mutated-by-caller")
+
+    assert server.rbac.get_allowed_regions() == ["us-east-1", "ap-south-1"]
+    assert fake_ec2.describe_regions.call_count == 1
+
+
+def test_list_aws_resources_rejects_unsupported_type_without_aws_calls(server, monkeypatch):
+    def fail_client(*_args, **_kwargs):
+        raise AssertionError("no client should be created")
+
+    monkeypatch.setattr("mcp_servers.aws_terraform_server.get_aws_client", fail_client)
+    result = server._list_aws_resources({"resource_type": "sqs"})
+    assert result == {"success": False, "error": "Unsupported resource_type 'sqs'"}
+
+
+def test_cost_summary_rejects_malformed_dates(server):
+    result = server._get_cost_explorer_summary({"start_date": "2026-02-31", "end_date": "2026-03-01"})
+    assert result == {"success": False, "error": "Invalid date format. Use YYYY-MM-DD for start_date/end_date."}
+
+
+def test_every_tool_handler_resolves_to_a_method(server):
+    published = {tool["name"] for tool in server.list_tools()}
+    for tool_name, method_name in MCPAWSManagerServer._TOOL_HANDLERS.items():
+        assert tool_name in published
+        assert callable(getattr(server, method_name))
+    assert server.execute_tool("no_such_tool", {}) == {"success": False, "error": "Unknown tool: no_such_tool"}
+
+
+def test_cost_summary_accumulates_services_across_daily_periods(server, monkeypatch):
+    def day(s3_amount, ecs_amount):
+        return {
+            "Total": {},
+            "Groups": [
+                {"Keys": ["Amazon S3"], "Metrics": {"UnblendedCost": {"Amount": s3_amount, "Unit": "USD"}}},
+                {"Keys": ["Amazon ECS"], "Metrics": {"UnblendedCost": {"Amount": ecs_amount, "Unit": "USD"}}},
+            ],
+        }
+
+    fake_ce = MagicMock()
+    fake_ce.get_cost_and_usage.return_value = {"ResultsByTime": [day("0.10", "1.00"), day("0.20", "2.00"), day("0.30", "0")]}
+    monkeypatch.setattr("mcp_servers.aws_terraform_server.get_aws_client", lambda *_a, **_k: fake_ce)
+
+    result = server._get_cost_explorer_summary({"start_date": "2026-02-01", "end_date": "2026-02-04", "granularity": "DAILY"})
+
+    assert result["total_cost"]["amount"] == 3.6
+    assert result["services"] == [
+        {"service": "Amazon ECS", "amount": 3.0, "currency": "USD"},
+        {"service": "Amazon S3", "amount": 0.6, "currency": "USD"},
+    ]
+
+
+def test_cost_summary_top_n_limits_breakdown(server, monkeypatch):
+    fake_ce = MagicMock()
+    fake_ce.get_cost_and_usage.return_value = {
+        "ResultsByTime": [
+            {
+                "Total": {},
+                "Groups": [
+                    {"Keys": [name], "Metrics": {"UnblendedCost": {"Amount": amount, "Unit": "USD"}}}
+                    for name, amount in [("Amazon S3", "0.40"), ("Amazon ECS", "0.49"), ("AWS Lambda", "0.05")]
+                ],
+            }
+        ]
+    }
+    monkeypatch.setattr("mcp_servers.aws_terraform_server.get_aws_client", lambda *_a, **_k: fake_ce)
+
+    result = server._get_cost_explorer_summary({"start_date": "2026-02-01", "end_date": "2026-02-24", "top_n": 2})
+
+    assert [s["service"] for s in result["services"]] == ["Amazon ECS", "Amazon S3"]
+    assert result["service_count"] == 3
+    assert server._get_cost_explorer_summary({"top_n": 0})["success"] is False
+
+
+def test_describe_ecs_splits_cluster_service_but_not_arns(server, monkeypatch):
+    fake_ecs = MagicMock()
+    fake_ecs.describe_services.return_value = {"services": [{"serviceName": "web"}]}
+    fake_ecs.describe_clusters.return_value = {"clusters": [{"clusterName": "prod"}]}
+    monkeypatch.setattr("mcp_servers.aws_terraform_server.get_aws_client", lambda *_a, **_k: fake_ecs)
+
+    service = server._describe_resource_uncached({"resource_type": "ecs", "resource_id": "prod/web"})
+    cluster_arn = "arn:aws:ecs:ap-south-1:123456789012:cluster/prod"
+    cluster = server._describe_resource_uncached({"resource_type": "ecs", "resource_id": cluster_arn})
+
+    fake_ecs.describe_services.assert_called_once_with(cluster="prod", services=["web"])
+    fake_ecs.describe_clusters.assert_called_once_with(clusters=[cluster_arn])
+    assert service["details"] == {"serviceName": "web"}
+    assert cluster["details"] == {"clusterName": "prod"}
@@ -0,0 +1,116 @@
+"""Unit tests for AWS RBAC permission checks."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_servers.aws_terraform.rbac import AWSRBACManager
+
+
+@pytest.fixture
+def rbac():
+    manager = AWSRBACManager()
+    manager.identity = {"Arn": "arn:aws:iam::123456789012:user/test"}
+    manager.iam_client = MagicMock()
+    return manager
+
+
+def _decision(decision):
+    return {"EvaluationResults": [{"EvalDecision": decision}]}
+
+
+def test_check_permission_caches_simulation_per_principal_and_action(rbac):
+    rbac.iam_client.simulate_principal_policy.side_effect = [_decision("allowed"), _decision("implicitDeny")]
+
+    assert rbac.check_permission("ecs:CreateCluster") is True
+    assert rbac.check_permission("ecs:CreateCluster") is True
+    assert rbac.check_permission("ecs:CreateService") is False
+    assert rbac.check_permission("ecs:CreateService") is False
+    assert rbac.iam_client.simulate_principal_policy.call_count == 2
+
+
+def test_check_permission_does_not_cache_failed_simulations(rbac):
+    rbac.iam_client.simulate_principal_policy.side_effect = [RuntimeError("throttled"), _decision("implicitDeny")]
+
+    assert rbac.check_permission("ec2:RunInstances") is True
+    assert rbac.check_permission("ec2:RunInstances") is False
+
+    rbac.identity = {"Arn": "arn:aws:iam::123456789012:user/other"}
+    rbac.iam_client.simulate_principal_policy.side_effect = [_decision("allowed")]
+    assert rbac.check_permission("ec2:RunInstances") is True
+
+
+def test_check_permissions_batches_uncached_actions_into_one_call(rbac):
+    rbac.iam_client.simulate_principal_policy.side_effect = [
+        _decision("allowed"),
+        {
+            "EvaluationResults": [
+                {"EvalActionName": "ecs:RegisterTaskDefinition", "EvalDecision": "allowed"},
+                {"EvalActionName": "ecs:CreateService", "EvalDecision": "explicitDeny"},
+            ]
+        },
+    ]
+    assert rbac.check_permission("ecs:CreateCluster") is True
+
+    result = rbac.check_permissions(["ecs:CreateCluster", "ecs:RegisterTaskDefinition", "ecs:CreateService"])
+
+    assert result == {"ecs:CreateCluster": True, "ecs:RegisterTaskDefinition": True, "ecs:CreateService": False}
+    batched_call = rbac.iam_client.simulate_principal_policy.call_args_list[1]
+    assert batched_call.kwargs["ActionNames"] == ["ecs:RegisterTaskDefinition", "ecs:CreateService"]
+
+
+def _credentials_session(access_key, seconds_left=None):
+    session = MagicMock(region_name="ap-south-1")
+    creds = session.get_credentials.return_value
+    creds.get_frozen_credentials.return_value = MagicMock(access_key=access_key, secret_key="secret", token=None)
+    creds.refresh_needed.side_effect = lambda refresh_in: seconds_left is not None and seconds_left < refresh_in
+    return session
+
+
+def test_credentials_env_is_built_once(rbac, monkeypatch):
+    get_session = MagicMock(return_value=_credentials_session("AKIA"))
+    monkeypatch.setattr("mcp_servers.aws_terraform.rbac.get_aws_session", get_session)
+
+    first = rbac.get_credentials_env()
+    second = rbac.get_credentials_env()
+
+    assert first == second == {
+        "AWS_ACCESS_KEY_ID": "AKIA",
+        "AWS_SECRET_ACCESS_KEY": "secret",
+        "AWS_REGION": "ap-south-1",
+        "AWS_DEFAULT_REGION": "ap-south-1",
+    }
+    assert get_session.call_count == 1
+
+
+def test_expiring_credentials_refresh_in_background(rbac, monkeypatch):
+    sessions = [_credentials_session("OLD", seconds_left=12 * 60), _credentials_session("NEW")]
+    monkeypatch.setattr("mcp_servers.aws_terraform.rbac.get_aws_session", lambda: sessions.pop(0))
+    started = []
+    monkeypatch.setattr(
+        "mcp_servers.aws_terraform.rbac.threading.Thread",
+        lambda target, **_kwargs: MagicMock(start=lambda: started.append(target)),
+    )
+
+    assert rbac.get_credentials_env()["AWS_ACCESS_KEY_ID"] == "OLD"
+    # Still served from cache while the refresh is pending.
+    assert rbac.get_credentials_env()["AWS_ACCESS_KEY_ID"] == "OLD"
+    assert rbac.get_credentials_env()["AWS_ACCESS_KEY_ID"] == "OLD"
+    assert len(started) == 1
+
+    started[0]()
+    assert rbac.get_credentials_env()["AWS_ACCESS_KEY_ID"] == "NEW"
+
+
+def test_expired_credentials_refresh_before_returning(rbac, monkeypatch):
+    sessions = [_credentials_session("OLD", seconds_left=-60), _credentials_session("NEW")]
+    monkeypatch.setattr("mcp_servers.aws_terraform.rbac.get_aws_session", lambda: sessions.pop(0))
+    started = []
+    monkeypatch.setattr(
+        "mcp_servers.aws_terraform.rbac.threading.Thread",
+        lambda target, **_kwargs: MagicMock(start=lambda: started.append(target)),
+    )
+
+    assert rbac.get_credentials_env()["AWS_ACCESS_KEY_ID"] == "OLD"
+    assert rbac.get_credentials_env()["AWS_ACCESS_KEY_ID"] == "NEW"
+    assert started == []
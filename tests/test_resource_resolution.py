@@ -0,0 +1,107 @@
+"""Unit tests for resource identifier parsing and project resolution."""
+
+import json
+
+import pytest
+
+from mcp_servers.aws_terraform import TerraformStateIndex
+from mcp_servers.aws_terraform_server import MCPAWSManagerServer
+
+
+@pytest.fixture
+def server():
+    s = MCPAWSManagerServer()
+    s.rbac.identity = {"Arn": "arn:aws:iam::123456789012:user/test"}
+    return s
+
+
+def test_parse_arn_keeps_colons_in_resource_part(server):
+    parsed = server._parse_resource_identifier("arn:aws:rds:ap-south-1:123456789012:db:orders-db")
+    assert parsed == {
+        "service": "rds",
+        "resource_type": "unknown",
+        "resource_id": "db:orders-db",
+        "region": "ap-south-1",
+        "account": "123456789012",
+    }
+
+
+def test_parse_arn_with_slash_and_empty_region(server):
+    parsed = server._parse_resource_identifier("arn:aws:s3:::my-bucket")
+    assert parsed["service"] == "s3"
+    assert parsed["resource_type"] == "bucket"
+    assert parsed["resource_id"] == "my-bucket"
+    assert parsed["region"] is None
+
+    parsed = server._parse_resource_identifier("arn:aws:ec2:ap-south-1:123456789012:instance/i-0abc")
+    assert (parsed["resource_type"], parsed["resource_id"]) == ("instance", "i-0abc")
+
+
+def test_parse_resource_id_prefixes(server):
+    assert server._parse_resource_identifier("sg-123")["resource_type"] == "security-group"
+    assert server._parse_resource_identifier("subnet-123")["resource_type"] == "subnet"
+    assert server._parse_resource_identifier("arn:aws:ec2") is None
+    assert server._parse_resource_identifier("my-bucket") is None
+
+
+def _write_state(project_dir, attributes):
+    project_dir.mkdir(exist_ok=True)
+    state = {"resources": [{"type": "aws_instance", "instances": [{"attributes": attributes}]}]}
+    (project_dir / "terraform.tfstate").write_text(json.dumps(state))
+
+
+def test_find_project_by_resource_id_uses_state_index(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(server.terraform, "workspace_dir", tmp_path)
+    server.state_index = TerraformStateIndex(tmp_path)
+    _write_state(tmp_path / "ec2_web", {"id": "i-0abc", "arn": "arn:aws:ec2:ap-south-1:123456789012:instance/i-0abc"})
+    _write_state(tmp_path / "s3_logs", {"id": "logs-bucket", "bucket": "logs-bucket"})
+
+    assert server._find_project_by_resource_id("i-0abc") == "ec2_web"
+    assert server._find_project_by_resource_id("arn:aws:s3:::logs-bucket") == "s3_logs"
+    assert server._find_project_by_resource_id("i-missing") is None
+
+
+def test_state_index_reparses_only_changed_state_files(tmp_path, monkeypatch):
+    index = TerraformStateIndex(tmp_path)
+    _write_state(tmp_path / "ec2_web", {"id": "i-0abc"})
+    _write_state(tmp_path / "ec2_api", {"id": "i-0def"})
+
+    parsed = []
+    original = TerraformStateIndex._read_state_keys
+    monkeypatch.setattr(TerraformStateIndex, "_read_state_keys", staticmethod(lambda path: parsed.append(path) or original(path)))
+
+    assert index.find([("id", "i-0abc")]) == ("ec2_web", ("id", "i-0abc"))
+    assert index.find([("id", "i-0def")]) == ("ec2_api", ("id", "i-0def"))
+    assert len(parsed) == 2
+
+    _write_state(tmp_path / "ec2_web", {"id": "i-0new-instance"})
+    assert index.find([("id", "i-0abc")]) is None
+    assert index.find([("id", "i-0new-instance")]) == ("ec2_web", ("id", "i-0new-instance"))
+    assert len(parsed) == 3
+
+
+def test_state_index_skips_unreadable_state_files(tmp_path):
+    index = TerraformStateIndex(tmp_path)
+    (tmp_path / "broken").mkdir()
+    (tmp_path / "broken" / "terraform.tfstate").write_bytes(b"{not json")
+    _write_state(tmp_path / "rds_orders", {"id": "orders-db", "identifier": "orders-db"})
+
+    assert index.find([("identifier", "orders-db")]) == ("rds_orders", ("identifier", "orders-db"))
+
+
+def test_resolve_project_name_checks_prefixed_project_names(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(server.terraform, "workspace_dir", tmp_path)
+    (tmp_path / "ec2_t3.micro_ap-south-1").mkdir()
+
+    assert server._resolve_project_name("ec2_t3.micro_ap-south-1") == "ec2_t3.micro_ap-south-1"
+    assert server._resolve_project_name("t3.micro_ap-south-1") == "ec2_t3.micro_ap-south-1"
+
+
+def test_parse_resource_identifier_is_memoized_but_returns_copies(server):
+    server._parse_resource_identifier_cached.cache_clear()
+    first = server._parse_resource_identifier("vpc-0abc")
+    first["resource_id"] = "mutated"
+
+    second = server._parse_resource_identifier("vpc-0abc")
+    assert second["resource_id"] == "vpc-0abc"
+    assert server._parse_resource_identifier_cached.cache_info().hits == 1
@@ -1,6 +1,14 @@
 """Unit tests for Terraform manager apply guardrails."""
 
-from mcp_servers.aws_terraform.terraform import TerraformManager
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_servers.aws_terraform.terraform import DEFAULT_PARALLELISM, TerraformManager, _default_parallelism, run_captured
 
 
 def test_apply_reports_projects_with_existing_tfplan(tmp_path):
@@ -37,3 +45,261 @@ def test_apply_adds_hint_for_missing_default_vpc(tmp_path):
     assert "VPCIdNotSpecified" in result["error"]
     assert "Hint:" in result["error"]
     assert "create_vpc" in result["error"]
+
+
+def test_plan_and_apply_commands_set_parallelism(tmp_path):
+    manager = TerraformManager(workspace_dir=str(tmp_path))
+    (tmp_path / "vpc_project").mkdir()
+    commands = []
+    manager._run_terraform = lambda cmd, _cwd: commands.append(cmd) or {"success": True}  # type: ignore[method-assign]
+
+    manager.plan("vpc_project")
+    (tmp_path / "vpc_project" / "tfplan").write_text("plan")
+    manager.apply("vpc_project", parallelism=4)
+
+    assert f"-parallelism={DEFAULT_PARALLELISM}" in commands[0]
+    assert commands[1] == ["terraform", "apply", "-input=false", "-parallelism=4", "tfplan"]
+
+
+def test_default_parallelism_tolerates_bad_settings_and_caps_large_hosts(monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 64)
+    monkeypatch.delenv("TERRAFORM_PARALLELISM", raising=False)
+    assert _default_parallelism() == 32
+
+    monkeypatch.setenv("TERRAFORM_PARALLELISM", "auto")
+    assert _default_parallelism() == 32
+    monkeypatch.setenv("TERRAFORM_PARALLELISM", "-1")
+    assert _default_parallelism() == 1
+    monkeypatch.setenv("TERRAFORM_PARALLELISM", "48")
+    assert _default_parallelism() == 48
+
+
+def test_plan_and_apply_runs_one_process_and_summarizes_events(tmp_path):
+    manager = TerraformManager(workspace_dir=str(tmp_path))
+    (tmp_path / "s3_project").mkdir()
+    (tmp_path / "s3_project" / "tfplan").write_text("stale-plan")
+    events = [
+        {"type": "version", "terraform": "1.7.0"},
+        {"type": "planned_change", "change": {"resource": {"addr": "aws_s3_bucket.b"}, "action": "create"}},
+        {"type": "change_summary", "changes": {"add": 1, "change": 0, "remove": 0, "operation": "plan"}},
+        {"type": "apply_complete", "hook": {"resource": {"addr": "aws_s3_bucket.b"}}},
+        {"type": "change_summary", "changes": {"add": 1, "change": 0, "remove": 0, "operation": "apply"}},
+    ]
+    commands = []
+
+    def _fake_run(cmd, _cwd):
+        commands.append(cmd)
+        return {"success": True, "stdout": "\n".join(json.dumps(e) for e in events), "stderr": "", "returncode": 0}
+
+    manager._run_terraform = _fake_run  # type: ignore[method-assign]
+    result = manager.plan_and_apply("s3_project")
+
+    assert commands == [["terraform", "apply", "-auto-approve", "-input=false", "-json", f"-parallelism={DEFAULT_PARALLELISM}"]]
+    assert result["success"] is True
+    assert result["planned_changes"] == [{"resource": "aws_s3_bucket.b", "action": "create"}]
+    assert result["plan_summary"]["add"] == 1
+    assert result["apply_summary"]["operation"] == "apply"
+    assert not (tmp_path / "s3_project" / "tfplan").exists()
+
+
+def test_plan_and_apply_reports_error_diagnostics(tmp_path):
+    manager = TerraformManager(workspace_dir=str(tmp_path))
+    (tmp_path / "s3_project").mkdir()
+    diagnostic = {"type": "diagnostic", "diagnostic": {"severity": "error", "summary": "BucketAlreadyExists", "detail": ""}}
+
+    def _fake_run(_cmd, _cwd):
+        return {"success": False, "stdout": json.dumps(diagnostic), "stderr": "", "error": "", "returncode": 1}
+
+    manager._run_terraform = _fake_run  # type: ignore[method-assign]
+    result = manager.plan_and_apply("s3_project")
+
+    assert result["success"] is False
+    assert result["error"] == "BucketAlreadyExists"
+    assert manager.plan_and_apply("missing_project")["success"] is False
+
+
+def test_project_names_relists_only_when_workspace_changes(tmp_path, monkeypatch):
+    manager = TerraformManager(workspace_dir=str(tmp_path))
+    (tmp_path / "ec2_web").mkdir()
+    (tmp_path / "notes.txt").write_text("not a project")
+
+    assert manager.project_names() == {"ec2_web"}
+
+    scans = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda path: scans.append(path) or real_scandir(path))
+    assert manager.project_names() == {"ec2_web"}
+    assert scans == []
+
+    (tmp_path / "s3_logs").mkdir()
+    os.utime(tmp_path, ns=(0, tmp_path.stat().st_mtime_ns + 1_000_000))
+    assert manager.project_names() == {"ec2_web", "s3_logs"}
+    assert len(scans) == 1
+
+
+def test_init_new_project_never_overwrites_existing_projects(tmp_path, monkeypatch):
+    manager = TerraformManager(workspace_dir=str(tmp_path))
+    init_calls = []
+    monkeypatch.setattr(manager, "init", lambda project: init_calls.append(project) or {"success": True})
+    (tmp_path / "existing").mkdir()
+    (tmp_path / "existing" / "main.tf").write_text("existing")
+
+    assert manager.init_new_project("existing", {"main.tf": "skeleton"}) is None
+    assert manager.init_new_project("fresh", {"main.tf": "skeleton"}) == {"success": True}
+
+    assert init_calls == ["fresh"]
+    assert (tmp_path / "existing" / "main.tf").read_text() == "existing"
+    assert (tmp_path / "fresh" / "main.tf").read_text() == "skeleton"
+
+
+def test_run_captured_keeps_tail_of_both_streams(tmp_path):
+    script = "import sys\nfor i in range(50000):\n    print(i)\nsys.stderr.write('boom\\n')\nsys.exit(3)"
+    result = run_captured([sys.executable, "-c", script], cwd=tmp_path, max_lines=100)
+
+    assert result.returncode == 3
+    assert result.stdout.splitlines() == [str(i) for i in range(49900, 50000)]
+    assert result.stderr == "boom\n"
+
+
+def test_run_captured_times_out(tmp_path):
+    with pytest.raises(subprocess.TimeoutExpired):
+        run_captured([sys.executable, "-c", "import time; time.sleep(10)"], cwd=tmp_path, timeout=0.2)
+
+
+def test_subprocess_env_only_copies_environ_when_injecting_credentials(tmp_path, monkeypatch):
+    monkeypatch.setenv("AWS_PROFILE", "dev")
+    monkeypatch.delenv("TF_PLUGIN_CACHE_DIR", raising=False)
+    rbac = MagicMock()
+    rbac.get_credentials_env.return_value = {}
+    manager = TerraformManager(workspace_dir=str(tmp_path), rbac_manager=rbac)
+
+    assert TerraformManager(workspace_dir=str(tmp_path))._subprocess_env() is None
+    assert manager._subprocess_env() is None
+
+    rbac.get_credentials_env.return_value = {"AWS_ACCESS_KEY_ID": "AKIA"}
+    env = manager._subprocess_env()
+    assert env["AWS_ACCESS_KEY_ID"] == "AKIA"
+    assert "AWS_PROFILE" not in env
+    assert env["PATH"] == os.environ["PATH"]
+
+
+def test_show_state_parses_output_bytes(tmp_path, monkeypatch):
+    manager = TerraformManager(workspace_dir=str(tmp_path))
+    (tmp_path / "vpc_project").mkdir()
+    calls = []
+
+    def fake_run_captured(cmd, **kwargs):
+        calls.append(kwargs)
+        return subprocess.CompletedProcess(cmd, 0, b'{"values": {"root_module": {"resources": []}}}', b"")
+
+    monkeypatch.setattr("mcp_servers.aws_terraform.terraform.run_captured", fake_run_captured)
+    result = manager.show_state("vpc_project")
+
+    assert result == {"success": True, "state": {"values": {"root_module": {"resources": []}}}}
+    assert calls[0]["text"] is False
+    assert calls[0]["max_lines"] is None
+
+
+def test_init_is_skipped_while_configuration_is_unchanged(tmp_path):
+    manager = TerraformManager(workspace_dir=str(tmp_path))
+    manager.write_project("s3_project", {"main.tf": 'resource "aws_s3_bucket" "b" {}'})
+    commands = []
+
+    def _fake_run(cmd, cwd, env_overlay=None):
+        commands.append(cmd)
+        (cwd / ".terraform").mkdir(exist_ok=True)
+        return {"success": True}
+
+    manager._run_terraform = _fake_run  # type: ignore[method-assign]
+
+    assert manager.init("s3_project") == {"success": True}
+    assert manager.init("s3_project") == {"success": True, "cached": True}
+    assert len(commands) == 1
+
+    manager.write_project("s3_project", {"main.tf": 'resource "aws_s3_bucket" "c" {}'})
+    assert manager.init("s3_project") == {"success": True}
+    assert len(commands) == 2
+
+
+def test_plan_reuses_fresh_saved_plan_until_inputs_change(tmp_path):
+    manager = TerraformManager(workspace_dir=str(tmp_path))
+    manager.write_project("vpc_project", {"main.tf": 'resource "aws_vpc" "v" {}'})
+    project = tmp_path / "vpc_project"
+    commands = []
+
+    def _fake_run(cmd, cwd):
+        commands.append(cmd)
+        if cmd[1] == "plan":
+            (cwd / "tfplan").write_text("plan")
+        return {"success": True, "stdout": "Plan: 1 to add, 0 to change, 0 to destroy."}
+
+    manager._run_terraform = _fake_run  # type: ignore[method-assign]
+
+    first = manager.plan("vpc_project")
+    assert manager.plan("vpc_project") == {**first, "cached": True}
+    assert len(commands) == 1
+
+    # Applying consumes the saved plan, so the next plan runs terraform again.
+    manager.apply("vpc_project")
+    assert not (project / "tfplan").exists()
+    manager.plan("vpc_project")
+    assert len(commands) == 3
+
+    (project / "terraform.tfstate").write_text('{"serial": 2}')
+    assert "cached" not in manager.plan("vpc_project")
+    assert len(commands) == 4
+
+
+def test_plan_cache_is_scoped_to_caller_and_cleared_by_changes(tmp_path):
+    rbac = MagicMock()
+    rbac.identity = {"Account": "111111111111", "Arn": "arn:aws:iam::111111111111:user/a"}
+    rbac.get_credentials_env.return_value = {}
+    manager = TerraformManager(workspace_dir=str(tmp_path), rbac_manager=rbac)
+    manager.write_project("vpc_project", {"main.tf": 'resource "aws_vpc" "v" {}'})
+    commands = []
+
+    def _fake_run(cmd, cwd):
+        commands.append(cmd)
+        if cmd[1] == "plan":
+            (cwd / "tfplan").write_text("plan")
+        return {"success": True, "stdout": ""}
+
+    manager._run_terraform = _fake_run  # type: ignore[method-assign]
+
+    manager.plan("vpc_project")
+    rbac.identity = {"Account": "222222222222", "Arn": "arn:aws:iam::222222222222:user/b"}
+    assert "cached" not in manager.plan("vpc_project")
+    assert manager.plan("vpc_project")["cached"] is True
+
+    manager.plan_and_apply("vpc_project")
+    (tmp_path / "vpc_project" / "tfplan").write_text("plan")
+    assert "cached" not in manager.plan("vpc_project")
+    assert len(commands) == 4
+
+
+def test_init_enables_workspace_plugin_cache_on_first_use(tmp_path, monkeypatch):
+    monkeypatch.delenv("TF_PLUGIN_CACHE_DIR", raising=False)
+    manager = TerraformManager(workspace_dir=str(tmp_path))
+    cache_dir = tmp_path / ".terraform-plugin-cache"
+    overlays = []
+    manager._run_terraform = lambda _cmd, _cwd, env_overlay=None: overlays.append(env_overlay) or {"success": True}  # type: ignore[method-assign]
+
+    assert not cache_dir.exists()
+    manager.write_project("s3_project", {"main.tf": 'resource "aws_s3_bucket" "b" {}'})
+    manager.init("s3_project")
+
+    assert overlays == [{"TF_PLUGIN_CACHE_DIR": str(cache_dir)}]
+    assert cache_dir.is_dir()
+    assert manager.project_names() == {"s3_project"}
+
+
+def test_init_honors_configured_plugin_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("TF_PLUGIN_CACHE_DIR", str(tmp_path / "user-cache"))
+    manager = TerraformManager(workspace_dir=str(tmp_path / "workspace"))
+    overlays = []
+    manager._run_terraform = lambda _cmd, _cwd, env_overlay=None: overlays.append(env_overlay) or {"success": True}  # type: ignore[method-assign]
+
+    manager.init("s3_project")
+
+    assert overlays == [{}]
+    assert not (tmp_path / "workspace" / ".terraform-plugin-cache").exists()
@@ -0,0 +1,87 @@
+"""Unit tests for compiled tool parameter schema validation."""
+
+import pytest
+
+from mcp_servers.aws_terraform import ToolParameterError, compile_schema
+from mcp_servers.aws_terraform_server import MCPAWSManagerServer
+
+
+@pytest.fixture
+def server():
+    s = MCPAWSManagerServer()
+    s.rbac.identity = {"Arn": "arn:aws:iam::123456789012:user/test"}
+    return s
+
+
+def test_compiled_schema_reports_field_path():
+    validate = compile_schema(
+        {
+            "type": "object",
+            "properties": {
+                "subnet_ids": {"type": "array", "items": {"type": "string"}},
+                "desired_count": {"type": "integer"},
+            },
+        }
+    )
+    validate({"subnet_ids": ["subnet-1"], "desired_count": 2, "desired_count_extra": "ignored"})
+    validate({"subnet_ids": None})
+
+    with pytest.raises(ToolParameterError) as exc:
+        validate({"subnet_ids": ["subnet-1", 7]})
+    assert exc.value.field_path == "subnet_ids[1]"
+
+    with pytest.raises(ToolParameterError) as exc:
+        validate({"desired_count": True})
+    assert exc.value.field_path == "desired_count"
+
+
+def test_execute_tool_rejects_invalid_enum_before_handler(server, monkeypatch):
+    monkeypatch.setattr(server, "_list_aws_resources", lambda params: pytest.fail("handler should not run"))
+
+    result = server.execute_tool("list_aws_resources", {"resource_type": "dynamo"})
+
+    assert result["success"] is False
+    assert result["field_path"] == "resource_type"
+    assert "ec2" in result["suggestion"]
+
+
+def test_execute_tool_leaves_required_fields_to_handlers(server):
+    result = server.execute_tool("create_s3_bucket", {})
+    assert result["success"] is False
+    assert set(result["missing_fields"]) == {"bucket_name", "region"}
+
+
+def test_execute_tool_normalizes_enum_case_before_handler(server, monkeypatch):
+    seen = []
+    monkeypatch.setattr(server, "_get_cost_explorer_summary", lambda params: seen.append(params) or {"success": True})
+    monkeypatch.setattr(server, "_list_aws_resources", lambda params: seen.append(params) or {"success": True})
+
+    assert server.execute_tool("get_cost_explorer_summary", {"granularity": "monthly"})["success"] is True
+    assert server.execute_tool("list_aws_resources", {"resource_type": "EC2"})["success"] is True
+    assert seen == [{"granularity": "MONTHLY"}, {"resource_type": "ec2"}]
+
+
+def test_execute_tool_coerces_integer_strings(server, monkeypatch):
+    seen = []
+    monkeypatch.setattr(server, "_create_ecs_service", lambda params: seen.append(params) or {"success": True})
+
+    params = {"desired_count": "2", "cpu": " 512 "}
+    assert server.execute_tool("create_ecs_service", params)["success"] is True
+    assert seen == [{"desired_count": 2, "cpu": 512}]
+    assert params == {"desired_count": "2", "cpu": " 512 "}
+
+    result = server.execute_tool("create_ecs_service", {"desired_count": "two"})
+    assert result["success"] is False
+    assert result["field_path"] == "desired_count"
+
+
+def test_execute_tool_lets_handlers_answer_mode(server, monkeypatch):
+    monkeypatch.setattr(server.terraform, "init", lambda _project: {"success": True})
+
+    cli = server.execute_tool("create_s3_bucket", {"bucket_name": "b", "region": "us-east-1", "mode": "cli"})
+    assert cli["success"] is False
+    assert "CLI mode is decommissioned" in cli["error"]
+
+    monkeypatch.setattr(server.terraform, "write_project", lambda *_a, **_k: None)
+    mixed = server.execute_tool("create_s3_bucket", {"bucket_name": "b", "region": "us-east-1", "mode": "Terraform"})
+    assert mixed["success"] is True